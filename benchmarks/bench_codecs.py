@@ -0,0 +1,67 @@
+"""Micro benchmarks of `decode_ams_payload` and `encode_ams_payload`."""
+
+from typing import Any, Tuple
+
+from harness import Benchmark, Options, SkipBenchmark, benchmark
+
+from py_ads_client import (
+    ARRAY,
+    DATE_AND_TIME,
+    INT,
+    LREAL,
+    REAL,
+    STRING,
+    STRUCT,
+    UDINT,
+    decode_ams_payload,
+    encode_ams_payload,
+)
+from py_ads_client.types import PLCData
+
+SENSOR = STRUCT([("name", STRING(30)), ("value", REAL), ("updateTime", DATE_AND_TIME)])
+NESTED_STRUCT = STRUCT(
+    [
+        ("id", UDINT),
+        ("position", ARRAY(LREAL, 3)),
+        ("sensors", ARRAY(SENSOR, 10)),
+        ("matrix", ARRAY(ARRAY(INT, 4), 4)),
+    ]
+)
+
+TYPES = {
+    "int": INT,
+    "array_real_10000": ARRAY(REAL, 10000),
+    "array_real_10000_numpy": ARRAY(REAL, 10000, numpy=True),
+    "nested_struct": NESTED_STRUCT,
+}
+
+
+def _setup(key: str) -> Tuple[PLCData, Any, bytes]:
+    plc_t = TYPES[key]
+    if isinstance(plc_t, ARRAY) and plc_t.numpy:
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            raise SkipBenchmark("numpy is not installed") from None
+    # every byte is "A", so strings are full and numbers are valid
+    raw_data = b"A" * plc_t.bytes_length
+    value = decode_ams_payload(raw_data=raw_data, plc_t=plc_t)  # type: ignore
+    return plc_t, value, raw_data
+
+
+def _register(key: str, number: int) -> None:
+    @benchmark(f"codec.decode.{key}")
+    def decode(options: Options) -> Benchmark:
+        plc_t, _, raw_data = _setup(key)
+        return Benchmark(run=lambda: decode_ams_payload(raw_data=raw_data, plc_t=plc_t), number=options.scale(number))  # type: ignore
+
+    @benchmark(f"codec.encode.{key}")
+    def encode(options: Options) -> Benchmark:
+        plc_t, value, _ = _setup(key)
+        return Benchmark(run=lambda: encode_ams_payload(data=value, plc_t=plc_t), number=options.scale(number))  # type: ignore
+
+
+_register("int", 100000)
+_register("array_real_10000", 200)
+_register("array_real_10000_numpy", 20000)
+_register("nested_struct", 5000)
@@ -0,0 +1,111 @@
+"""End-to-end benchmarks of `ADSClient` against an `ADSSimulator` on the loopback interface.
+
+Every call is timed on its own, so the results include latency percentiles.
+The simulator runs in the same process, so its work is part of the measured time.
+"""
+
+from typing import Any, Callable, List, Tuple
+
+from bench_codecs import NESTED_STRUCT
+from harness import Benchmark, Options, benchmark
+
+from py_ads_client import ARRAY, INT, REAL, ADSClient, ADSSimulator, ADSSymbol
+from py_ads_client.ams.ads_read import ADSReadRequest
+from py_ads_client.constants.command_id import ADSCommand
+from py_ads_client.constants.index_group import IndexGroup
+from py_ads_client.types import PLCData
+
+INT_SYMBOL = ADSSymbol(name="GVL.intVar", plc_t=INT)
+ARRAY_SYMBOL = ADSSymbol(name="GVL.realArrVar", plc_t=ARRAY(REAL, 10000))
+STRUCT_SYMBOL = ADSSymbol(name="GVL.structVar", plc_t=NESTED_STRUCT)
+INT_SYMBOLS = [ADSSymbol(name=f"GVL.intArr{i}", plc_t=INT) for i in range(100)]
+
+
+def _connect(symbols: List[ADSSymbol[PLCData]]) -> Tuple[ADSSimulator, ADSClient, Callable[[], None]]:
+    simulator = ADSSimulator(symbols)
+    simulator.start()
+    client = ADSClient(local_ams_net_id="127.0.0.1.1.2")
+    client.open(target_ip="127.0.0.1", target_ams_net_id="127.0.0.1.1.1", target_tcp_port=simulator.port)
+
+    def teardown() -> None:
+        client.close()
+        simulator.stop()
+
+    return simulator, client, teardown
+
+
+def _read_symbol(symbol: ADSSymbol[PLCData], number: int, options: Options) -> Benchmark:
+    _, client, teardown = _connect([symbol])
+    return Benchmark(
+        run=lambda: client.read_symbol(symbol), number=options.scale(number), latencies=True, teardown=teardown
+    )
+
+
+@benchmark("e2e.read_symbol.int")
+def read_int(options: Options) -> Benchmark:
+    return _read_symbol(INT_SYMBOL, 5000, options)
+
+
+@benchmark("e2e.read_symbol.array_real_10000")
+def read_array(options: Options) -> Benchmark:
+    return _read_symbol(ARRAY_SYMBOL, 500, options)
+
+
+@benchmark("e2e.read_symbol.nested_struct")
+def read_struct(options: Options) -> Benchmark:
+    return _read_symbol(STRUCT_SYMBOL, 2000, options)
+
+
+@benchmark("e2e.write_symbol.int")
+def write_int(options: Options) -> Benchmark:
+    _, client, teardown = _connect([INT_SYMBOL])
+    return Benchmark(
+        run=lambda: client.write_symbol(INT_SYMBOL, 123),
+        number=options.scale(5000),
+        latencies=True,
+        teardown=teardown,
+    )
+
+
+@benchmark("e2e.read_symbols.100_ints")
+def read_symbols(options: Options) -> Benchmark:
+    _, client, teardown = _connect(INT_SYMBOLS)
+    return Benchmark(
+        run=lambda: client.read_symbols(INT_SYMBOLS),
+        number=options.scale(1000),
+        latencies=True,
+        teardown=teardown,
+        items_per_run=len(INT_SYMBOLS),
+    )
+
+
+@benchmark("e2e.pipelined_reads.100")
+def pipelined_reads(options: Options) -> Benchmark:
+    """100 reads are in flight on one connection at the same time."""
+    _, client, teardown = _connect([INT_SYMBOL])
+    handle = client.get_handle_by_name(INT_SYMBOL.name)
+    payload = ADSReadRequest(index_group=IndexGroup.SYMVAL_BYHANDLE, index_offset=handle, length=2).to_bytes()
+
+    def run() -> List[Any]:
+        futures = [client.send_async(command=ADSCommand.ADSSRVID_READ, payload=payload) for _ in range(100)]
+        return [future.result(timeout=3) for future in futures]
+
+    return Benchmark(run=run, number=options.scale(500), latencies=True, teardown=teardown, items_per_run=100)
+
+
+@benchmark("e2e.notification_storm.100")
+def notification_storm(options: Options) -> Benchmark:
+    """The value changes 100 times, the time until all on change notifications are decoded and queued."""
+    simulator, client, teardown = _connect([INT_SYMBOL])
+    client.add_device_notification(INT_SYMBOL)
+    client.device_notification_queue.get(timeout=3)  # initial value
+    counter = [0]
+
+    def run() -> None:
+        for _ in range(100):
+            counter[0] = (counter[0] + 1) % 30000
+            simulator.set_value(INT_SYMBOL.name, counter[0])
+        for _ in range(100):
+            client.device_notification_queue.get(timeout=3)
+
+    return Benchmark(run=run, number=options.scale(200), latencies=True, teardown=teardown, items_per_run=100)
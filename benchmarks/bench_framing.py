@@ -0,0 +1,108 @@
+"""Micro benchmarks of the AMS header and the parsing of response and notification bodies."""
+
+import struct
+
+from harness import Benchmark, Options, SkipBenchmark, benchmark
+
+from py_ads_client.ams.ads_device_notification import ADSDeviceNotificationResponse
+from py_ads_client.ams.ads_response import parse_ads_response
+from py_ads_client.ams.ams_header import AMSHeader, AMSHeaderTemplate, unpack_ams_header_fields
+from py_ads_client.constants.command_id import ADSCommand
+from py_ads_client.constants.return_code import ADSErrorCode
+from py_ads_client.constants.state_flag import StateFlag
+
+HEADER = AMSHeader(
+    target_net_id="192.168.88.100.1.1",
+    target_port=851,
+    source_net_id="192.168.88.20.1.1",
+    source_port=30000,
+    command_id=ADSCommand.ADSSRVID_READ,
+    state_flags=StateFlag.AMSCMDSF_ADSCMD,
+    length=12,
+    error_code=ADSErrorCode.ERR_NOERROR,
+    invoke_id=1,
+)
+RAW_HEADER = HEADER.to_bytes()
+
+
+def notification_body(stamps: int, samples_per_stamp: int, sample_size: int) -> bytes:
+    body = b""
+    for stamp in range(stamps):
+        body += struct.pack("< Q I", 133000000000000000 + stamp, samples_per_stamp)
+        for handle in range(samples_per_stamp):
+            body += struct.pack("< I I", handle, sample_size) + bytes(sample_size)
+    return struct.pack("< I I", len(body) + 4, stamps) + body
+
+
+@benchmark("framing.ams_header.to_bytes")
+def header_to_bytes(options: Options) -> Benchmark:
+    return Benchmark(run=HEADER.to_bytes, number=options.scale(100000))
+
+
+@benchmark("framing.ams_header.from_bytes")
+def header_from_bytes(options: Options) -> Benchmark:
+    return Benchmark(run=lambda: AMSHeader.from_bytes(RAW_HEADER), number=options.scale(100000))
+
+
+@benchmark("framing.ams_header_template.pack_frame")
+def pack_frame(options: Options) -> Benchmark:
+    template = AMSHeaderTemplate(
+        target_net_id=HEADER.target_net_id,
+        target_port=HEADER.target_port,
+        source_net_id=HEADER.source_net_id,
+        source_port=HEADER.source_port,
+    )
+    payload = bytes(12)
+    return Benchmark(
+        run=lambda: template.pack_frame(command_id=ADSCommand.ADSSRVID_READ, invoke_id=1, payload=payload),
+        number=options.scale(100000),
+    )
+
+
+@benchmark("framing.unpack_ams_header_fields")
+def unpack_header_fields(options: Options) -> Benchmark:
+    return Benchmark(run=lambda: unpack_ams_header_fields(RAW_HEADER), number=options.scale(100000))
+
+
+@benchmark("framing.parse_ads_response.read_4_bytes")
+def parse_read_response(options: Options) -> Benchmark:
+    body = struct.pack("< I I i", 0, 4, 123)
+    return Benchmark(
+        run=lambda: parse_ads_response(command_id=ADSCommand.ADSSRVID_READ, data=body), number=options.scale(100000)
+    )
+
+
+@benchmark("framing.device_notification.from_bytes.1x1")
+def notification_single(options: Options) -> Benchmark:
+    body = notification_body(stamps=1, samples_per_stamp=1, sample_size=4)
+    return Benchmark(run=lambda: ADSDeviceNotificationResponse.from_bytes(body), number=options.scale(50000))
+
+
+@benchmark("framing.device_notification.from_bytes.10x100")
+def notification_storm(options: Options) -> Benchmark:
+    body = notification_body(stamps=10, samples_per_stamp=100, sample_size=8)
+    return Benchmark(
+        run=lambda: ADSDeviceNotificationResponse.from_bytes(body), number=options.scale(200), items_per_run=1000
+    )
+
+
+@benchmark("framing.device_notification.update_time.10x100")
+def notification_update_times(options: Options) -> Benchmark:
+    response = ADSDeviceNotificationResponse.from_bytes(
+        notification_body(stamps=10, samples_per_stamp=100, sample_size=8)
+    )
+    return Benchmark(
+        run=lambda: [sample.update_time for sample in response.samples], number=options.scale(200), items_per_run=1000
+    )
+
+
+@benchmark("framing.device_notification.timestamps_datetime64.10x100")
+def notification_datetime64(options: Options) -> Benchmark:
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        raise SkipBenchmark("numpy is not installed") from None
+    response = ADSDeviceNotificationResponse.from_bytes(
+        notification_body(stamps=10, samples_per_stamp=100, sample_size=8)
+    )
+    return Benchmark(run=response.timestamps_datetime64, number=options.scale(200), items_per_run=1000)
@@ -0,0 +1,47 @@
+"""Micro benchmarks of `NotificationRecorder` and `NotificationRecording`."""
+
+import shutil
+import tempfile
+
+from harness import Benchmark, Options, benchmark
+
+from py_ads_client import INT, ADSSymbol
+from py_ads_client.ams.ads_device_notification import AdsNotificationSample
+from py_ads_client.notification_recorder import NotificationRecorder, NotificationRecording
+
+SYMBOL = ADSSymbol(name="GVL.intVar", plc_t=INT)
+SAMPLES = [AdsNotificationSample(handle=1, timestamp=133000000000000000 + i, data=bytes(2)) for i in range(1000)]
+
+
+@benchmark("recorder.record.1000")
+def record(options: Options) -> Benchmark:
+    directory = tempfile.mkdtemp()
+    recorder = NotificationRecorder(f"{directory}/recording")
+
+    def run() -> None:
+        for sample in SAMPLES:
+            recorder.record(SYMBOL, sample)
+
+    def teardown() -> None:
+        recorder.close()
+        shutil.rmtree(directory)
+
+    return Benchmark(run=run, number=options.scale(20), items_per_run=len(SAMPLES), teardown=teardown)
+
+
+@benchmark("recorder.read_values.1000")
+def read_values(options: Options) -> Benchmark:
+    directory = tempfile.mkdtemp()
+    with NotificationRecorder(f"{directory}/recording") as recorder:
+        for sample in SAMPLES:
+            recorder.record(SYMBOL, sample)
+    recording = NotificationRecording(f"{directory}/recording")
+    samples = recording.samples(SYMBOL)
+
+    def teardown() -> None:
+        recording.close()
+        shutil.rmtree(directory)
+
+    return Benchmark(
+        run=lambda: list(samples.values()), number=options.scale(20), items_per_run=len(SAMPLES), teardown=teardown
+    )
@@ -0,0 +1,39 @@
+"""Micro benchmarks of `SymbolCatalog` with 100,000 symbols."""
+
+from harness import Benchmark, Options, benchmark
+
+from py_ads_client.ams.ads_symbol_upload import ADSSymbolEntry
+from py_ads_client.constants.ads_data_type import ADSDataType
+from py_ads_client.symbol_catalog import SymbolCatalog
+
+COUNT = 100_000
+UPLOAD = b"".join(
+    ADSSymbolEntry(
+        index_group=0x4040,
+        index_offset=2 * i,
+        size=2,
+        data_type=ADSDataType.ADST_INT16.value,
+        flags=0,
+        name=f"MAIN.aStation{i // 100}.nValue{i % 100}",
+        type_name="INT",
+        comment="",
+    ).to_bytes()
+    for i in range(COUNT)
+)
+
+
+@benchmark("catalog.build.100000")
+def build(options: Options) -> Benchmark:
+    return Benchmark(run=lambda: SymbolCatalog.from_bytes(UPLOAD), number=1, repeat=3, items_per_run=COUNT)
+
+
+@benchmark("catalog.lookup")
+def lookup(options: Options) -> Benchmark:
+    catalog = SymbolCatalog.from_bytes(UPLOAD)
+    return Benchmark(run=lambda: catalog["main.astation500.nvalue50"], number=options.scale(100_000))
+
+
+@benchmark("catalog.glob.100000")
+def glob(options: Options) -> Benchmark:
+    catalog = SymbolCatalog.from_bytes(UPLOAD)
+    return Benchmark(run=lambda: catalog.glob("MAIN.aStation42?.nValue1"), number=options.scale(1000))
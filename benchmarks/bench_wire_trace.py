@@ -0,0 +1,41 @@
+"""Per-packet overhead of the wire trace.
+
+Compares the wire trace of a disabled logger with the formatting which was done for every packet before,
+for a small response and for a 1 MB array read.
+
+    python benchmarks/bench_wire_trace.py
+"""
+
+import logging
+import timeit
+
+from py_ads_client.wire_trace import WireDirection, WireTrace
+
+AMS_HEADER = bytes(32)
+
+
+def eager_format(logger: logging.Logger, header: bytes, body: bytes) -> None:
+    logger.info(f"Received AMS packet: {header.hex(sep=' ')}, {body.hex(sep=' ')}")
+
+
+def wire_trace(trace: WireTrace, header: bytes, body: bytes) -> None:
+    if trace.enabled:
+        trace.trace(WireDirection.RECEIVED, header, body)
+
+
+def main() -> None:
+    logger = logging.getLogger("bench_wire_trace")
+    logger.setLevel(logging.WARNING)
+    trace = WireTrace(logger)
+
+    for name, body in [("8 B", bytes(8)), ("1 MB", bytes(1024 * 1024))]:
+        number = 100000 if len(body) < 1024 else 20
+        eager = min(timeit.repeat(lambda: eager_format(logger, AMS_HEADER, body), number=number, repeat=5)) / number
+        lazy = min(timeit.repeat(lambda: wire_trace(trace, AMS_HEADER, body), number=number, repeat=5)) / number
+        print(
+            f"{name:>5} body, tracing off: eager format {eager * 1e6:10.3f} us/packet, wire trace {lazy * 1e6:.3f} us/packet"
+        )
+
+
+if __name__ == "__main__":
+    main()
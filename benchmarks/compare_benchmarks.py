@@ -0,0 +1,52 @@
+"""Compare two JSON results of `run_benchmarks.py`.
+
+Prints the ratio of the new to the old time of every benchmark, the median time of micro benchmarks
+and the p50 latency of end-to-end benchmarks, and marks changes above the threshold.
+
+    python benchmarks/compare_benchmarks.py old.json new.json --threshold 0.1
+"""
+
+import argparse
+import json
+from typing import Any, Dict
+
+
+def _time(stats: Dict[str, float]) -> float:
+    return stats["p50"] if "p50" in stats else stats["median"]
+
+
+def _load(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        document: Dict[str, Any] = json.load(f)
+    return document
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative change which is reported")
+    args = parser.parse_args()
+
+    old = _load(args.old)
+    new = _load(args.new)
+    print(f"old: {old['version']} ({old['timestamp']}), new: {new['version']} ({new['timestamp']})")
+
+    old_results = {result["name"]: result for result in old["results"]}
+    for result in new["results"]:
+        name = result["name"]
+        if name not in old_results:
+            print(f"{name:<48} new")
+            continue
+        ratio = _time(result["stats"]) / _time(old_results[name]["stats"])
+        if ratio > 1 + args.threshold:
+            mark = "slower"
+        elif ratio < 1 - args.threshold:
+            mark = "faster"
+        else:
+            mark = ""
+        print(f"{name:<48} {ratio:6.2f}x  {mark}")
+
+
+if __name__ == "__main__":
+    main()
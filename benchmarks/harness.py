@@ -0,0 +1,124 @@
+"""Registry, timing and JSON results of the benchmark suite, see `run_benchmarks.py`."""
+
+import gc
+import statistics
+import time
+import timeit
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, List, Optional
+
+Setup = Callable[["Options"], "Benchmark"]
+
+
+@dataclass()
+class Options:
+    quick: bool = False
+    """Fewer iterations, to check that the benchmarks run rather than to measure."""
+
+    def scale(self, number: int) -> int:
+        return max(1, number // 20) if self.quick else number
+
+
+@dataclass()
+class Benchmark:
+    """A timed operation, returned by a registered setup function.
+
+    A micro benchmark times `number` calls of `run` `repeat` times with `timeit`.
+    An end-to-end benchmark (`latencies=True`) times every call of `run` on its own,
+    so latency percentiles can be reported, and calls `teardown` at the end.
+    """
+
+    run: Callable[[], object]
+    number: int
+    repeat: int = 5
+    latencies: bool = False
+    teardown: Optional[Callable[[], None]] = None
+    items_per_run: int = 1
+    """Number of items, such as notifications, one call of `run` handles, for the throughput."""
+
+
+@dataclass()
+class Result:
+    name: str
+    group: str
+    unit: str
+    stats: Dict[str, float] = field(default_factory=dict)
+
+
+class SkipBenchmark(Exception):
+    """Raised by a setup function if the benchmark cannot run, e.g. without an optional dependency."""
+
+
+REGISTRY: Dict[str, Setup] = {}
+
+
+def benchmark(name: str) -> Callable[[Setup], Setup]:
+    def register(setup: Setup) -> Setup:
+        assert name not in REGISTRY, f"Duplicate benchmark: {name}"
+        REGISTRY[name] = setup
+        return setup
+
+    return register
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def measure(name: str, setup: Setup, options: Options) -> Result:
+    bench = setup(options)
+    group = name.split(".", 1)[0]
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        if not bench.latencies:
+            bench.run()  # warm up caches such as compiled codec plans
+            times = [t / bench.number for t in timeit.repeat(bench.run, number=bench.number, repeat=bench.repeat)]
+            best = min(times)
+            return Result(
+                name=name,
+                group=group,
+                unit="s",
+                stats={
+                    "min": best,
+                    "median": statistics.median(times),
+                    "ops_per_s": bench.items_per_run / best,
+                    "number": bench.number,
+                    "repeat": bench.repeat,
+                },
+            )
+
+        bench.run()
+        latencies: List[float] = []
+        start = time.perf_counter()
+        for _ in range(bench.number):
+            t0 = time.perf_counter()
+            bench.run()
+            latencies.append(time.perf_counter() - t0)
+        elapsed = time.perf_counter() - start
+        latencies.sort()
+        return Result(
+            name=name,
+            group=group,
+            unit="s",
+            stats={
+                "mean": statistics.fmean(latencies),
+                "p50": _percentile(latencies, 0.50),
+                "p90": _percentile(latencies, 0.90),
+                "p99": _percentile(latencies, 0.99),
+                "max": latencies[-1],
+                "ops_per_s": bench.number * bench.items_per_run / elapsed,
+                "number": bench.number,
+            },
+        )
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+        if bench.teardown is not None:
+            bench.teardown()
+
+
+def result_to_dict(result: Result) -> Dict[str, object]:
+    return asdict(result)
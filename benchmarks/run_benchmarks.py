@@ -0,0 +1,82 @@
+"""Benchmark suite of the client hot paths.
+
+Micro benchmarks of the codecs and the framing, and end-to-end benchmarks against an `ADSSimulator`
+on the loopback interface. The results are printed and saved as JSON, so runs of different versions
+can be compared with `compare_benchmarks.py`.
+
+    python benchmarks/run_benchmarks.py --output results.json
+    python benchmarks/run_benchmarks.py --filter codec. --quick
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from typing import Dict, List
+
+import bench_codecs  # noqa: F401
+import bench_end_to_end  # noqa: F401
+import bench_framing  # noqa: F401
+import bench_recorder  # noqa: F401
+import bench_symbol_catalog  # noqa: F401
+from harness import REGISTRY, Options, Result, SkipBenchmark, measure, result_to_dict
+
+import py_ads_client
+
+
+def _format_seconds(value: float) -> str:
+    if value < 1e-3:
+        return f"{value * 1e6:9.2f} us"
+    return f"{value * 1e3:9.2f} ms"
+
+
+def _print_result(result: Result) -> None:
+    stats = result.stats
+    if "p50" in stats:
+        timing = f"p50 {_format_seconds(stats['p50'])}  p99 {_format_seconds(stats['p99'])}"
+    else:
+        timing = f"min {_format_seconds(stats['min'])}  median {_format_seconds(stats['median'])}"
+    print(f"{result.name:<48} {timing}  {stats['ops_per_s']:14,.0f} ops/s", flush=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", help="path of the JSON results")
+    parser.add_argument("--filter", action="append", default=[], help="run benchmarks whose name contains this")
+    parser.add_argument("--quick", action="store_true", help="run fewer iterations")
+    args = parser.parse_args()
+
+    options = Options(quick=args.quick)
+    names = [name for name in REGISTRY if not args.filter or any(f in name for f in args.filter)]
+
+    results: List[Result] = []
+    skipped: Dict[str, str] = {}
+    for name in names:
+        try:
+            result = measure(name, REGISTRY[name], options)
+        except SkipBenchmark as e:
+            skipped[name] = str(e)
+            print(f"{name:<48} skipped: {e}", flush=True)
+            continue
+        results.append(result)
+        _print_result(result)
+
+    if args.output:
+        document = {
+            "version": py_ads_client.__version__,
+            "python": sys.version,
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "quick": args.quick,
+            "results": [result_to_dict(result) for result in results],
+            "skipped": skipped,
+        }
+        with open(args.output, "w") as f:
+            json.dump(document, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+from py_ads_client import BOOL, INT, REAL, ADSClient, ADSErrorCode, ADSSymbol
+
+plc_ip = "192.168.88.20"
+plc_ams_net_id = "192.168.88.20.1.1"
+local_ams_net_id = "192.168.88.100.1.1"
+
+client = ADSClient(local_ams_net_id=local_ams_net_id)
+client.open(target_ams_net_id=plc_ams_net_id, target_ip=plc_ip)
+
+bool_symbol = ADSSymbol(name="GVL.boolVar", plc_t=BOOL)
+int_symbol = ADSSymbol(name="GVL.intVar", plc_t=INT)
+real_symbol = ADSSymbol(name="GVL.realVar", plc_t=REAL)
+
+results = client.write_symbols({bool_symbol: True, int_symbol: 123, real_symbol: 100.23})
+assert all(result == ADSErrorCode.ERR_NOERROR for result in results.values())
+
+bool_value, int_value, real_value = client.read_symbols([bool_symbol, int_symbol, real_symbol])
+assert bool_value is True
+assert int_value == 123
+assert round(real_value, 2) == 100.23
+
+client.close()
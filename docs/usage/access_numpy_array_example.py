@@ -0,0 +1,21 @@
+import numpy as np
+
+from py_ads_client import ARRAY, INT, REAL, ADSClient, ADSSymbol
+
+plc_ip = "192.168.88.20"
+plc_ams_net_id = "192.168.88.20.1.1"
+local_ams_net_id = "192.168.88.100.1.1"
+
+client = ADSClient(local_ams_net_id=local_ams_net_id)
+client.open(target_ams_net_id=plc_ams_net_id, target_ip=plc_ip)
+
+symbol = ADSSymbol(name="GVL.realArrVar", plc_t=ARRAY(REAL, 100000, numpy=True))
+samples = client.read_symbol(symbol)
+assert samples.shape == (100000,)
+client.write_symbol(symbol=symbol, value=np.zeros(100000, dtype=np.float32))
+
+symbol_2d = ADSSymbol(name="GVL.int2dArrVar", plc_t=ARRAY(ARRAY(INT, 2), 5, numpy=True))
+client.write_symbol(symbol=symbol_2d, value=np.arange(10).reshape(5, 2))
+assert client.read_symbol(symbol_2d).tolist() == [[0, 1], [2, 3], [4, 5], [6, 7], [8, 9]]
+
+client.close()
@@ -0,0 +1,31 @@
+import asyncio
+
+from py_ads_client import INT, ADSSymbol, AsyncADSClient
+
+plc_ip = "192.168.88.20"
+plc_ams_net_id = "192.168.88.20.1.1"
+local_ams_net_id = "192.168.88.100.1.1"
+
+
+async def main() -> None:
+    client = AsyncADSClient(local_ams_net_id=local_ams_net_id)
+    await client.open(target_ams_net_id=plc_ams_net_id, target_ip=plc_ip)
+
+    int_symbol = ADSSymbol(name="GVL.intVar", plc_t=INT)
+    await client.write_symbol(symbol=int_symbol, value=123)
+
+    values = await asyncio.gather(*(client.read_symbol(int_symbol) for _ in range(10)))
+    assert values == [123] * 10
+
+    await client.add_device_notification(symbol=int_symbol)
+    await client.write_symbol(symbol=int_symbol, value=456)
+
+    async for symbol, notification, value in client.notifications():
+        print(f"device notification, name: {symbol.name}, value: {value}, update_time: {notification.update_time}")
+        if value == 456:
+            break
+
+    await client.close()
+
+
+asyncio.run(main())
@@ -0,0 +1,30 @@
+import time
+
+from py_ads_client import INT, ADSClient, ADSSymbol, BoundedBuffer, LatestValueBuffer, OverflowPolicy
+
+plc_ip = "192.168.88.20"
+plc_ams_net_id = "192.168.88.20.1.1"
+local_ams_net_id = "192.168.88.100.1.1"
+
+client = ADSClient(local_ams_net_id=local_ams_net_id)
+client.open(target_ams_net_id=plc_ams_net_id, target_ip=plc_ip)
+
+int_symbol = ADSSymbol(name="GVL.intVar", plc_t=INT)
+
+# keep only the latest value
+latest = LatestValueBuffer()
+client.add_device_notification(symbol=int_symbol, buffer=latest)
+
+# keep the last 100 values
+history = BoundedBuffer(maxsize=100, overflow=OverflowPolicy.DROP_OLDEST)
+client.add_device_notification(symbol=int_symbol, buffer=history)
+
+for value in range(1000):
+    client.write_symbol(symbol=int_symbol, value=value)
+time.sleep(0.5)
+
+symbol, notification, data = latest.get(timeout=1)
+print(f"latest value: {data}, dropped: {latest.dropped}")
+print(f"history: {history.qsize()} values, dropped: {history.dropped}")
+
+client.close()
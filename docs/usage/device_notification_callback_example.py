@@ -0,0 +1,31 @@
+import time
+from typing import Any
+
+from py_ads_client import INT, ADSClient, ADSSymbol, ThreadPoolDispatcher
+from py_ads_client.ams.ads_device_notification import AdsNotificationSample
+from py_ads_client.types import PLCData
+
+plc_ip = "192.168.88.20"
+plc_ams_net_id = "192.168.88.20.1.1"
+local_ams_net_id = "192.168.88.100.1.1"
+
+# the callbacks run on 4 threads, the notifications of one symbol are always delivered in order
+client = ADSClient(local_ams_net_id=local_ams_net_id, notification_dispatcher=ThreadPoolDispatcher(max_workers=4))
+client.open(target_ams_net_id=plc_ams_net_id, target_ip=plc_ip)
+
+int_symbol = ADSSymbol(name="GVL.intVar", plc_t=INT)
+
+
+def on_change(symbol: ADSSymbol[PLCData], notification: AdsNotificationSample, data: Any) -> None:
+    print(f"device notification, name: {symbol.name}, value: {data}, update_time: {notification.update_time}")
+
+
+client.write_symbol(symbol=int_symbol, value=000)
+client.add_device_notification(symbol=int_symbol, callback=on_change)
+
+client.write_symbol(symbol=int_symbol, value=111)
+time.sleep(0.1)
+client.write_symbol(symbol=int_symbol, value=222)
+time.sleep(0.5)
+
+client.close()
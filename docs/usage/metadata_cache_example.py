@@ -0,0 +1,18 @@
+from py_ads_client import ADSClient, MetadataCache
+
+plc_ip = "192.168.88.20"
+plc_ams_net_id = "192.168.88.20.1.1"
+local_ams_net_id = "192.168.88.100.1.1"
+
+with MetadataCache("plc_metadata.sqlite") as cache:
+    client = ADSClient(local_ams_net_id=local_ams_net_id, metadata_cache=cache)
+    client.open(target_ams_net_id=plc_ams_net_id, target_ip=plc_ip)
+
+    # read from the PLC on the first start, loaded from the file while the PLC program is unchanged
+    catalog = client.upload_symbols()
+    client.upload_data_types()
+
+    info = catalog["MAIN.stMotor"]
+    print(info.name, client.get_plc_type(info.type_name).bytes_length)
+
+    client.close()
@@ -0,0 +1,25 @@
+from py_ads_client import INT, ADSClient, ADSCommand, ADSSymbol, ClientMetrics, MetricsSnapshot
+
+plc_ip = "192.168.88.20"
+plc_ams_net_id = "192.168.88.20.1.1"
+local_ams_net_id = "192.168.88.100.1.1"
+
+
+def export(snapshot: MetricsSnapshot) -> None:
+    for command, stats in snapshot.commands.items():
+        print(f"{command.name}: {stats.requests} requests, p99 {stats.latency.p99_s * 1000:.2f} ms")
+
+
+metrics = ClientMetrics(exporter=export, export_interval_s=60)
+client = ADSClient(local_ams_net_id=local_ams_net_id, metrics=metrics)
+client.open(target_ams_net_id=plc_ams_net_id, target_ip=plc_ip)
+
+symbol = ADSSymbol(name="GVL.intVar", plc_t=INT)
+for _ in range(1000):
+    client.read_symbol(symbol)
+
+read_stats = client.stats().commands[ADSCommand.ADSSRVID_READ]
+print(read_stats.latency.p50_s, read_stats.decode.p50_s, read_stats.timeouts)
+
+client.close()
+metrics.close()
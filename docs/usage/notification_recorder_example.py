@@ -0,0 +1,25 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+from py_ads_client import INT, ADSClient, ADSSymbol, NotificationRecorder, NotificationRecording
+
+plc_ip = "192.168.88.20"
+plc_ams_net_id = "192.168.88.20.1.1"
+local_ams_net_id = "192.168.88.100.1.1"
+
+client = ADSClient(local_ams_net_id=local_ams_net_id, lazy_decode=True)
+client.open(target_ams_net_id=plc_ams_net_id, target_ip=plc_ip)
+
+int_symbol = ADSSymbol(name="GVL.intVar", plc_t=INT)
+
+with NotificationRecorder("recording") as recorder:
+    client.add_device_notification(symbol=int_symbol, callback=recorder)
+    time.sleep(10)
+    client.close()
+
+with NotificationRecording("recording") as recording:
+    start = datetime.now(tz=timezone.utc) - timedelta(seconds=5)
+    samples = recording.samples(int_symbol, start=start)
+    print(f"{len(samples)} samples in the last 5 seconds")
+    for filetime, value in samples:
+        print(filetime, value)
@@ -0,0 +1,21 @@
+from py_ads_client import ADSClient, ADSSymbol
+
+plc_ip = "192.168.88.20"
+plc_ams_net_id = "192.168.88.20.1.1"
+local_ams_net_id = "192.168.88.100.1.1"
+
+client = ADSClient(local_ams_net_id=local_ams_net_id)
+client.open(target_ams_net_id=plc_ams_net_id, target_ip=plc_ip)
+
+catalog = client.upload_symbols()
+client.upload_data_types()  # optional, reads all data types with one request
+
+info = catalog["MAIN.stMotor"]
+motor_symbol = ADSSymbol(name=info.name, plc_t=client.get_plc_type(info.type_name))
+print(client.read_symbol(motor_symbol))
+
+# read a single member, its type is built from the type of the member
+speed_symbol = ADSSymbol(name="MAIN.stMotor.fSpeed", plc_t=client.get_plc_type("LREAL"))
+print(client.read_symbol(speed_symbol))
+
+client.close()
@@ -0,0 +1,18 @@
+from py_ads_client import INT, ADSClient, ADSError, ADSErrorCode, ADSSimulator, ADSSymbol
+
+symbol = ADSSymbol(name="GVL.intVar", plc_t=INT)
+
+with ADSSimulator([symbol], latency_s=0.001, jitter_s=0.0005, seed=0) as simulator:
+    simulator.set_value("GVL.intVar", 123)
+
+    client = ADSClient(local_ams_net_id="127.0.0.1.1.2")
+    client.open(target_ip="127.0.0.1", target_ams_net_id="127.0.0.1.1.1", target_tcp_port=simulator.port)
+    assert client.read_symbol(symbol) == 123
+
+    simulator.inject_error(ADSErrorCode.ADSERR_DEVICE_BUSY)
+    try:
+        client.read_symbol(symbol)
+    except ADSError as e:
+        assert e.error_code == ADSErrorCode.ADSERR_DEVICE_BUSY
+
+    client.close()
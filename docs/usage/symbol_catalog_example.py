@@ -0,0 +1,19 @@
+from py_ads_client import ADSClient
+
+plc_ip = "192.168.88.20"
+plc_ams_net_id = "192.168.88.20.1.1"
+local_ams_net_id = "192.168.88.100.1.1"
+
+client = ADSClient(local_ams_net_id=local_ams_net_id)
+client.open(target_ams_net_id=plc_ams_net_id, target_ip=plc_ip)
+
+catalog = client.upload_symbols()
+print(f"{len(catalog)} symbols")
+
+info = catalog["GVL.intVar"]
+print(info.type_name, info.size, hex(info.index_group), hex(info.index_offset))
+
+for info in catalog.glob("MAIN.fbMotor*.nSpeed"):
+    print(info.name, info.type_name)
+
+client.close()
@@ -1,11 +1,35 @@
 from .ads_client import ADSClient  # noqa: F401
+from .ads_simulator import ADSSimulator  # noqa: F401
 from .ads_symbol import ADSSymbol  # noqa: F401
 from .ams.ads_read_write import ADSReadWriteRequest, ADSReadWriteResponse  # noqa: F401
+from .async_ads_client import AsyncADSClient  # noqa: F401
 from .constants.ads_state import ADSState  # noqa: F401
 from .constants.command_id import ADSCommand  # noqa: F401
 from .constants.index_group import IndexGroup  # noqa: F401
+from .constants.return_code import ADSErrorCode  # noqa: F401
+from .exceptions import ADSError  # noqa: F401
 from .helpers.decode_ams_payload import decode_ams_payload  # noqa: F401
 from .helpers.encode_ams_payload import encode_ams_payload  # noqa: F401
+from .lazy_value import LazyValue  # noqa: F401
+from .metadata_cache import MetadataCache  # noqa: F401
+from .metrics import ClientMetrics, MetricsSnapshot  # noqa: F401
+from .notification_buffer import (  # noqa: F401
+    BoundedBuffer,
+    DeviceNotification,
+    LatestValueBuffer,
+    NotificationBuffer,
+    OverflowPolicy,
+)
+from .notification_dispatcher import (  # noqa: F401
+    InlineDispatcher,
+    NotificationCallback,
+    NotificationDispatcher,
+    ThreadDispatcher,
+    ThreadPoolDispatcher,
+)
+from .notification_recorder import NotificationRecorder, NotificationRecording, RecordedSamples  # noqa: F401
+from .plc_type_resolver import PLCTypeResolver  # noqa: F401
+from .symbol_catalog import SymbolCatalog, SymbolInfo  # noqa: F401
 from .types import (  # noqa: F401
     ARRAY,
     BOOL,
@@ -33,3 +57,4 @@ from .types import (  # noqa: F401
     WSTRING,
 )
 from .version import __version__  # noqa: F401
+from .wire_trace import WireDirection, WireTrace, WireTraceRecord, read_wire_trace  # noqa: F401
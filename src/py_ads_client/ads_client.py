@@ -1,32 +1,63 @@
+import functools
 import queue
 import socket
 import threading
-import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import date, datetime
 from datetime import time as datetime_time
 from datetime import timedelta
-from logging import Logger, getLogger
-from typing import Any, Dict, List, Optional, Tuple, Union, overload
+from logging import INFO, Logger, getLogger
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union, cast, overload
 
 from .ads_symbol import ADSSymbol
 from .ams.ads_add_device_notification import ADSAddDeviceNotificationRequest, ADSAddDeviceNotificationResponse
+from .ams.ads_data_type_upload import ADSDataTypeEntry, parse_data_type_entries
 from .ams.ads_delete_device_notification import ADSDeleteDeviceNotificationRequest, ADSDeleteDeviceNotificationResponse
 from .ams.ads_device_notification import ADSDeviceNotificationResponse, AdsNotificationSample
 from .ams.ads_read import ADSReadRequest, ADSReadResponse
 from .ams.ads_read_device_info import ADSReadDeviceInfoResponse
 from .ams.ads_read_state import ADSReadStateResponse
 from .ams.ads_read_write import ADSReadWriteRequest, ADSReadWriteResponse
+from .ams.ads_response import ADSResponse, parse_ads_response
+from .ams.ads_sum_add_device_notification import ADSSumAddDeviceNotificationRequest, ADSSumAddDeviceNotificationResponse
+from .ams.ads_sum_delete_device_notification import (
+    ADSSumDeleteDeviceNotificationRequest,
+    ADSSumDeleteDeviceNotificationResponse,
+)
+from .ams.ads_symbol_upload import ADSSymbolUploadInfo
 from .ams.ads_write import ADSWriteRequest, ADSWriteResponse
 from .ams.ads_write_control import ADSWriteControlRequest, ADSWriteControlResponse
-from .ams.ams_header import AMSHeader
+from .ams.ams_header import AMS_HEADER_STRUCT, AMS_TCP_HEADER_LENGTH, AMSHeaderTemplate, unpack_ams_header_fields
 from .constants.ads_state import ADSState
 from .constants.command_id import ADSCommand
 from .constants.index_group import IndexGroup
 from .constants.return_code import ADSErrorCode
-from .constants.state_flag import StateFlag
 from .constants.transmission_mode import TransmissionMode
+from .exceptions import ADSError, is_stale_handle_error
+from .helpers.check_value_type import check_value_type
 from .helpers.decode_ams_payload import decode_ams_payload
 from .helpers.encode_ams_payload import encode_ams_payload
+from .helpers.split_sum_command import MAX_SUM_COMMAND_BYTES, MAX_SUM_COMMAND_ITEMS, split_sum_command
+from .helpers.sum_requests import (
+    decode_read_results,
+    get_handle_requests,
+    get_handle_results,
+    read_symbol_requests,
+    release_handle_requests,
+    write_results,
+    write_symbol_requests,
+)
+from .helpers.symbol_address import handle_names
+from .lazy_value import DecodeOnGet, LazyValue
+from .metadata_cache import DATA_TYPES, SYMBOLS, MetadataCache
+from .metrics import ClientMetrics, MetricsSnapshot
+from .notification_buffer import NotificationBuffer
+from .notification_dispatcher import InlineDispatcher, NotificationCallback, NotificationDispatcher
+from .plc_type_resolver import PLCTypeResolver
+from .symbol_catalog import SymbolCatalog
 from .types import (
     ARRAY,
     STRING,
@@ -41,23 +72,58 @@ from .types import (
     _PLCTimeDeltaType,
     _PLCTimeOfDayType,
 )
+from .wire_trace import WireDirection, WireTrace
+
+# variable name in lower case, as ADS names are case-insensitive, data length, transmission mode,
+# max delay and cycle time
+_NotificationKey = Tuple[str, int, TransmissionMode, int, int]
+
+
+def _notification_key(
+    symbol: ADSSymbol[PLCData], transmission_mode: TransmissionMode, max_delay_ms: int, cycle_time_ms: int
+) -> _NotificationKey:
+    return symbol.name.lower(), symbol.plc_t.bytes_length, transmission_mode, max_delay_ms, cycle_time_ms
+
+
+@dataclass()
+class _NotificationSubscriber:
+    symbol: ADSSymbol[PLCData]
+    callback: Optional[NotificationCallback]
+    buffer: Optional[NotificationBuffer]
+
+    def matches(self, callback: Optional[NotificationCallback], buffer: Optional[NotificationBuffer]) -> bool:
+        return self.callback is callback and self.buffer is buffer
+
+
+@dataclass()
+class _NotificationSubscription:
+    """A notification on the server, which is shared by the subscribers with the same key."""
 
-ADSResponse = Union[
-    ADSReadResponse,
-    ADSReadDeviceInfoResponse,
-    ADSReadWriteResponse,
-    ADSWriteResponse,
-    ADSAddDeviceNotificationResponse,
-    ADSDeleteDeviceNotificationResponse,
-    ADSReadStateResponse,
-    ADSWriteControlResponse,
-]
+    key: _NotificationKey
+    handle: int
+    subscribers: List[_NotificationSubscriber]
+    last_sample: Optional[AdsNotificationSample] = None
+    delivery_lock: threading.Lock = field(default_factory=threading.Lock)
+    """Held while a sample is delivered, so a new subscriber gets the last sample before the next one."""
 
 
 class ADSClient:
 
     def __init__(
-        self, local_ams_net_id: str, local_ams_port: int = 8000, timeout_s: float = 3, logger: Optional[Logger] = None
+        self,
+        local_ams_net_id: str,
+        local_ams_port: int = 8000,
+        timeout_s: float = 3,
+        logger: Optional[Logger] = None,
+        max_sum_command_items: int = MAX_SUM_COMMAND_ITEMS,
+        max_sum_command_bytes: int = MAX_SUM_COMMAND_BYTES,
+        wire_trace: Optional[WireTrace] = None,
+        receive_buffer_size: int = 64 * 1024,
+        metrics: Optional[ClientMetrics] = None,
+        notification_dispatcher: Optional[NotificationDispatcher] = None,
+        lazy_decode: bool = False,
+        metadata_cache: Optional[MetadataCache] = None,
+        track_online_changes: bool = False,
     ) -> None:
         self.__local_ams_net_id = local_ams_net_id
         self.__local_ams_port = local_ams_port
@@ -65,23 +131,60 @@ class ADSClient:
             logger = getLogger(name=self.__class__.__name__)
 
         self.__logger = logger
+        if wire_trace is None:
+            wire_trace = WireTrace(logger)
+        self.__wire_trace = wire_trace
         self.__timeout = timeout_s
+        self.__max_sum_command_items = max_sum_command_items
+        self.__max_sum_command_bytes = max_sum_command_bytes
+        self.__receive_buffer_size = receive_buffer_size
         self.__socket: Optional[socket.socket] = None
 
         self._current_invoke_id = 0
         self.__invoke_id_lock = threading.Lock()
 
-        self._responses: Dict[int, Union[ADSErrorCode, ADSResponse]] = {}  # key is invoke_id
-        self.__response_condition = threading.Condition()
+        self._pending_requests: Dict[int, Future[ADSResponse]] = {}  # key is invoke_id
+        self.__pending_requests_lock = threading.Lock()
+        self.__send_lock = threading.Lock()
 
         self.__variable_handles: Dict[str, int] = {}  # key is variable name, value is handle
         self.__variable_handles_lock = threading.Lock()
 
+        self.__plc_types = PLCTypeResolver(fetch=self.read_data_type_entry)
+        # the symbol and data type uploads are loaded from the cache while the symbol version is unchanged
+        self.__metadata_cache = metadata_cache
+        self.__target = ""  # AMS net id and port, the key of the target in the metadata cache
+
         self.device_notification_queue: queue.SimpleQueue[Tuple[ADSSymbol[PLCData], AdsNotificationSample, Any]] = (
             queue.SimpleQueue()
         )
-        self.__device_notification_handles: Dict[int, ADSSymbol[PLCData]] = {}  # key is handle
+        self.__device_notifications: Dict[int, _NotificationSubscription] = {}  # key is handle
+        self.__device_notification_handles: Dict[_NotificationKey, int] = {}
         self.__device_notification_handles_lock = threading.Lock()
+        self.__device_notification_add_lock = threading.Lock()
+        # handles of notifications which were added again after an online change, key is the old handle
+        self.__device_notification_aliases: Dict[int, int] = {}
+        # with `track_online_changes` the symbol version and the ADS state are watched by notifications,
+        # key is the handle of the notification, value is the function which handles its data
+        self.__track_online_changes = track_online_changes
+        self.__online_change_watchers: Dict[int, Callable[[bytes], None]] = {}
+        self.__symbol_version: Optional[int] = None
+        self.__ads_state: Optional[int] = None
+        # samples of unknown handles, which are received while a notification is added
+        self.__early_device_notifications: Optional[Dict[int, List[AdsNotificationSample]]] = None
+        if notification_dispatcher is None:
+            notification_dispatcher = InlineDispatcher(logger)
+        self.__notification_dispatcher = notification_dispatcher
+        # the values of the device notifications are `LazyValue`s which the consumer decodes
+        # instead of the socket reader thread
+        self.__lazy_decode = lazy_decode
+
+        self.__metrics = metrics
+        self.__thread_local = threading.local()  # time the last response of the thread was received, for metrics
+        self.__on_notification_decoded: Optional[Callable[[int], None]] = None
+        if metrics is not None:
+            metrics.set_queue_depth(self.device_notification_queue.qsize)
+            self.__on_notification_decoded = lambda decode_ns: metrics.on_notification_decoded(decode_ns=decode_ns)
 
     def get_invoke_id(self) -> int:
         max_invoke_id = 0xFFFFFFFF
@@ -93,134 +196,386 @@ class ADSClient:
 
     def close(self) -> None:
         with self.__device_notification_handles_lock:
-            device_notification_handles = set(self.__device_notification_handles.keys())
-        for handle in device_notification_handles:
-            self.del_device_notification_by_handle(handle=handle)
+            device_notification_handles = list(self.__device_notifications.keys())
+            device_notification_handles.extend(self.__online_change_watchers)
+            self.__device_notifications.clear()
+            self.__device_notification_handles.clear()
+            self.__device_notification_aliases.clear()
+            self.__online_change_watchers.clear()
+        if device_notification_handles:
+            self._delete_device_notifications(device_notification_handles)
+
+        with self.__variable_handles_lock:
+            variable_handles = list(set(self.__variable_handles.values()))
+            self.__variable_handles.clear()
+        if variable_handles:
+            self.release_handles(handles=variable_handles)
 
-        variable_handles = set(self.__variable_handles.values())
-        for handle in variable_handles:
-            self.release_handle(handle=handle)
-        self.__variable_handles.clear()
+        self.__notification_dispatcher.close()
 
         if self.__socket is not None:
             self.__socket.close()
             self.__socket = None
 
     def _read_socket_background(self, socket: socket.socket) -> None:
-        buffer: bytes = b""
+        """Receive AMS/TCP frames into a preallocated buffer and hand every AMS packet to the handler.
+
+        Data is received directly into the buffer with `recv_into` and frames are parsed via `memoryview` slices,
+        so received bytes are neither concatenated nor sliced into new objects. Only the incomplete frame at the
+        end of the buffer is moved to the front when the buffer is full, the buffer grows if a frame does not fit.
+        """
+        TCP_HEADER_LENGTH = 6
+        buffer = bytearray(max(self.__receive_buffer_size, TCP_HEADER_LENGTH))
+        view = memoryview(buffer)
+        start = 0  # begin of the first unhandled frame
+        end = 0  # end of the received data
+        frame_length = TCP_HEADER_LENGTH  # number of bytes needed for the next step
         while True:
+            if start + frame_length > len(buffer):
+                # move the incomplete frame to the front, and grow the buffer if the frame is larger than the buffer
+                received = view[start:end].tobytes()
+                if frame_length > len(buffer):
+                    view.release()
+                    buffer = bytearray(max(frame_length, 2 * len(buffer)))
+                    view = memoryview(buffer)
+                view[: len(received)] = received
+                start, end = 0, len(received)
+
             try:
-                data = socket.recv(4096)
+                received_length = socket.recv_into(view[end:])
             except Exception:
                 # tested on macOS 13.6.6, python 3.11,
                 # the behavior is inconsistent compare to Linux, it throws an exception when the socket is closed
                 # <class 'OSError'> [Errno 9] Bad file descriptor
                 break
-            # A returned empty bytes object indicates that the client has disconnected.
-            if len(data) == 0:
+            # A returned length of zero indicates that the client has disconnected.
+            if received_length == 0:
                 self.__logger.info("connection disconnected")
                 break
-
-            buffer += data
-            while True:
-                TCP_HEADER_LENGTH = 6
-                if len(buffer) < TCP_HEADER_LENGTH:
+            end += received_length
+
+            while end - start >= TCP_HEADER_LENGTH:
+                if view[start] != 0 or view[start + 1] != 0:
+                    self.__logger.warning(f"Received invalid TCP header: {view[start : start + 2].hex()}")
+                length = int.from_bytes(view[start + 2 : start + TCP_HEADER_LENGTH], byteorder="little", signed=False)
+                frame_length = TCP_HEADER_LENGTH + length
+                if end - start < frame_length:
                     break
-                if buffer[:2] != b"\x00\x00":
-                    self.__logger.warning(f"Received invalid TCP header: {buffer[:2].hex()}")
-                length = int.from_bytes(buffer[2:TCP_HEADER_LENGTH], byteorder="little", signed=False)
-                if len(buffer) < length + TCP_HEADER_LENGTH:
-                    break
-                packet = buffer[TCP_HEADER_LENGTH : length + TCP_HEADER_LENGTH]
-                buffer = buffer[length + TCP_HEADER_LENGTH :]
+                packet = view[start + TCP_HEADER_LENGTH : start + frame_length]
+                start += frame_length
+                frame_length = TCP_HEADER_LENGTH
                 try:
                     self._handle_ams_raw_packet(packet=packet)
                 except Exception as e:
                     self.__logger.error(f"Error while handling AMS packet: {e}")
+                finally:
+                    packet.release()
+            else:
+                frame_length = TCP_HEADER_LENGTH
 
-    def _handle_ams_raw_packet(self, packet: bytes) -> None:
-        AMS_HEADER_LENGTH = 32
-        ams_header = packet[:AMS_HEADER_LENGTH]
-        ads_body = packet[AMS_HEADER_LENGTH:]
-        header_str = ams_header.hex(sep=" ")
-        ads_body_str = ads_body.hex(sep=" ")
-        self.__logger.info(f"Received AMS packet: {header_str}, {ads_body_str}")
+            if start == end:
+                start = end = 0
 
-        header = AMSHeader.from_bytes(ams_header)
+    def _handle_ams_raw_packet(self, packet: Union[bytes, memoryview]) -> None:
+        """Handle one AMS packet.
 
-        if header.error_code != ADSErrorCode.ERR_NOERROR:
-            with self.__response_condition:
-                self._responses[header.invoke_id] = header.error_code
-                self.__response_condition.notify_all()
+        `packet` may be a view into the receive buffer which is only valid during this call,
+        the ADS body is copied once, because the parsed responses keep references to it.
+        """
+        AMS_HEADER_LENGTH = 32
+        ams_header = packet[:AMS_HEADER_LENGTH]
+        ads_body = bytes(packet[AMS_HEADER_LENGTH:])
+        if self.__wire_trace.enabled:
+            self.__wire_trace.trace(WireDirection.RECEIVED, ams_header, ads_body)
+
+        command_id, _, error_code, invoke_id = unpack_ams_header_fields(ams_header)
+        metrics = self.__metrics
+
+        if error_code != 0:  # ERR_NOERROR
+            if metrics is not None:
+                metrics.on_response(
+                    invoke_id=invoke_id, length=AMS_TCP_HEADER_LENGTH + len(packet), error_code=ADSErrorCode(error_code)
+                )
+            self._set_response(invoke_id=invoke_id, response=ADSErrorCode(error_code))
             return
 
-        response: Optional[ADSResponse] = None
-
-        if header.command_id == ADSCommand.ADSSRVID_READDEVICEINFO:
-            response = ADSReadDeviceInfoResponse.from_bytes(ads_body)
-        elif header.command_id == ADSCommand.ADSSRVID_READ:
-            response = ADSReadResponse.from_bytes(ads_body)
-        elif header.command_id == ADSCommand.ADSSRVID_WRITE:
-            response = ADSWriteResponse.from_bytes(ads_body)
-        elif header.command_id == ADSCommand.ADSSRVID_READSTATE:
-            response = ADSReadStateResponse.from_bytes(ads_body)
-        elif header.command_id == ADSCommand.ADSSRVID_WRITECTRL:
-            response = ADSWriteControlResponse.from_bytes(ads_body)
-        elif header.command_id == ADSCommand.ADSSRVID_ADDDEVICENOTE:
-            response = ADSAddDeviceNotificationResponse.from_bytes(ads_body)
-        elif header.command_id == ADSCommand.ADSSRVID_DELDEVICENOTE:
-            response = ADSDeleteDeviceNotificationResponse.from_bytes(ads_body)
-        elif header.command_id == ADSCommand.ADSSRVID_DEVICENOTE:
+        if command_id is ADSCommand.ADSSRVID_DEVICENOTE:
             notification_response = ADSDeviceNotificationResponse.from_bytes(ads_body)
+            if metrics is not None:
+                metrics.on_notification(
+                    length=AMS_TCP_HEADER_LENGTH + len(packet), samples=len(notification_response.samples)
+                )
             self._handle_device_notification(notification_response)
             return
-        elif header.command_id == ADSCommand.ADSSRVID_READWRITE:
-            response = ADSReadWriteResponse.from_bytes(ads_body)
-        else:
-            self.__logger.warning(f"Received unknown command_id: {header.command_id}, {packet.hex()}")
+
+        response = parse_ads_response(command_id=command_id, data=ads_body) if command_id is not None else None
+        if response is None:
+            self.__logger.warning(f"Received unknown command_id: {command_id}, {packet.hex()}")
 
         if response:
-            self.__logger.info(f"Received ADSResponse: {response}")
-            with self.__response_condition:
-                if response.result == ADSErrorCode.ERR_NOERROR:
-                    self._responses[header.invoke_id] = response
-                else:
-                    self._responses[header.invoke_id] = response.result
-                self.__response_condition.notify_all()
+            if self.__logger.isEnabledFor(INFO):
+                self.__logger.info("Received ADSResponse: %s", response)
+            if metrics is not None:
+                metrics.on_response(
+                    invoke_id=invoke_id, length=AMS_TCP_HEADER_LENGTH + len(packet), error_code=response.result
+                )
+            if response.result == ADSErrorCode.ERR_NOERROR:
+                self._set_response(invoke_id=invoke_id, response=response)
+            else:
+                self._set_response(invoke_id=invoke_id, response=response.result)
+
+    def _set_response(self, *, invoke_id: int, response: Union[ADSErrorCode, ADSResponse]) -> None:
+        """Complete the pending request with the given invoke_id, only the waiter of that request is woken up."""
+        with self.__pending_requests_lock:
+            future = self._pending_requests.pop(invoke_id, None)
+        if future is None:
+            self.__logger.warning(f"Received response for unknown invoke_id: {invoke_id}")
+            return
+        if isinstance(response, ADSErrorCode):
+            future.set_exception(ADSError(response))
+        else:
+            future.set_result(response)
 
     def _handle_device_notification(self, notification_response: ADSDeviceNotificationResponse) -> None:
         for sample in notification_response.samples:
             handle = sample.handle
             with self.__device_notification_handles_lock:
-                symbol = self.__device_notification_handles.get(handle, None)
-            if symbol is None:
+                subscription = self.__device_notifications.get(handle, None)
+                watcher = None if subscription is not None else self.__online_change_watchers.get(handle, None)
+                if subscription is None and watcher is None and self.__early_device_notifications is not None:
+                    # the first notification can arrive before the handle of the added notification is registered
+                    self.__early_device_notifications.setdefault(handle, []).append(sample)
+                    continue
+            if watcher is not None:
+                watcher(sample.data)
+                continue
+            if subscription is None:
                 self.__logger.warning(f"Received device notification for unknown handle: {handle}")
                 continue
-            decoded = decode_ams_payload(raw_data=sample.data, plc_t=symbol.plc_t)  # type: ignore
-            self.device_notification_queue.put((symbol, sample, decoded))
+            with subscription.delivery_lock:
+                subscription.last_sample = sample
+                for subscriber in list(subscription.subscribers):
+                    self._notify_subscriber(subscriber, sample)
+
+    def _notify_subscriber(self, subscriber: _NotificationSubscriber, sample: AdsNotificationSample) -> None:
+        # the dispatch key is the subscriber, not the notification handle, which is replaced by an online change
+        symbol = subscriber.symbol
+        callback = subscriber.callback
+        if subscriber.buffer is not None:
+            # the buffer decodes the sample when it hands it out, so the samples it drops are never decoded
+            value_t = LazyValue if self.__lazy_decode else DecodeOnGet
+            value = value_t(plc_t=symbol.plc_t, data=sample.data, on_decoded=self.__on_notification_decoded)
+            self.__notification_dispatcher.dispatch(
+                id(subscriber), functools.partial(subscriber.buffer.put, (symbol, sample, value))
+            )
+        elif callback is None:
+            self.device_notification_queue.put((symbol, sample, self._decode_notification(symbol, sample)))
+        else:
+            # the sample is decoded by the dispatcher, so decoding is spread over its threads too,
+            # or, with lazy_decode, by the consumer
+            self.__notification_dispatcher.dispatch(
+                id(subscriber), functools.partial(self._deliver_notification, callback, symbol, sample)
+            )
+
+    def _decode_notification(self, symbol: ADSSymbol[PLCData], sample: AdsNotificationSample) -> Any:
+        value = LazyValue(plc_t=symbol.plc_t, data=sample.data, on_decoded=self.__on_notification_decoded)
+        return value if self.__lazy_decode else value.value
+
+    def _deliver_notification(
+        self, callback: NotificationCallback, symbol: ADSSymbol[PLCData], sample: AdsNotificationSample
+    ) -> None:
+        callback(symbol, sample, self._decode_notification(symbol, sample))
 
-    def open(self, target_ip: str, target_ams_net_id: str, target_ams_port: int = 851) -> None:
+    def open(
+        self, target_ip: str, target_ams_net_id: str, target_ams_port: int = 851, target_tcp_port: int = 48898
+    ) -> None:
         """Open a connection to the target ADS device.
 
         Port 851: TC3 PLC runtime system 1
         https://infosys.beckhoff.com/content/1033/tc3_ads_intro/116159883.html
+
+        TCP port 48898: ADS over TCP
+        https://infosys.beckhoff.com/content/1033/ipc_security_win7/11019143435.html
+
+        With `track_online_changes` the client adds notifications of the symbol version and the ADS state.
         """
-        self.__target_ams_net_id = target_ams_net_id
-        self.__target_ams_port = target_ams_port
+        self.__target = f"{target_ams_net_id}:{target_ams_port}"
+        self.__header_template = AMSHeaderTemplate(
+            target_net_id=target_ams_net_id,
+            target_port=target_ams_port,
+            source_net_id=self.__local_ams_net_id,
+            source_port=self.__local_ams_port,
+        )
         self.__socket = socket.socket(family=socket.AF_INET, type=socket.SOCK_STREAM)
 
-        ADS_TCP_PORT = 48898
-        # https://infosys.beckhoff.com/content/1033/ipc_security_win7/11019143435.html
         try:
-            self.__socket.connect((target_ip, ADS_TCP_PORT))
+            self.__socket.connect((target_ip, target_tcp_port))
         except Exception:
-            self.__logger.error(f"Could not connect to {target_ip}:{ADS_TCP_PORT}")
+            self.__logger.error(f"Could not connect to {target_ip}:{target_tcp_port}")
             return
 
         self.__read_socket_thread = threading.Thread(
             target=self._read_socket_background, kwargs={"socket": self.__socket}, daemon=True
         )
         self.__read_socket_thread.start()
+        if self.__track_online_changes:
+            self._watch_online_changes()
+
+    def _watch_online_changes(self) -> None:
+        """Add the notifications of the symbol version and the ADS state, a change of either invalidates the handles.
+
+        The handles of the variables are invalid after an online change or a download of the PLC program,
+        which increments the symbol version, and after a restart of the PLC, which passes through a state
+        other than RUN.
+        """
+        self.__symbol_version = self.read_symbol_version()
+        self.__ads_state = self.read_state().ads_state.value
+        watchers: List[Tuple[ADSAddDeviceNotificationRequest, Callable[[bytes], None]]] = [
+            (
+                ADSAddDeviceNotificationRequest(
+                    index_group=IndexGroup.SYM_VERSION,
+                    index_offset=0,
+                    length=1,
+                    max_delay_ms=0,
+                    cycle_time_ms=0,
+                    transmission_mode=TransmissionMode.ADSTRANS_SERVERONCHA,
+                ),
+                self._on_symbol_version,
+            ),
+            (
+                ADSAddDeviceNotificationRequest(
+                    index_group=IndexGroup.DEVICE_DATA,
+                    index_offset=0,
+                    length=2,
+                    max_delay_ms=0,
+                    cycle_time_ms=0,
+                    transmission_mode=TransmissionMode.ADSTRANS_SERVERONCHA,
+                ),
+                self._on_ads_state,
+            ),
+        ]
+        # the add lock owns the slot of the held back samples, which `add_device_notification` uses as well
+        with self.__device_notification_add_lock:
+            for request, watcher in watchers:
+                with self._early_device_notifications():
+                    response = self._send_ams_packet(
+                        command=ADSCommand.ADSSRVID_ADDDEVICENOTE, payload=request.to_bytes()
+                    )
+                    assert isinstance(response, ADSAddDeviceNotificationResponse)
+                    with self.__device_notification_handles_lock:
+                        self.__online_change_watchers[response.handle] = watcher
+                        early_samples = (self.__early_device_notifications or {}).pop(response.handle, [])
+                for sample in early_samples:
+                    watcher(sample.data)
+
+    def _on_symbol_version(self, data: bytes) -> None:
+        # called by the socket reader thread, the handles are renewed by another thread
+        symbol_version = data[0]
+        if symbol_version != self.__symbol_version:
+            self.__symbol_version = symbol_version
+            self._on_online_change()
+
+    def _on_ads_state(self, data: bytes) -> None:
+        ads_state = int.from_bytes(data[:2], byteorder="little")
+        previous_ads_state, self.__ads_state = self.__ads_state, ads_state
+        if ads_state == ADSState.ADSSTATE_RUN.value and previous_ads_state != ADSState.ADSSTATE_RUN.value:
+            self._on_online_change()
+
+    def _on_online_change(self) -> None:
+        """Invalidate the cached handles and renew them and the notifications in the background."""
+        with self.__variable_handles_lock:
+            stale_handles = dict(self.__variable_handles)
+            self.__variable_handles.clear()
+        self.__logger.info("Online change detected, renewing the handles")
+        threading.Thread(target=self._renew_handles, kwargs={"stale_handles": stale_handles}, daemon=True).start()
+
+    def _renew_handles(self, stale_handles: Dict[str, int]) -> None:
+        """Release the stale handles, then get the handles of the variables and add their notifications again,
+        with sum commands. The handles returned by `add_device_notification` remain valid for removing subscribers.
+        """
+        self.__plc_types.clear()  # the data types can have changed, too
+        try:
+            with self.__device_notification_add_lock:
+                with self.__device_notification_handles_lock:
+                    subscriptions = list(self.__device_notifications.values())
+                # the server may have dropped the stale handles and notifications already
+                try:
+                    if stale_handles:
+                        self.release_handles(handles=list(set(stale_handles.values())))
+                    if subscriptions:
+                        self._delete_device_notifications([subscription.handle for subscription in subscriptions])
+                except ADSError:
+                    pass
+                names = list(stale_handles)
+                names.extend(subscription.subscribers[0].symbol.name for subscription in subscriptions)
+                self._get_variable_handles(names=names)
+                self._add_device_notifications_again(subscriptions)
+        except Exception:
+            self.__logger.exception("Could not renew the handles after an online change")
+
+    def _add_device_notifications_again(self, subscriptions: List[_NotificationSubscription]) -> None:
+        variable_handles = self._get_variable_handles([s.subscribers[0].symbol.name for s in subscriptions])
+        added: List[_NotificationSubscription] = []
+        items: List[ADSAddDeviceNotificationRequest] = []
+        for subscription in subscriptions:
+            variable_handle = variable_handles[subscription.subscribers[0].symbol.name]
+            if isinstance(variable_handle, ADSErrorCode):
+                self.__logger.warning(f"Could not add device notification {subscription.key} again: {variable_handle}")
+                self._drop_subscription(subscription)
+                continue
+            _, length, transmission_mode, max_delay_ms, cycle_time_ms = subscription.key
+            added.append(subscription)
+            items.append(
+                ADSAddDeviceNotificationRequest(
+                    index_group=IndexGroup.SYMVAL_BYHANDLE,
+                    index_offset=variable_handle,
+                    length=length,
+                    max_delay_ms=max_delay_ms,
+                    cycle_time_ms=cycle_time_ms,
+                    transmission_mode=transmission_mode,
+                )
+            )
+
+        # every sub request occupies 40 bytes in the request
+        chunks = split_sum_command(
+            [40] * len(items), max_items=self.__max_sum_command_items, max_bytes=self.__max_sum_command_bytes
+        )
+        for chunk in chunks:
+            request = ADSSumAddDeviceNotificationRequest(items=items[chunk.start : chunk.stop])
+            with self._early_device_notifications():
+                response = self._send_ams_packet(command=ADSCommand.ADSSRVID_READWRITE, payload=request.to_bytes())
+                assert isinstance(response, ADSReadWriteResponse)
+                sum_response = ADSSumAddDeviceNotificationResponse.from_bytes(response.data, count=len(request.items))
+                renewed: List[_NotificationSubscription] = []
+                deleted: List[int] = []  # notifications whose subscribers were removed meanwhile
+                for subscription, item_response in zip(added[chunk.start : chunk.stop], sum_response.results):
+                    if item_response.result != ADSErrorCode.ERR_NOERROR:
+                        self.__logger.warning(
+                            f"Could not add device notification {subscription.key} again: {item_response.result}"
+                        )
+                        self._drop_subscription(subscription)
+                        continue
+                    with self.__device_notification_handles_lock:
+                        old_handle = subscription.handle
+                        if self.__device_notifications.get(old_handle, None) is not subscription:
+                            deleted.append(item_response.handle)
+                            continue
+                        del self.__device_notifications[old_handle]
+                        for alias, handle in self.__device_notification_aliases.items():
+                            if handle == old_handle:
+                                self.__device_notification_aliases[alias] = item_response.handle
+                        self.__device_notification_aliases[old_handle] = item_response.handle
+                        subscription.handle = item_response.handle
+                    renewed.append(subscription)
+                self._register_subscriptions(renewed)
+            if deleted:
+                self._delete_device_notifications(deleted)
+
+    def _drop_subscription(self, subscription: _NotificationSubscription) -> None:
+        with self.__device_notification_handles_lock:
+            if self.__device_notifications.get(subscription.handle, None) is subscription:
+                del self.__device_notifications[subscription.handle]
+                del self.__device_notification_handles[subscription.key]
 
     def read_device_info(self) -> ADSReadDeviceInfoResponse:
         response = self._send_ams_packet(command=ADSCommand.ADSSRVID_READDEVICEINFO, payload=b"")
@@ -242,43 +597,367 @@ class ADSClient:
         response = self._send_ams_packet(command=ADSCommand.ADSSRVID_WRITE, payload=request_raw)
         assert isinstance(response, ADSWriteResponse)
 
-    def add_device_notification(self, symbol: ADSSymbol[PLCData], max_delay_ms: int = 0, cycle_time_ms: int = 0) -> int:
+    def get_handles_by_name(self, names: Sequence[str]) -> List[Union[int, ADSErrorCode]]:
+        """Get the handles of several variables with ADS sum ReadWrite commands.
+
+        The returned list has the same order as `names`,
+        the `ADSErrorCode` is returned instead of the handle if a name could not be resolved.
+        """
+        handles: List[Union[int, ADSErrorCode]] = []
+        for request in get_handle_requests(
+            names, max_items=self.__max_sum_command_items, max_bytes=self.__max_sum_command_bytes
+        ):
+            response = self._send_ams_packet(command=ADSCommand.ADSSRVID_READWRITE, payload=request.to_bytes())
+            handles.extend(get_handle_results(request, response))
+        return handles
+
+    def release_handles(self, handles: Sequence[int]) -> List[ADSErrorCode]:
+        """Release several handles with ADS sum write commands.
+
+        Returns the `ADSErrorCode` of every handle, in the same order as `handles`.
+        """
+        results: List[ADSErrorCode] = []
+        for request in release_handle_requests(
+            handles, max_items=self.__max_sum_command_items, max_bytes=self.__max_sum_command_bytes
+        ):
+            response = self._send_ams_packet(command=ADSCommand.ADSSRVID_READWRITE, payload=request.to_bytes())
+            results.extend(write_results(request, response))
+        return results
+
+    def _get_variable_handle(self, name: str) -> int:
         with self.__variable_handles_lock:
-            variable_handle = self.__variable_handles.get(symbol.name, None)
+            handle = self.__variable_handles.get(name, None)
 
-        if variable_handle is None:
-            variable_handle = self.get_handle_by_name(name=symbol.name)
+        if handle is None:
+            handle = self.get_handle_by_name(name=name)
             with self.__variable_handles_lock:
-                self.__variable_handles[symbol.name] = variable_handle
-
-        request = ADSAddDeviceNotificationRequest(
-            index_group=IndexGroup.SYMVAL_BYHANDLE,
-            index_offset=variable_handle,
-            length=symbol.plc_t.bytes_length,
-            max_delay_ms=max_delay_ms,
-            cycle_time_ms=cycle_time_ms,
-            transmission_mode=TransmissionMode.ADSTRANS_SERVERONCHA,
-        )
-        request_raw = request.to_bytes()
+                self.__variable_handles[name] = handle
+        return handle
+
+    def _get_variable_handles(self, names: Sequence[str]) -> Dict[str, Union[int, ADSErrorCode]]:
+        """Get the handles of several variables, the handles which are not cached are requested in bulk."""
+        handles: Dict[str, Union[int, ADSErrorCode]] = {}
+        with self.__variable_handles_lock:
+            for name in names:
+                handle = self.__variable_handles.get(name, None)
+                if handle is not None:
+                    handles[name] = handle
+        missing_names = list(dict.fromkeys(name for name in names if name not in handles))
+        if not missing_names:
+            return handles
+
+        missing_handles = self.get_handles_by_name(names=missing_names)
+        with self.__variable_handles_lock:
+            for name, missing_handle in zip(missing_names, missing_handles):
+                handles[name] = missing_handle
+                if isinstance(missing_handle, int):
+                    self.__variable_handles[name] = missing_handle
+        return handles
+
+    def _forget_variable_handles(self, handles: Dict[str, int]) -> None:
+        """Remove stale handles from the cache, unless another thread has renewed them already."""
+        with self.__variable_handles_lock:
+            for name, handle in handles.items():
+                if self.__variable_handles.get(name, None) == handle:
+                    del self.__variable_handles[name]
+
+    def add_device_notification(
+        self,
+        symbol: ADSSymbol[PLCData],
+        max_delay_ms: int = 0,
+        cycle_time_ms: int = 0,
+        callback: Optional[NotificationCallback] = None,
+        buffer: Optional[NotificationBuffer] = None,
+        transmission_mode: TransmissionMode = TransmissionMode.ADSTRANS_SERVERONCHA,
+    ) -> int:
+        """Add a device notification of `symbol`.
+
+        With `ADSTRANS_SERVERONCHA`, the default, the server checks the value every `cycle_time_ms`
+        and sends it when it changed. With `ADSTRANS_SERVERCYCLE` the server sends the value every `cycle_time_ms`.
+        The server collects the samples for at most `max_delay_ms` before sending them.
+
+        The notifications are put into `device_notification_queue`, or, if `callback` is given,
+        `callback` is called with the symbol, the sample and the decoded value by the notification dispatcher
+        of the client. The callbacks of one notification are called in the order the notifications are received.
+
+        If `buffer` is given, e.g. a `LatestValueBuffer` or a `BoundedBuffer`, the notifications are put into it
+        instead of the unbounded `device_notification_queue`.
+
+        Subscriptions of the same variable with the same data length and notification settings share one
+        notification on the server, which is deleted when the last subscriber is removed. The returned handle
+        is the handle of that notification. A new subscriber of an existing notification gets its latest sample.
+        """
+        assert callback is None or buffer is None, "Either callback or buffer can be given"
+        subscriber = _NotificationSubscriber(symbol=symbol, callback=callback, buffer=buffer)
+        key = _notification_key(symbol, transmission_mode, max_delay_ms, cycle_time_ms)
+        # serializes the adding of notifications, so concurrent subscriptions with the same key share one
+        with self.__device_notification_add_lock:
+            handle = self._add_subscriber(key=key, subscriber=subscriber)
+            if handle is not None:
+                return handle
+
+            variable_handle = self._get_variable_handle(name=symbol.name)
+            request = ADSAddDeviceNotificationRequest(
+                index_group=IndexGroup.SYMVAL_BYHANDLE,
+                index_offset=variable_handle,
+                length=symbol.plc_t.bytes_length,
+                max_delay_ms=max_delay_ms,
+                cycle_time_ms=cycle_time_ms,
+                transmission_mode=transmission_mode,
+            )
+            request_raw = request.to_bytes()
+            with self._early_device_notifications():
+                response = self._send_ams_packet(command=ADSCommand.ADSSRVID_ADDDEVICENOTE, payload=request_raw)
+                assert isinstance(response, ADSAddDeviceNotificationResponse)
+                self._register_subscriptions(
+                    [_NotificationSubscription(key=key, handle=response.handle, subscribers=[subscriber])]
+                )
+            return response.handle
+
+    def add_device_notifications(
+        self,
+        symbols: Sequence[ADSSymbol[PLCData]],
+        max_delay_ms: int = 0,
+        cycle_time_ms: int = 0,
+        callback: Optional[NotificationCallback] = None,
+        buffer: Optional[NotificationBuffer] = None,
+        transmission_mode: TransmissionMode = TransmissionMode.ADSTRANS_SERVERONCHA,
+    ) -> List[Union[int, ADSErrorCode]]:
+        """Add device notifications of several symbols with the same settings with ADS sum commands.
+
+        See `add_device_notification`, the subscriptions are the same as if it was called for every symbol.
+        The returned list has the same order as `symbols`,
+        the `ADSErrorCode` is returned instead of the handle if a notification could not be added.
+        """
+        assert callback is None or buffer is None, "Either callback or buffer can be given"
+        subscribers = [_NotificationSubscriber(symbol=symbol, callback=callback, buffer=buffer) for symbol in symbols]
+        keys = [_notification_key(symbol, transmission_mode, max_delay_ms, cycle_time_ms) for symbol in symbols]
+        results: List[Union[int, ADSErrorCode, None]] = [None] * len(symbols)
+        with self.__device_notification_add_lock:
+            new_keys: Dict[_NotificationKey, int] = {}  # value is the index of the symbol which adds the notification
+            for i, (key, subscriber) in enumerate(zip(keys, subscribers)):
+                if key not in new_keys:
+                    results[i] = self._add_subscriber(key=key, subscriber=subscriber)
+                    if results[i] is None:
+                        new_keys[key] = i
+
+            variable_handles = self._get_variable_handles([symbols[i].name for i in new_keys.values()])
+            indexes: List[int] = []
+            items: List[ADSAddDeviceNotificationRequest] = []
+            for i in new_keys.values():
+                variable_handle = variable_handles[symbols[i].name]
+                if isinstance(variable_handle, ADSErrorCode):
+                    results[i] = variable_handle
+                    continue
+                indexes.append(i)
+                items.append(
+                    ADSAddDeviceNotificationRequest(
+                        index_group=IndexGroup.SYMVAL_BYHANDLE,
+                        index_offset=variable_handle,
+                        length=symbols[i].plc_t.bytes_length,
+                        max_delay_ms=max_delay_ms,
+                        cycle_time_ms=cycle_time_ms,
+                        transmission_mode=transmission_mode,
+                    )
+                )
+
+            # every sub request occupies 40 bytes in the request
+            chunks = split_sum_command(
+                [40] * len(items), max_items=self.__max_sum_command_items, max_bytes=self.__max_sum_command_bytes
+            )
+            for chunk in chunks:
+                request = ADSSumAddDeviceNotificationRequest(items=items[chunk.start : chunk.stop])
+                with self._early_device_notifications():
+                    response = self._send_ams_packet(command=ADSCommand.ADSSRVID_READWRITE, payload=request.to_bytes())
+                    assert isinstance(response, ADSReadWriteResponse)
+                    sum_response = ADSSumAddDeviceNotificationResponse.from_bytes(
+                        response.data, count=len(request.items)
+                    )
+                    subscriptions: List[_NotificationSubscription] = []
+                    for i, item_response in zip(indexes[chunk.start : chunk.stop], sum_response.results):
+                        if item_response.result == ADSErrorCode.ERR_NOERROR:
+                            results[i] = item_response.handle
+                            subscriptions.append(
+                                _NotificationSubscription(
+                                    key=keys[i], handle=item_response.handle, subscribers=[subscribers[i]]
+                                )
+                            )
+                        else:
+                            results[i] = item_response.result
+                    self._register_subscriptions(subscriptions)
+
+            # symbols whose notification is added by an earlier symbol of this call
+            for i, key in enumerate(keys):
+                if results[i] is None:
+                    results[i] = self._add_subscriber(key=key, subscriber=subscribers[i])
+                    if results[i] is None:
+                        results[i] = results[new_keys[key]]
+        assert all(result is not None for result in results)
+        return cast(List[Union[int, ADSErrorCode]], results)
+
+    @contextmanager
+    def _early_device_notifications(self) -> Iterator[None]:
+        """Hold back the samples of unknown handles while notifications are added, until they are registered.
+
+        Must be called with the add lock held, there is one slot for the held back samples.
+        """
         with self.__device_notification_handles_lock:
-            response = self._send_ams_packet(command=ADSCommand.ADSSRVID_ADDDEVICENOTE, payload=request_raw)
-            assert isinstance(response, ADSAddDeviceNotificationResponse)
-            self.__device_notification_handles[response.handle] = symbol
-        return response.handle
+            self.__early_device_notifications = {}
+        try:
+            yield
+        finally:
+            with self.__device_notification_handles_lock:
+                self.__early_device_notifications = None
 
-    def del_device_notification(self, symbol: ADSSymbol[PLCData]) -> None:
+    def _register_subscriptions(self, subscriptions: List[_NotificationSubscription]) -> None:
+        """Register added notifications and deliver their samples which were received before."""
+        for subscription in subscriptions:
+            subscription.delivery_lock.acquire()
+        try:
+            with self.__device_notification_handles_lock:
+                early_samples = self.__early_device_notifications or {}
+                for subscription in subscriptions:
+                    self.__device_notifications[subscription.handle] = subscription
+                    self.__device_notification_handles[subscription.key] = subscription.handle
+                    # the server can reuse the handle of a notification which was renewed
+                    self.__device_notification_aliases.pop(subscription.handle, None)
+            for subscription in subscriptions:
+                for sample in early_samples.pop(subscription.handle, []):
+                    subscription.last_sample = sample
+                    for subscriber in list(subscription.subscribers):
+                        self._notify_subscriber(subscriber, sample)
+        finally:
+            for subscription in subscriptions:
+                subscription.delivery_lock.release()
+
+    def _add_subscriber(self, *, key: _NotificationKey, subscriber: _NotificationSubscriber) -> Optional[int]:
+        """Add a subscriber to the existing notification with `key` and return its handle."""
         with self.__device_notification_handles_lock:
-            handles = [handle for handle, s in self.__device_notification_handles.items() if s == symbol]
-        for handle in handles:
-            self.del_device_notification_by_handle(handle=handle)
+            handle = self.__device_notification_handles.get(key, None)
+            subscription = None if handle is None else self.__device_notifications[handle]
+        if subscription is None:
+            return None
+        with subscription.delivery_lock:
             with self.__device_notification_handles_lock:
-                self.__device_notification_handles.pop(handle, None)
+                if self.__device_notifications.get(subscription.handle, None) is not subscription:
+                    return None  # deleted meanwhile
+                subscription.subscribers.append(subscriber)
+            if subscription.last_sample is not None:
+                self._notify_subscriber(subscriber, subscription.last_sample)
+        return subscription.handle
 
-    def del_device_notification_by_handle(self, handle: int) -> None:
-        request = ADSDeleteDeviceNotificationRequest(handle=handle)
-        request_raw = request.to_bytes()
-        response = self._send_ams_packet(command=ADSCommand.ADSSRVID_DELDEVICENOTE, payload=request_raw)
-        assert isinstance(response, ADSDeleteDeviceNotificationResponse)
+    def del_device_notification(self, symbol: ADSSymbol[PLCData]) -> None:
+        """Remove the subscribers which were added with `symbol`, the same `ADSSymbol` object.
+
+        Subscribers of the same variable with other `ADSSymbol` objects are kept, a notification is deleted
+        on the server when its last subscriber is removed.
+        """
+        handles: List[int] = []
+        with self.__device_notification_handles_lock:
+            for handle, subscription in list(self.__device_notifications.items()):
+                subscribers = [s for s in subscription.subscribers if s.symbol is not symbol]
+                if len(subscribers) == len(subscription.subscribers):
+                    continue
+                subscription.subscribers[:] = subscribers
+                if not subscribers:
+                    del self.__device_notifications[handle]
+                    del self.__device_notification_handles[subscription.key]
+                    handles.append(handle)
+        if handles:
+            self._delete_device_notifications(handles)
+
+    def del_device_notification_by_handle(
+        self,
+        handle: int,
+        callback: Optional[NotificationCallback] = None,
+        buffer: Optional[NotificationBuffer] = None,
+    ) -> None:
+        """Remove a subscriber of the device notification `handle`, the one with `callback` or `buffer`,
+        or the one of `device_notification_queue` if neither is given.
+
+        The notification is deleted on the server when its last subscriber is removed.
+        Raises `KeyError` if there is no notification `handle`, e.g. because it has been deleted already,
+        and `ValueError` if it has no such subscriber.
+        """
+        server_handle = self._remove_subscriber(handle=handle, callback=callback, buffer=buffer)
+        if server_handle is not None:
+            self._delete_device_notifications([server_handle])
+
+    def del_device_notifications(
+        self,
+        handles: Sequence[int],
+        callback: Optional[NotificationCallback] = None,
+        buffer: Optional[NotificationBuffer] = None,
+    ) -> List[ADSErrorCode]:
+        """Remove a subscriber of every device notification of `handles` with ADS sum commands,
+        see `del_device_notification_by_handle`.
+
+        Returns the `ADSErrorCode` of every handle, in the same order as `handles`,
+        `ADSERR_DEVICE_NOTIFYHNDINVALID` for a handle without notification.
+        """
+        results = [ADSErrorCode.ERR_NOERROR] * len(handles)
+        indexes: List[int] = []
+        server_handles: List[int] = []
+        for i, handle in enumerate(handles):
+            try:
+                server_handle = self._remove_subscriber(handle=handle, callback=callback, buffer=buffer)
+            except KeyError:
+                results[i] = ADSErrorCode.ADSERR_DEVICE_NOTIFYHNDINVALID
+                continue
+            if server_handle is not None:
+                indexes.append(i)
+                server_handles.append(server_handle)
+        deleted = self._delete_device_notifications(server_handles)
+        for i, result in zip(indexes, deleted):
+            results[i] = result
+        return results
+
+    def _remove_subscriber(
+        self, *, handle: int, callback: Optional[NotificationCallback], buffer: Optional[NotificationBuffer]
+    ) -> Optional[int]:
+        """Remove a subscriber of the notification `handle`,
+        returns the handle of the notification on the server if it has to be deleted."""
+        with self.__device_notification_handles_lock:
+            handle = self.__device_notification_aliases.get(handle, handle)
+            subscription = self.__device_notifications.get(handle, None)
+            if subscription is None:
+                raise KeyError(f"No device notification with handle {handle}")
+            subscribers = subscription.subscribers
+            matches = [i for i, s in enumerate(subscribers) if s.matches(callback=callback, buffer=buffer)]
+            if not matches:
+                raise ValueError(f"No subscriber of device notification {handle} with this callback or buffer")
+            subscribers.pop(matches[-1])
+            if subscribers:
+                return None
+            del self.__device_notifications[handle]
+            del self.__device_notification_handles[subscription.key]
+            return handle
+
+    def _delete_device_notifications(self, handles: Sequence[int]) -> List[ADSErrorCode]:
+        """Delete notifications on the server, several notifications with ADS sum commands."""
+        if len(handles) == 1:
+            request = ADSDeleteDeviceNotificationRequest(handle=handles[0])
+            response = self._send_ams_packet(command=ADSCommand.ADSSRVID_DELDEVICENOTE, payload=request.to_bytes())
+            assert isinstance(response, ADSDeleteDeviceNotificationResponse)
+            return [response.result]
+
+        items = [ADSDeleteDeviceNotificationRequest(handle=handle) for handle in handles]
+        # every sub request occupies 4 bytes in the request and in the response
+        chunks = split_sum_command(
+            [4] * len(items), max_items=self.__max_sum_command_items, max_bytes=self.__max_sum_command_bytes
+        )
+        results: List[ADSErrorCode] = []
+        for chunk in chunks:
+            sum_request = ADSSumDeleteDeviceNotificationRequest(items=items[chunk.start : chunk.stop])
+            sum_response = self._send_ams_packet(command=ADSCommand.ADSSRVID_READWRITE, payload=sum_request.to_bytes())
+            assert isinstance(sum_response, ADSReadWriteResponse)
+            results.extend(
+                item_response.result
+                for item_response in ADSSumDeleteDeviceNotificationResponse.from_bytes(
+                    sum_response.data, count=len(sum_request.items)
+                ).results
+            )
+        return results
 
     def read_value_by_handle(self, handle: int, data_length: int) -> bytes:
         request = ADSReadRequest(index_group=IndexGroup.SYMVAL_BYHANDLE, index_offset=handle, length=data_length)
@@ -294,6 +973,19 @@ class ADSClient:
         assert isinstance(response, ADSWriteResponse)
         return response
 
+    def read_value_by_address(self, index_group: Union[IndexGroup, int], index_offset: int, data_length: int) -> bytes:
+        """Read `data_length` bytes at the index group and offset, e.g. of a symbol in the symbol upload."""
+        request = ADSReadRequest(index_group=index_group, index_offset=index_offset, length=data_length)
+        response = self._send_ams_packet(command=ADSCommand.ADSSRVID_READ, payload=request.to_bytes())
+        assert isinstance(response, ADSReadResponse)
+        return response.data
+
+    def write_value_by_address(self, index_group: Union[IndexGroup, int], index_offset: int, data: bytes) -> None:
+        """Write `data` at the index group and offset, e.g. of a symbol in the symbol upload."""
+        request = ADSWriteRequest(index_group=index_group, index_offset=index_offset, data=data)
+        response = self._send_ams_packet(command=ADSCommand.ADSSRVID_WRITE, payload=request.to_bytes())
+        assert isinstance(response, ADSWriteResponse)
+
     def read_state(self) -> ADSReadStateResponse:
         response = self._send_ams_packet(command=ADSCommand.ADSSRVID_READSTATE, payload=b"")
         assert isinstance(response, ADSReadStateResponse)
@@ -305,47 +997,145 @@ class ADSClient:
         response = self._send_ams_packet(command=ADSCommand.ADSSRVID_WRITECTRL, payload=request_raw)
         assert isinstance(response, ADSWriteControlResponse)
 
-    def _send_ams_packet(self, *, command: ADSCommand, payload: bytes) -> ADSResponse:
-        assert self.__socket is not None, "Socket is not open"
+    def read_symbol_upload_info(self) -> ADSSymbolUploadInfo:
+        """Read the number and the total size of the symbol and data type entries of the PLC."""
+        request = ADSReadRequest(index_group=IndexGroup.SYM_UPLOADINFO2, index_offset=0, length=24)
+        response = self._send_ams_packet(command=ADSCommand.ADSSRVID_READ, payload=request.to_bytes())
+        assert isinstance(response, ADSReadResponse)
+        return ADSSymbolUploadInfo.from_bytes(response.data)
 
-        invoke_id = self.get_invoke_id()
-        ams_header = AMSHeader(
-            target_net_id=self.__target_ams_net_id,
-            target_port=self.__target_ams_port,
-            source_net_id=self.__local_ams_net_id,
-            source_port=self.__local_ams_port,
-            command_id=command,
-            state_flags=StateFlag.AMSCMDSF_ADSCMD,
-            length=len(payload),
-            error_code=ADSErrorCode.ERR_NOERROR,
-            invoke_id=invoke_id,
-        )
+    def read_symbol_version(self) -> int:
+        """Read the symbol version of the PLC, it changes with every online change or download of the program."""
+        request = ADSReadRequest(index_group=IndexGroup.SYM_VERSION, index_offset=0, length=1)
+        response = self._send_ams_packet(command=ADSCommand.ADSSRVID_READ, payload=request.to_bytes())
+        assert isinstance(response, ADSReadResponse)
+        return response.data[0]
 
-        header_raw = ams_header.to_bytes()
-        total_length = len(header_raw) + len(payload)
-        length_bytes = total_length.to_bytes(4, byteorder="little", signed=False)
+    def _upload(self, *, kind: str) -> bytes:
+        """Read the symbol or data type upload with one request, or load it from the metadata cache."""
+        info = self.read_symbol_upload_info()
+        if kind == SYMBOLS:
+            index_group, size = IndexGroup.SYM_UPLOAD, info.symbol_size
+        else:
+            index_group, size = IndexGroup.SYM_DT_UPLOAD, info.data_type_size
+        cache = self.__metadata_cache
+        symbol_version = 0
+        if cache is not None:
+            # read before the upload, an online change in between makes the stored upload outdated, not wrong
+            symbol_version = self.read_symbol_version()
+            data = cache.get(self.__target, kind, symbol_version, size)
+            if data is not None:
+                return data
+        request = ADSReadRequest(index_group=index_group, index_offset=0, length=size)
+        response = self._send_ams_packet(command=ADSCommand.ADSSRVID_READ, payload=request.to_bytes())
+        assert isinstance(response, ADSReadResponse)
+        if cache is not None:
+            cache.put(self.__target, kind, symbol_version, response.data)
+        return response.data
 
-        with self.__response_condition:
-            self._responses.pop(invoke_id, None)
+    def upload_symbols(self) -> SymbolCatalog:
+        """Read all symbols of the PLC with one request and return them as a `SymbolCatalog`.
 
-        self.__logger.info(f"Sending AMS packet: {header_raw.hex(' ')}, {payload.hex(' ')}")
-        self.__socket.sendall(b"\x00\x00" + length_bytes + header_raw + payload)
+        The catalog is a snapshot, upload it again after an online change or a download of the PLC program.
+        With a `metadata_cache` the upload is loaded from the cache if the symbol version of the PLC is unchanged.
+        """
+        return SymbolCatalog.from_bytes(self._upload(kind=SYMBOLS))
 
-        start_time = time.perf_counter()
-        timeout = self.__timeout
-        with self.__response_condition:
-            while invoke_id not in self._responses:
-                timeout -= time.perf_counter() - start_time
-                if timeout <= 0:
-                    break
-                self.__response_condition.wait(timeout=timeout)
+    def read_data_type_entry(self, type_name: str) -> ADSDataTypeEntry:
+        """Read the data type entry of `type_name`, it describes the members of a struct or the bounds of an array."""
+        request = ADSReadWriteRequest.data_type_info_by_name(name=type_name)
+        response = self._send_ams_packet(command=ADSCommand.ADSSRVID_READWRITE, payload=request.to_bytes())
+        assert isinstance(response, ADSReadWriteResponse)
+        entry, _ = ADSDataTypeEntry.from_bytes(response.data)
+        return entry
+
+    def upload_data_types(self) -> List[ADSDataTypeEntry]:
+        """Read all data type entries of the PLC with one request.
+
+        `get_plc_type` builds the types from these entries afterwards, without a request per type.
+        With a `metadata_cache` the upload is loaded from the cache if the symbol version of the PLC is unchanged.
+        """
+        entries = list(parse_data_type_entries(self._upload(kind=DATA_TYPES)))
+        self.__plc_types.add_entries(entries)
+        return entries
+
+    def get_plc_type(self, type_name: str) -> PLCData:
+        """Build the `PLCData` of a PLC data type, e.g. `ST_Motor` or the `type_name` of a `SymbolInfo`.
+
+        Structs get the member offsets and the padding of the PLC. The data type entries are read
+        from the PLC when they are needed, and every type is built only once per client.
+        """
+        return self.__plc_types.resolve(type_name)
+
+    def send_async(self, *, command: ADSCommand, payload: bytes) -> "Future[ADSResponse]":
+        """Send an ADS request without waiting for the response.
+
+        The returned future is completed by the socket reader thread once the response arrives,
+        so many requests can be in flight at the same time, e.g.
+
+        futures = [client.send_async(command=ADSCommand.ADSSRVID_READ, payload=request.to_bytes()) for request in requests]
+        responses = [future.result(timeout=3) for future in futures]
+
+        The future raises `ADSError` if the device answers with an error code.
+        It is never completed if the device does not answer, use a timeout when waiting for the result.
+        """
+        _, future = self._send_request(command=command, payload=payload)
+        return future
+
+    def _send_request(
+        self, *, command: ADSCommand, payload: bytes, track_decode: bool = False
+    ) -> Tuple[int, "Future[ADSResponse]"]:
+        assert self.__socket is not None, "Socket is not open"
 
-            response = self._responses.pop(invoke_id, None)
-            if response is None:
-                raise TimeoutError(f"Timeout while waiting for response to invoke_id: {ams_header.invoke_id}")
-            if isinstance(response, ADSErrorCode):
-                raise RuntimeError(f"Received error code: {response}")
-            return response
+        invoke_id = self.get_invoke_id()
+        frame = self.__header_template.pack_frame(command_id=command, invoke_id=invoke_id, payload=payload)
+
+        future: Future[ADSResponse] = Future()
+        with self.__pending_requests_lock:
+            self._pending_requests[invoke_id] = future
+        if self.__metrics is not None:
+            self.__metrics.on_send(invoke_id=invoke_id, command=command, length=len(frame), track_decode=track_decode)
+
+        if self.__wire_trace.enabled:
+            ams_header = memoryview(frame)[AMS_TCP_HEADER_LENGTH : AMS_TCP_HEADER_LENGTH + AMS_HEADER_STRUCT.size]
+            self.__wire_trace.trace(WireDirection.SENT, ams_header, payload)
+        try:
+            with self.__send_lock:
+                self.__socket.sendall(frame)
+        except Exception:
+            with self.__pending_requests_lock:
+                self._pending_requests.pop(invoke_id, None)
+            if self.__metrics is not None:
+                self.__metrics.on_send_failed(invoke_id=invoke_id)
+            raise
+        return invoke_id, future
+
+    def _send_ams_packet(self, *, command: ADSCommand, payload: bytes) -> ADSResponse:
+        metrics = self.__metrics
+        invoke_id, future = self._send_request(command=command, payload=payload, track_decode=metrics is not None)
+        try:
+            return future.result(timeout=self.__timeout)
+        except FutureTimeoutError:
+            with self.__pending_requests_lock:
+                self._pending_requests.pop(invoke_id, None)
+            if metrics is not None:
+                metrics.on_timeout(invoke_id=invoke_id)
+            raise TimeoutError(f"Timeout while waiting for response to invoke_id: {invoke_id}")
+        finally:
+            if metrics is not None:
+                self.__thread_local.received_ns = metrics.take_received_ns(invoke_id=invoke_id)
+
+    def _record_decoded(self, command: ADSCommand) -> None:
+        """Record the time from receiving the last response of this thread until now as decode time."""
+        assert self.__metrics is not None
+        received_ns: Optional[int] = getattr(self.__thread_local, "received_ns", None)
+        if received_ns is not None:
+            self.__metrics.on_decoded(command=command, received_ns=received_ns)
+
+    def stats(self) -> MetricsSnapshot:
+        """Snapshot of the metrics, the client must be created with `metrics=ClientMetrics()`."""
+        assert self.__metrics is not None, "Metrics are not enabled"
+        return self.__metrics.snapshot()
 
     @overload
     def read_symbol(self, symbol: ADSSymbol[_PLCBoolType]) -> bool: ...
@@ -375,24 +1165,80 @@ class ADSClient:
     def read_symbol(self, symbol: ADSSymbol[STRUCT]) -> Dict[str, Any]: ...
 
     @overload
-    def read_symbol(self, symbol: ADSSymbol[ARRAY]) -> List[Any]: ...
+    def read_symbol(
+        self, symbol: ADSSymbol[ARRAY]
+    ) -> Any: ...  # `list`, or `numpy.ndarray` if `ARRAY(..., numpy=True)`
+
+    @overload
+    def read_symbol(self, symbol: ADSSymbol[PLCData]) -> Any: ...  # type built at runtime, e.g. by `get_plc_type`
 
     def read_symbol(self, symbol: Any) -> Any:
+        """Read a symbol at its index group and offset, or by its handle.
+
+        The handle is cached, if it has become invalid, e.g. by an online change, it is renewed and the read retried.
+        """
         assert isinstance(symbol, ADSSymbol)
         assert isinstance(symbol.plc_t, PLCData)
 
-        with self.__variable_handles_lock:
-            handle = self.__variable_handles.get(symbol.name, None)
-
-        if handle is None:
-            handle = self.get_handle_by_name(name=symbol.name)
-            with self.__variable_handles_lock:
-                self.__variable_handles[symbol.name] = handle
-
-        raw_data = self.read_value_by_handle(handle=handle, data_length=symbol.plc_t.bytes_length)
+        data_length = symbol.plc_t.bytes_length
+        if symbol.index_group is not None and symbol.index_offset is not None:
+            raw_data = self.read_value_by_address(symbol.index_group, symbol.index_offset, data_length=data_length)
+        else:
+            handle = self._get_variable_handle(name=symbol.name)
+            try:
+                raw_data = self.read_value_by_handle(handle=handle, data_length=data_length)
+            except ADSError as error:
+                if not is_stale_handle_error(error.error_code):
+                    raise
+                self._forget_variable_handles({symbol.name: handle})
+                handle = self._get_variable_handle(name=symbol.name)
+                raw_data = self.read_value_by_handle(handle=handle, data_length=data_length)
         decode_value = decode_ams_payload(raw_data=raw_data, plc_t=symbol.plc_t)  # type: ignore
+        if self.__metrics is not None:
+            self._record_decoded(ADSCommand.ADSSRVID_READ)
         return decode_value
 
+    def read_symbols(self, symbols: Sequence[ADSSymbol[PLCData]]) -> List[Any]:
+        """Read several symbols with ADS sum read commands.
+
+        All symbols are read in one round trip, unless the request exceeds the sum command limits,
+        then it is split into several sum commands. Symbols with an index group and offset need no handle.
+
+        The returned list has the same order as `symbols`. A symbol which could not be read does not fail the
+        whole batch, its `ADSErrorCode` is returned instead of the value.
+        Symbols whose cached handle has become invalid are read again with a renewed handle.
+        """
+        results, handles = self._read_symbols(symbols)
+        stale: List[int] = []
+        stale_handles: Dict[str, int] = {}
+        for i, (symbol, result) in enumerate(zip(symbols, results)):
+            handle = handles.get(symbol.name, None)
+            if symbol.index_group is None and is_stale_handle_error(result) and isinstance(handle, int):
+                stale.append(i)
+                stale_handles[symbol.name] = handle
+        if stale:
+            self._forget_variable_handles(stale_handles)
+            retried, _ = self._read_symbols([symbols[i] for i in stale])
+            for i, result in zip(stale, retried):
+                results[i] = result
+        return results
+
+    def _read_symbols(
+        self, symbols: Sequence[ADSSymbol[PLCData]]
+    ) -> Tuple[List[Any], Dict[str, Union[int, ADSErrorCode]]]:
+        """Read the symbols, returns the results and the handles which were used."""
+        handles = self._get_variable_handles(names=handle_names(symbols))
+        results, chunks = read_symbol_requests(
+            symbols, handles, max_items=self.__max_sum_command_items, max_bytes=self.__max_sum_command_bytes
+        )
+        for chunk in chunks:
+            request = chunk[1]
+            response = self._send_ams_packet(command=ADSCommand.ADSSRVID_READWRITE, payload=request.to_bytes())
+            decode_read_results(symbols, chunk, response, results)
+            if self.__metrics is not None:
+                self._record_decoded(ADSCommand.ADSSRVID_READWRITE)
+        return results, handles
+
     @overload
     def write_symbol(self, symbol: ADSSymbol[_PLCBoolType], value: bool) -> None: ...
 
@@ -421,42 +1267,68 @@ class ADSClient:
     def write_symbol(self, symbol: ADSSymbol[STRUCT], value: Dict[str, Any]) -> None: ...
 
     @overload
-    def write_symbol(self, symbol: ADSSymbol[ARRAY], value: List[Any]) -> None: ...
+    def write_symbol(self, symbol: ADSSymbol[ARRAY], value: Any) -> None: ...
+
+    @overload
+    def write_symbol(self, symbol: ADSSymbol[PLCData], value: Any) -> None: ...
 
     def write_symbol(self, symbol: Any, value: Any) -> None:
         assert isinstance(symbol, ADSSymbol)
         assert isinstance(symbol.plc_t, PLCData)
-
-        if isinstance(symbol.plc_t, _PLCBoolType):
-            assert isinstance(value, bool)
-        elif isinstance(symbol.plc_t, _PLCIntType):
-            assert isinstance(value, int)
-        elif isinstance(symbol.plc_t, _PLCFloatType):
-            assert isinstance(value, float)
-        elif isinstance(symbol.plc_t, (STRING, WSTRING)):
-            assert isinstance(value, str)
-        elif isinstance(symbol.plc_t, _PLCTimeDeltaType):
-            assert isinstance(value, timedelta)
-        elif isinstance(symbol.plc_t, _PLCDateType):
-            assert isinstance(value, date)
-        elif isinstance(symbol.plc_t, _PLCDateAndTimeType):
-            assert isinstance(value, datetime)
-        elif isinstance(symbol.plc_t, _PLCTimeOfDayType):
-            assert isinstance(value, datetime_time)
-        elif isinstance(symbol.plc_t, STRUCT):
-            assert isinstance(value, dict)
-        elif isinstance(symbol.plc_t, ARRAY):
-            assert isinstance(value, list)
-        else:
-            raise ValueError(f"Unsupported PLC data type: {symbol.plc_t}")
-
-        with self.__variable_handles_lock:
-            handle = self.__variable_handles.get(symbol.name, None)
-
-        if handle is None:
-            handle = self.get_handle_by_name(name=symbol.name)
-            with self.__variable_handles_lock:
-                self.__variable_handles[symbol.name] = handle
+        check_value_type(plc_t=symbol.plc_t, value=value)
 
         raw_data = encode_ams_payload(data=value, plc_t=symbol.plc_t)  # type: ignore
-        self.write_value_by_handle(handle=handle, data=raw_data)
+        if symbol.index_group is not None and symbol.index_offset is not None:
+            self.write_value_by_address(symbol.index_group, symbol.index_offset, data=raw_data)
+            return
+        handle = self._get_variable_handle(name=symbol.name)
+        try:
+            self.write_value_by_handle(handle=handle, data=raw_data)
+        except ADSError as error:
+            # the cached handle has become invalid, e.g. by an online change
+            if not is_stale_handle_error(error.error_code):
+                raise
+            self._forget_variable_handles({symbol.name: handle})
+            handle = self._get_variable_handle(name=symbol.name)
+            self.write_value_by_handle(handle=handle, data=raw_data)
+
+    def write_symbols(self, values: Dict[ADSSymbol[PLCData], Any]) -> Dict[ADSSymbol[PLCData], ADSErrorCode]:
+        """Write several symbols with ADS sum write commands.
+
+        All values are written in one round trip, unless the request exceeds the sum command limits,
+        then it is split into several sum commands. Symbols with an index group and offset need no handle.
+
+        Returns the `ADSErrorCode` of every symbol, `ERR_NOERROR` if the value has been written.
+        A failed symbol does not fail the whole batch.
+        Symbols whose cached handle has become invalid are written again with a renewed handle.
+        """
+        results, handles = self._write_symbols(values)
+        stale_handles: Dict[str, int] = {}
+        for symbol, result in results.items():
+            handle = handles.get(symbol.name, None)
+            if symbol.index_group is None and is_stale_handle_error(result) and isinstance(handle, int):
+                stale_handles[symbol.name] = handle
+        if stale_handles:
+            self._forget_variable_handles(stale_handles)
+            retried, _ = self._write_symbols(
+                {
+                    symbol: value
+                    for symbol, value in values.items()
+                    if symbol.index_group is None and symbol.name in stale_handles
+                }
+            )
+            results.update(retried)
+        return results
+
+    def _write_symbols(
+        self, values: Dict[ADSSymbol[PLCData], Any]
+    ) -> Tuple[Dict[ADSSymbol[PLCData], ADSErrorCode], Dict[str, Union[int, ADSErrorCode]]]:
+        """Write the values, returns the results and the handles which were used."""
+        handles = self._get_variable_handles(names=handle_names(values))
+        results, chunks = write_symbol_requests(
+            values, handles, max_items=self.__max_sum_command_items, max_bytes=self.__max_sum_command_bytes
+        )
+        for symbols, request in chunks:
+            response = self._send_ams_packet(command=ADSCommand.ADSSRVID_READWRITE, payload=request.to_bytes())
+            results.update(zip(symbols, write_results(request, response)))
+        return results, handles
@@ -0,0 +1,773 @@
+import heapq
+import logging
+import random
+import socket
+import struct
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .ads_symbol import ADSSymbol
+from .ams.ads_data_type_upload import ADSDataTypeEntry
+from .ams.ads_device_notification import EPOCH_AS_FILETIME
+from .ams.ads_read_device_info import ADSReadDeviceInfoResponse
+from .ams.ads_symbol_upload import ADSSymbolEntry, ADSSymbolUploadInfo
+from .ams.ams_header import AMS_TCP_HEADER_LENGTH
+from .constants.ads_state import ADSState
+from .constants.command_id import ADSCommand
+from .constants.index_group import IndexGroup
+from .constants.return_code import ADSErrorCode
+from .constants.transmission_mode import TransmissionMode
+from .helpers.decode_ams_payload import decode_ams_payload
+from .helpers.encode_ams_payload import encode_ams_payload
+from .helpers.plc_type_name import plc_ads_data_type, plc_type_name
+from .types import ARRAY, STRUCT, PLCData
+
+DATA_INDEX_GROUP = 0x4040
+"""Index group of the simulated PLC data area, the index offset of a symbol is its offset in the data area."""
+
+_AMS_HEADER_LENGTH = 32
+_AMS_TCP_HEADER = struct.Struct("< H I")
+_AMS_HEADER_VARIABLE_FIELDS = struct.Struct("< H H I I I")
+_RESPONSE_STATE_FLAGS = 0x0005  # AMSCMDSF_ADSCMD | AMSCMDSF_RESPONSE
+_REQUEST_STATE_FLAGS = 0x0004  # AMSCMDSF_ADSCMD
+
+_Result = Tuple[ADSErrorCode, bytes]
+
+
+def _filetime_now() -> int:
+    return time.time_ns() // 100 + EPOCH_AS_FILETIME
+
+
+@dataclass()
+class _SimulatedSymbol:
+    name: str
+    plc_t: PLCData
+    offset: int
+    """Offset of the symbol in the data area."""
+    type_name: str
+
+
+@dataclass()
+class _Notification:
+    handle: int
+    connection: "_Connection"
+    addressing: bytes
+    """Target and source net ids and ports of the device notification packets."""
+    index_group: int
+    offset: int
+    """Offset in the data area, or the index offset for `SYM_VERSION` and `DEVICE_DATA`."""
+    length: int
+    transmission_mode: TransmissionMode
+    cycle_time_s: float
+    next_due: float = 0.0
+    last_data: bytes = b""
+
+
+@dataclass()
+class _Fault:
+    command: Optional[ADSCommand]
+    count: int
+    error_code: Optional[ADSErrorCode]
+    """`None` if the response is dropped."""
+
+
+@dataclass(order=True)
+class _ScheduledFrame:
+    due: float
+    sequence: int
+    frame: bytes = field(compare=False)
+
+
+class _Connection:
+    """A client connection, responses are sent by a dedicated thread when they are due."""
+
+    def __init__(self, simulator: "ADSSimulator", sock: socket.socket) -> None:
+        self.simulator = simulator
+        self.socket = sock
+        self.__frames: List[_ScheduledFrame] = []
+        self.__frames_condition = threading.Condition()
+        self.__sequence = 0
+        self.__closed = False
+        self.__reader = threading.Thread(target=self._read_background, daemon=True)
+        self.__sender = threading.Thread(target=self._send_background, daemon=True)
+
+    def start(self) -> None:
+        self.__reader.start()
+        self.__sender.start()
+
+    def close(self) -> None:
+        with self.__frames_condition:
+            self.__closed = True
+            self.__frames_condition.notify()
+        try:
+            self.socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.socket.close()
+
+    def schedule(self, frame: bytes, delay_s: float) -> None:
+        with self.__frames_condition:
+            self.__sequence += 1
+            heapq.heappush(self.__frames, _ScheduledFrame(time.monotonic() + delay_s, self.__sequence, frame))
+            self.__frames_condition.notify()
+
+    def _read_exactly(self, length: int) -> Optional[bytes]:
+        data = bytearray()
+        while len(data) < length:
+            try:
+                chunk = self.socket.recv(length - len(data))
+            except OSError:
+                return None
+            if not chunk:
+                return None
+            data += chunk
+        return bytes(data)
+
+    def _read_background(self) -> None:
+        while True:
+            tcp_header = self._read_exactly(AMS_TCP_HEADER_LENGTH)
+            if tcp_header is None:
+                break
+            _, length = _AMS_TCP_HEADER.unpack(tcp_header)
+            packet = self._read_exactly(length)
+            if packet is None:
+                break
+            self.simulator._handle_packet(self, packet)
+        self.simulator._remove_connection(self)
+
+    def _send_background(self) -> None:
+        fragment_size = self.simulator.fragment_size
+        while True:
+            with self.__frames_condition:
+                while not self.__closed and (not self.__frames or self.__frames[0].due > time.monotonic()):
+                    timeout = self.__frames[0].due - time.monotonic() if self.__frames else None
+                    self.__frames_condition.wait(timeout)
+                if self.__closed:
+                    return
+                frame = heapq.heappop(self.__frames).frame
+            try:
+                if fragment_size is None:
+                    self.socket.sendall(frame)
+                else:
+                    for start in range(0, len(frame), fragment_size):
+                        self.socket.sendall(frame[start : start + fragment_size])
+            except OSError:
+                return
+
+
+class ADSSimulator:
+    """In-process ADS server for tests and benchmarks.
+
+    The simulator speaks AMS/TCP on a local TCP port and answers the commands of `ADSCommand`
+    from a data area which holds the values of `symbols`:
+    read device info and state, write control, handles by name, read and write by handle or by
+    `DATA_INDEX_GROUP`, sum commands, the symbol and data type upload, and on change or cyclic device notifications.
+
+    Responses are delayed by `latency_s` plus a random jitter of up to `jitter_s`, responses which are due
+    at the same time may be sent out of order. If `fragment_size` is given, frames are sent in pieces
+    of at most `fragment_size` bytes. `seed` makes the jitter repeatable.
+
+    Use `inject_error` and `drop_responses` to let the next requests fail, and `online_change`
+    to invalidate the handles like an online change of the PLC program.
+    """
+
+    def __init__(
+        self,
+        symbols: Sequence[ADSSymbol[PLCData]] = (),
+        *,
+        device_name: str = "Plc30 App",
+        version: Tuple[int, int, int] = (3, 1, 4024),
+        ads_state: ADSState = ADSState.ADSSTATE_RUN,
+        latency_s: float = 0.0,
+        jitter_s: float = 0.0,
+        fragment_size: Optional[int] = None,
+        seed: Optional[int] = None,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        self.device_name = device_name
+        self.version = version
+        self.ads_state = ads_state
+        self.device_state = 0
+        self.symbol_version = 1
+        """Symbol version of the PLC, incremented whenever a symbol or data type is added."""
+        self.latency_s = latency_s
+        self.jitter_s = jitter_s
+        self.fragment_size = fragment_size
+        self.__random = random.Random(seed)
+        self.__logger = logger or logging.getLogger(__name__)
+
+        self.__lock = threading.RLock()
+        self.__memory = bytearray()
+        self.__symbols: Dict[str, _SimulatedSymbol] = {}  # key is the lower case name, TwinCAT ignores case
+        self.__data_types: Dict[str, ADSDataTypeEntry] = {}  # key is the lower case type name
+        self.__data_type_names: Dict[int, str] = {}  # key is the id of a named STRUCT
+        self.__handles: Dict[int, _SimulatedSymbol] = {}
+        self.__next_handle = 1
+        self.__notifications: Dict[int, _Notification] = {}
+        self.__next_notification_handle = 1
+        self.__faults: List[_Fault] = []
+
+        self.__server_socket: Optional[socket.socket] = None
+        self.__connections: List[_Connection] = []
+        self.__running = False
+        self.__cyclic_condition = threading.Condition(self.__lock)
+
+        self.__commands: Dict[ADSCommand, Callable[[bytes], bytes]] = {
+            ADSCommand.ADSSRVID_READDEVICEINFO: self._read_device_info,
+            ADSCommand.ADSSRVID_READ: self._read,
+            ADSCommand.ADSSRVID_WRITE: self._write,
+            ADSCommand.ADSSRVID_READSTATE: self._read_state,
+            ADSCommand.ADSSRVID_WRITECTRL: self._write_control,
+            ADSCommand.ADSSRVID_DELDEVICENOTE: self._del_device_notification,
+            ADSCommand.ADSSRVID_READWRITE: self._read_write,
+        }
+
+        for symbol in symbols:
+            self.add_symbol(symbol)
+
+    def __enter__(self) -> "ADSSimulator":
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    @property
+    def port(self) -> int:
+        """TCP port the simulator listens on."""
+        assert self.__server_socket is not None, "Simulator is not started"
+        port: int = self.__server_socket.getsockname()[1]
+        return port
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Listen on `host` and `port`, port 0 picks a free port."""
+        self.__server_socket = socket.create_server((host, port))
+        self.__running = True
+        threading.Thread(target=self._accept_background, daemon=True).start()
+        threading.Thread(target=self._cyclic_notifications_background, daemon=True).start()
+
+    def stop(self) -> None:
+        with self.__lock:
+            self.__running = False
+            self.__cyclic_condition.notify()
+            connections = list(self.__connections)
+        if self.__server_socket is not None:
+            self.__server_socket.close()
+        for connection in connections:
+            connection.close()
+
+    def add_symbol(self, symbol: ADSSymbol[PLCData], value: Any = None, *, type_name: Optional[str] = None) -> None:
+        """Add a symbol at the end of the data area, its value is zero unless `value` is given.
+
+        `type_name` is the type name in the symbol upload, by default the name of the `PLCData`, e.g. `INT`,
+        name the type of a `STRUCT` symbol, it is added as data type.
+        """
+        with self.__lock:
+            if isinstance(symbol.plc_t, STRUCT) and type_name is not None:
+                self.add_data_type(type_name, symbol.plc_t)
+            simulated = _SimulatedSymbol(
+                name=symbol.name,
+                plc_t=symbol.plc_t,
+                offset=len(self.__memory),
+                type_name=type_name or self._type_name(symbol.plc_t),
+            )
+            if isinstance(symbol.plc_t, ARRAY) and simulated.type_name.lower() not in self.__data_types:
+                entry = self._data_type_entry(simulated.type_name, symbol.plc_t)
+                self.__data_types[simulated.type_name.lower()] = entry
+            self.__memory += bytes(symbol.plc_t.bytes_length)
+            self.__symbols[symbol.name.lower()] = simulated
+            self.symbol_version = (self.symbol_version + 1) % 256
+        if value is not None:
+            self.set_value(symbol.name, value)
+
+    def add_data_type(self, name: str, plc_t: STRUCT) -> None:
+        """Add a named struct to the data type upload, add the types of nested structs before the struct."""
+        with self.__lock:
+            self.__data_type_names[id(plc_t)] = name
+            self.__data_types[name.lower()] = self._data_type_entry(name, plc_t)
+            self.symbol_version = (self.symbol_version + 1) % 256
+
+    def _type_name(self, plc_t: PLCData) -> str:
+        name = self.__data_type_names.get(id(plc_t))
+        if name is not None:
+            return name
+        if isinstance(plc_t, ARRAY):
+            bounds = []
+            item_t: PLCData = plc_t
+            while isinstance(item_t, ARRAY):
+                bounds.append(f"{item_t.lower_bound}..{item_t.lower_bound + item_t.length - 1}")
+                item_t = item_t.item_type
+            return f"ARRAY [{','.join(bounds)}] OF {self._type_name(item_t)}"
+        return plc_type_name(plc_t)
+
+    def _data_type_entry(self, name: str, plc_t: PLCData, offset: int = 0) -> ADSDataTypeEntry:
+        entry = ADSDataTypeEntry(
+            name=name,
+            type_name="",
+            size=plc_t.bytes_length,
+            offset=offset,
+            data_type=plc_ads_data_type(plc_t).value,
+        )
+        if isinstance(plc_t, STRUCT):
+            for (field_name, field_t), field_offset in zip(plc_t.fields, plc_t.offsets):
+                if isinstance(field_t, STRUCT) and id(field_t) not in self.__data_type_names:
+                    # an anonymous nested struct is described inline
+                    entry.sub_items.append(self._data_type_entry(field_name, field_t, field_offset))
+                    continue
+                entry.sub_items.append(
+                    ADSDataTypeEntry(
+                        name=field_name,
+                        type_name=self._type_name(field_t),
+                        size=field_t.bytes_length,
+                        offset=field_offset,
+                        data_type=plc_ads_data_type(field_t).value,
+                    )
+                )
+        elif isinstance(plc_t, ARRAY):
+            item_t: PLCData = plc_t
+            while isinstance(item_t, ARRAY):
+                entry.array_info.append((item_t.lower_bound, item_t.length))
+                item_t = item_t.item_type
+            entry.type_name = self._type_name(item_t)
+        return entry
+
+    def index_offset(self, name: str) -> int:
+        """Index offset of a symbol in `DATA_INDEX_GROUP`."""
+        with self.__lock:
+            return self.__symbols[name.lower()].offset
+
+    def get_value(self, name: str) -> Any:
+        with self.__lock:
+            symbol = self.__symbols[name.lower()]
+            raw_data = bytes(self.__memory[symbol.offset : symbol.offset + symbol.plc_t.bytes_length])
+        return decode_ams_payload(raw_data=raw_data, plc_t=symbol.plc_t)  # type: ignore
+
+    def set_value(self, name: str, value: Any) -> None:
+        """Set the value of a symbol, on change notifications of the symbol are sent."""
+        with self.__lock:
+            symbol = self.__symbols[name.lower()]
+            raw_data = encode_ams_payload(data=value, plc_t=symbol.plc_t)  # type: ignore
+            self.__memory[symbol.offset : symbol.offset + len(raw_data)] = raw_data
+            self._notify_changes()
+
+    def online_change(self) -> None:
+        """Simulate an online change: the symbol version is incremented, the handles and the device notifications
+        by handle become invalid."""
+        with self.__lock:
+            self.__handles.clear()
+            for handle, notification in list(self.__notifications.items()):
+                if notification.index_group == IndexGroup.SYMVAL_BYHANDLE.value:
+                    del self.__notifications[handle]
+            self.symbol_version = (self.symbol_version + 1) % 256
+            self._notify_changes()
+
+    def inject_error(self, error_code: ADSErrorCode, *, command: Optional[ADSCommand] = None, count: int = 1) -> None:
+        """Answer the next `count` requests of `command`, or of any command, with `error_code` in the AMS header."""
+        with self.__lock:
+            self.__faults.append(_Fault(command=command, count=count, error_code=error_code))
+
+    def drop_responses(self, *, command: Optional[ADSCommand] = None, count: int = 1) -> None:
+        """Do not answer the next `count` requests of `command`, or of any command."""
+        with self.__lock:
+            self.__faults.append(_Fault(command=command, count=count, error_code=None))
+
+    @property
+    def handle_count(self) -> int:
+        """Number of variable handles which are currently valid."""
+        with self.__lock:
+            return len(self.__handles)
+
+    @property
+    def notification_count(self) -> int:
+        """Number of device notifications which are currently registered."""
+        with self.__lock:
+            return len(self.__notifications)
+
+    def _accept_background(self) -> None:
+        assert self.__server_socket is not None
+        while True:
+            try:
+                sock, address = self.__server_socket.accept()
+            except OSError:
+                return
+            self.__logger.debug(f"Client connected: {address}")
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            connection = _Connection(self, sock)
+            with self.__lock:
+                self.__connections.append(connection)
+            connection.start()
+
+    def _remove_connection(self, connection: _Connection) -> None:
+        with self.__lock:
+            if connection in self.__connections:
+                self.__connections.remove(connection)
+            for handle in [h for h, n in self.__notifications.items() if n.connection is connection]:
+                del self.__notifications[handle]
+        connection.close()
+
+    def _delay(self) -> float:
+        if self.jitter_s == 0:
+            return self.latency_s
+        return self.latency_s + self.__random.uniform(0, self.jitter_s)
+
+    def _take_fault(self, command: Optional[ADSCommand]) -> Optional[_Fault]:
+        with self.__lock:
+            for fault in self.__faults:
+                if fault.command is None or fault.command is command:
+                    fault.count -= 1
+                    if fault.count <= 0:
+                        self.__faults.remove(fault)
+                    return fault
+        return None
+
+    def _handle_packet(self, connection: _Connection, packet: bytes) -> None:
+        command_value, _, _, _, invoke_id = _AMS_HEADER_VARIABLE_FIELDS.unpack_from(packet, 16)
+        body = packet[_AMS_HEADER_LENGTH:]
+        # the response goes back to the source of the request
+        addressing = packet[8:16] + packet[0:8]
+        try:
+            command: Optional[ADSCommand] = ADSCommand(command_value)
+        except ValueError:
+            command = None
+
+        fault = self._take_fault(command)
+        if fault is not None and fault.error_code is None:
+            return
+        notifications: List[_Notification] = []
+        if fault is not None and fault.error_code is not None:
+            error_code, response = fault.error_code, b""
+        elif command is ADSCommand.ADSSRVID_ADDDEVICENOTE:
+            error_code = ADSErrorCode.ERR_NOERROR
+            response, notifications = self._add_device_notification(connection, addressing, body)
+        elif (
+            command is ADSCommand.ADSSRVID_READWRITE
+            and struct.unpack_from("< I", body)[0] == IndexGroup.SUMUP_ADDDEVNOTE.value
+        ):
+            error_code = ADSErrorCode.ERR_NOERROR
+            response, notifications = self._sum_add_device_notification(connection, addressing, body)
+        elif command in self.__commands:
+            assert command is not None
+            error_code, response = ADSErrorCode.ERR_NOERROR, self.__commands[command](body)
+        else:
+            error_code, response = ADSErrorCode.ERR_UNKNOWNCMDID, b""
+
+        header = addressing + _AMS_HEADER_VARIABLE_FIELDS.pack(
+            command_value, _RESPONSE_STATE_FLAGS, len(response), error_code.value, invoke_id
+        )
+        frame = _AMS_TCP_HEADER.pack(0, _AMS_HEADER_LENGTH + len(response)) + header + response
+        delay_s = self._delay()
+        connection.schedule(frame, delay_s)
+
+        if notifications:
+            # like TwinCAT, the current value is sent right after the notification was added
+            with self.__lock:
+                for notification in notifications:
+                    self._send_notification(notification, delay_s)
+
+    def _read_device_info(self, body: bytes) -> bytes:
+        major, minor, build = self.version
+        return ADSReadDeviceInfoResponse(
+            result=ADSErrorCode.ERR_NOERROR,
+            major_version=major,
+            minor_version=minor,
+            build_version=build,
+            device_name=self.device_name,
+        ).to_bytes()
+
+    def _read_state(self, body: bytes) -> bytes:
+        return struct.pack("< I H H", ADSErrorCode.ERR_NOERROR.value, self.ads_state.value, self.device_state)
+
+    def _write_control(self, body: bytes) -> bytes:
+        ads_state, device_state, _ = struct.unpack_from("< H H I", body)
+        try:
+            state = ADSState(ads_state)
+        except ValueError:
+            return struct.pack("< I", ADSErrorCode.ADSERR_DEVICE_INVALIDPARM.value)
+        with self.__lock:
+            self.ads_state = state
+            self.device_state = device_state
+            self._notify_changes()
+        return struct.pack("< I", ADSErrorCode.ERR_NOERROR.value)
+
+    def _read(self, body: bytes) -> bytes:
+        index_group, index_offset, length = struct.unpack_from("< I I I", body)
+        error_code, data = self._read_item(index_group, index_offset, length)
+        return struct.pack("< I I", error_code.value, len(data)) + data
+
+    def _write(self, body: bytes) -> bytes:
+        index_group, index_offset, length = struct.unpack_from("< I I I", body)
+        error_code = self._write_item(index_group, index_offset, body[12 : 12 + length])
+        return struct.pack("< I", error_code.value)
+
+    def _read_write(self, body: bytes) -> bytes:
+        index_group, index_offset, read_length, write_length = struct.unpack_from("< I I I I", body)
+        error_code, data = self._read_write_item(index_group, index_offset, read_length, body[16 : 16 + write_length])
+        return struct.pack("< I I", error_code.value, len(data)) + data
+
+    def _resolve(self, index_group: int, index_offset: int, length: int) -> Tuple[ADSErrorCode, int]:
+        """Resolve an index group and offset to an offset in the data area."""
+        if index_group == IndexGroup.SYMVAL_BYHANDLE.value:
+            symbol = self.__handles.get(index_offset)
+            if symbol is None:
+                return ADSErrorCode.ADSERR_DEVICE_SYMBOLNOTFOUND, 0
+            if length > symbol.plc_t.bytes_length:
+                return ADSErrorCode.ADSERR_DEVICE_INVALIDSIZE, 0
+            return ADSErrorCode.ERR_NOERROR, symbol.offset
+        if index_group == DATA_INDEX_GROUP:
+            if index_offset > len(self.__memory):
+                return ADSErrorCode.ADSERR_DEVICE_INVALIDOFFSET, 0
+            if index_offset + length > len(self.__memory):
+                return ADSErrorCode.ADSERR_DEVICE_INVALIDSIZE, 0
+            return ADSErrorCode.ERR_NOERROR, index_offset
+        return ADSErrorCode.ADSERR_DEVICE_INVALIDGRP, 0
+
+    def _read_item(self, index_group: int, index_offset: int, length: int) -> _Result:
+        if index_group in (
+            IndexGroup.SYM_UPLOADINFO2.value,
+            IndexGroup.SYM_UPLOAD.value,
+            IndexGroup.SYM_DT_UPLOAD.value,
+        ):
+            return self._symbol_upload(index_group, length)
+        if index_group == IndexGroup.SYM_VERSION.value:
+            with self.__lock:
+                return ADSErrorCode.ERR_NOERROR, bytes([self.symbol_version])[:length]
+        with self.__lock:
+            error_code, offset = self._resolve(index_group, index_offset, length)
+            if error_code is not ADSErrorCode.ERR_NOERROR:
+                return error_code, b""
+            return error_code, bytes(self.__memory[offset : offset + length])
+
+    def _symbol_upload(self, index_group: int, length: int) -> _Result:
+        with self.__lock:
+            entries = b"".join(
+                ADSSymbolEntry(
+                    index_group=DATA_INDEX_GROUP,
+                    index_offset=symbol.offset,
+                    size=symbol.plc_t.bytes_length,
+                    data_type=plc_ads_data_type(symbol.plc_t).value,
+                    flags=0,
+                    name=symbol.name,
+                    type_name=symbol.type_name,
+                    comment="",
+                ).to_bytes()
+                for symbol in self.__symbols.values()
+            )
+            symbol_count = len(self.__symbols)
+            data_types = b"".join(entry.to_bytes() for entry in self.__data_types.values())
+            data_type_count = len(self.__data_types)
+        if index_group == IndexGroup.SYM_UPLOADINFO2.value:
+            data = ADSSymbolUploadInfo(
+                symbol_count=symbol_count,
+                symbol_size=len(entries),
+                data_type_count=data_type_count,
+                data_type_size=len(data_types),
+                max_dynamic_symbol_count=0,
+                used_dynamic_symbol_count=0,
+            ).to_bytes()
+        elif index_group == IndexGroup.SYM_UPLOAD.value:
+            data = entries
+        else:
+            data = data_types
+        if length < len(data):
+            return ADSErrorCode.ADSERR_DEVICE_INVALIDSIZE, b""
+        return ADSErrorCode.ERR_NOERROR, data
+
+    def _write_item(self, index_group: int, index_offset: int, data: bytes) -> ADSErrorCode:
+        with self.__lock:
+            if index_group == IndexGroup.RELEASE_SYMHANDLE.value:
+                handle = int.from_bytes(data[:4], byteorder="little", signed=False)
+                if self.__handles.pop(handle, None) is None:
+                    return ADSErrorCode.ADSERR_DEVICE_NOTFOUND
+                return ADSErrorCode.ERR_NOERROR
+            error_code, offset = self._resolve(index_group, index_offset, len(data))
+            if error_code is not ADSErrorCode.ERR_NOERROR:
+                return error_code
+            self.__memory[offset : offset + len(data)] = data
+            self._notify_changes()
+            return error_code
+
+    def _read_write_item(self, index_group: int, index_offset: int, read_length: int, data: bytes) -> _Result:
+        if index_group == IndexGroup.GET_SYMHANDLE_BYNAME.value:
+            name = data.split(b"\x00", 1)[0].decode()
+            with self.__lock:
+                symbol = self.__symbols.get(name.lower())
+                if symbol is None:
+                    return ADSErrorCode.ADSERR_DEVICE_SYMBOLNOTFOUND, b""
+                handle = self.__next_handle
+                self.__next_handle += 1
+                self.__handles[handle] = symbol
+            return ADSErrorCode.ERR_NOERROR, struct.pack("< I", handle)
+        if index_group == IndexGroup.SYM_DT_INFOBYNAMEEX.value:
+            name = data.split(b"\x00", 1)[0].decode()
+            with self.__lock:
+                entry = self.__data_types.get(name.lower())
+            if entry is None:
+                return ADSErrorCode.ADSERR_DEVICE_SYMBOLNOTFOUND, b""
+            raw_entry = entry.to_bytes()
+            if read_length < len(raw_entry):
+                return ADSErrorCode.ADSERR_DEVICE_INVALIDSIZE, b""
+            return ADSErrorCode.ERR_NOERROR, raw_entry
+        if index_group == IndexGroup.SUMUP_READ.value:
+            return ADSErrorCode.ERR_NOERROR, self._sum_read(index_offset, data)
+        if index_group == IndexGroup.SUMUP_WRITE.value:
+            return ADSErrorCode.ERR_NOERROR, self._sum_write(index_offset, data)
+        if index_group == IndexGroup.SUMUP_READWRITE.value:
+            return ADSErrorCode.ERR_NOERROR, self._sum_read_write(index_offset, data)
+        if index_group == IndexGroup.SUMUP_DELDEVNOTE.value:
+            return ADSErrorCode.ERR_NOERROR, self._sum_del_device_notification(index_offset, data)
+        return ADSErrorCode.ADSERR_DEVICE_INVALIDGRP, b""
+
+    def _sum_read(self, count: int, data: bytes) -> bytes:
+        error_codes = bytearray()
+        values = bytearray()
+        for i in range(count):
+            index_group, index_offset, length = struct.unpack_from("< I I I", data, 12 * i)
+            error_code, value = self._read_item(index_group, index_offset, length)
+            error_codes += struct.pack("< I", error_code.value)
+            values += value.ljust(length, b"\x00")
+        return bytes(error_codes + values)
+
+    def _sum_write(self, count: int, data: bytes) -> bytes:
+        error_codes = bytearray()
+        offset = 12 * count
+        for i in range(count):
+            index_group, index_offset, length = struct.unpack_from("< I I I", data, 12 * i)
+            error_code = self._write_item(index_group, index_offset, data[offset : offset + length])
+            offset += length
+            error_codes += struct.pack("< I", error_code.value)
+        return bytes(error_codes)
+
+    def _sum_read_write(self, count: int, data: bytes) -> bytes:
+        headers = bytearray()
+        values = bytearray()
+        offset = 16 * count
+        for i in range(count):
+            index_group, index_offset, read_length, write_length = struct.unpack_from("< I I I I", data, 16 * i)
+            write_data = data[offset : offset + write_length]
+            offset += write_length
+            error_code, value = self._read_write_item(index_group, index_offset, read_length, write_data)
+            headers += struct.pack("< I I", error_code.value, len(value))
+            values += value
+        return bytes(headers + values)
+
+    def _add_device_notification(
+        self, connection: _Connection, addressing: bytes, body: bytes
+    ) -> Tuple[bytes, List[_Notification]]:
+        error_code, handle, notification = self._add_device_notification_item(connection, addressing, body, 0)
+        return struct.pack("< I I", error_code.value, handle), [] if notification is None else [notification]
+
+    def _sum_add_device_notification(
+        self, connection: _Connection, addressing: bytes, body: bytes
+    ) -> Tuple[bytes, List[_Notification]]:
+        _, count, _, write_length = struct.unpack_from("< I I I I", body)
+        results = bytearray()
+        notifications: List[_Notification] = []
+        for i in range(count):
+            error_code, handle, notification = self._add_device_notification_item(
+                connection, addressing, body, 16 + 40 * i
+            )
+            results += struct.pack("< I I", error_code.value, handle)
+            if notification is not None:
+                notifications.append(notification)
+        return struct.pack("< I I", ADSErrorCode.ERR_NOERROR.value, len(results)) + bytes(results), notifications
+
+    def _add_device_notification_item(
+        self, connection: _Connection, addressing: bytes, body: bytes, body_offset: int
+    ) -> Tuple[ADSErrorCode, int, Optional[_Notification]]:
+        index_group, index_offset, length, mode, _, cycle_time_ms = struct.unpack_from(
+            "< I I I I I I", body, body_offset
+        )
+        with self.__lock:
+            if index_group in (IndexGroup.SYM_VERSION.value, IndexGroup.DEVICE_DATA.value):
+                error_code, offset = ADSErrorCode.ERR_NOERROR, index_offset
+            else:
+                error_code, offset = self._resolve(index_group, index_offset, length)
+            try:
+                transmission_mode = TransmissionMode(mode)
+            except ValueError:
+                transmission_mode = TransmissionMode.ADSTRANS_NOTRANS
+            if error_code is ADSErrorCode.ERR_NOERROR and transmission_mode not in (
+                TransmissionMode.ADSTRANS_SERVERCYCLE,
+                TransmissionMode.ADSTRANS_SERVERONCHA,
+            ):
+                error_code = ADSErrorCode.ADSERR_DEVICE_TRANSMODENOTSUPP
+            if error_code is not ADSErrorCode.ERR_NOERROR:
+                return error_code, 0, None
+
+            handle = self.__next_notification_handle
+            self.__next_notification_handle += 1
+            notification = _Notification(
+                handle=handle,
+                connection=connection,
+                addressing=addressing,
+                index_group=index_group,
+                offset=offset,
+                length=length,
+                transmission_mode=transmission_mode,
+                cycle_time_s=max(cycle_time_ms, 1) / 1000,
+                next_due=time.monotonic() + max(cycle_time_ms, 1) / 1000,
+            )
+            self.__notifications[handle] = notification
+            self.__cyclic_condition.notify()
+        return ADSErrorCode.ERR_NOERROR, handle, notification
+
+    def _del_device_notification(self, body: bytes) -> bytes:
+        (handle,) = struct.unpack_from("< I", body)
+        return struct.pack("< I", self._del_device_notification_item(handle).value)
+
+    def _sum_del_device_notification(self, count: int, data: bytes) -> bytes:
+        handles = struct.unpack_from(f"< {count}I", data)
+        return b"".join(struct.pack("< I", self._del_device_notification_item(handle).value) for handle in handles)
+
+    def _del_device_notification_item(self, handle: int) -> ADSErrorCode:
+        with self.__lock:
+            if self.__notifications.pop(handle, None) is None:
+                return ADSErrorCode.ADSERR_DEVICE_NOTIFYHNDINVALID
+        return ADSErrorCode.ERR_NOERROR
+
+    def _send_notification(self, notification: _Notification, delay_s: Optional[float] = None) -> None:
+        """Send the current value of the notification, must be called with the lock held."""
+        data = self._notification_data(notification)
+        notification.last_data = data
+        sample = struct.pack("< I I", notification.handle, len(data)) + data
+        stamp = struct.pack("< Q I", _filetime_now(), 1) + sample
+        body = struct.pack("< I I", 4 + len(stamp), 1) + stamp
+        header = notification.addressing + _AMS_HEADER_VARIABLE_FIELDS.pack(
+            ADSCommand.ADSSRVID_DEVICENOTE.value, _REQUEST_STATE_FLAGS, len(body), 0, 0
+        )
+        frame = _AMS_TCP_HEADER.pack(0, _AMS_HEADER_LENGTH + len(body)) + header + body
+        notification.connection.schedule(frame, self._delay() if delay_s is None else delay_s)
+
+    def _notify_changes(self) -> None:
+        """Send on change notifications whose value changed, must be called with the lock held."""
+        for notification in self.__notifications.values():
+            if notification.transmission_mode is not TransmissionMode.ADSTRANS_SERVERONCHA:
+                continue
+            if self._notification_data(notification) != notification.last_data:
+                self._send_notification(notification)
+
+    def _notification_data(self, notification: _Notification) -> bytes:
+        if notification.index_group == IndexGroup.SYM_VERSION.value:
+            data = bytes([self.symbol_version])
+        elif notification.index_group == IndexGroup.DEVICE_DATA.value:
+            data = struct.pack("< H H", self.ads_state.value, self.device_state)[notification.offset :]
+        else:
+            return bytes(self.__memory[notification.offset : notification.offset + notification.length])
+        return data[: notification.length].ljust(notification.length, b"\x00")
+
+    def _cyclic_notifications_background(self) -> None:
+        with self.__lock:
+            while self.__running:
+                now = time.monotonic()
+                timeout: Optional[float] = None
+                for notification in self.__notifications.values():
+                    if notification.transmission_mode is not TransmissionMode.ADSTRANS_SERVERCYCLE:
+                        continue
+                    if notification.next_due <= now:
+                        self._send_notification(notification)
+                        notification.next_due = max(notification.next_due + notification.cycle_time_s, now)
+                    wait = notification.next_due - now
+                    timeout = wait if timeout is None else min(timeout, wait)
+                self.__cyclic_condition.wait(timeout)
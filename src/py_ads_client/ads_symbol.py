@@ -1,4 +1,4 @@
-from typing import Generic, TypeVar
+from typing import Generic, Optional, TypeVar
 
 from .types import PLCData
 
@@ -6,9 +6,20 @@ T = TypeVar("T", bound=PLCData, covariant=True)
 
 
 class ADSSymbol(Generic[T]):
-    def __init__(self, name: str, plc_t: T) -> None:
+    """A PLC variable, accessed by a handle of its name.
+
+    If `index_group` and `index_offset` are given, e.g. of the symbol upload, the variable is read and written
+    at this address directly, without getting and releasing a handle.
+    """
+
+    def __init__(
+        self, name: str, plc_t: T, *, index_group: Optional[int] = None, index_offset: Optional[int] = None
+    ) -> None:
+        assert (index_group is None) == (index_offset is None), "Either both index group and offset or none"
         self.__name = name
         self.__plc_t = plc_t
+        self.__index_group = index_group
+        self.__index_offset = index_offset
 
     @property
     def name(self) -> str:
@@ -17,3 +28,11 @@ class ADSSymbol(Generic[T]):
     @property
     def plc_t(self) -> T:
         return self.__plc_t
+
+    @property
+    def index_group(self) -> Optional[int]:
+        return self.__index_group
+
+    @property
+    def index_offset(self) -> Optional[int]:
+        return self.__index_offset
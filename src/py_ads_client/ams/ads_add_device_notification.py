@@ -1,10 +1,10 @@
 import struct
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Tuple, Union
 
 from typing_extensions import Self
 
-from ..constants.index_group import IndexGroup
+from ..constants.index_group import IndexGroup, index_group_value
 from ..constants.return_code import ADSErrorCode
 from ..constants.transmission_mode import TransmissionMode
 
@@ -17,7 +17,7 @@ from ..constants.transmission_mode import TransmissionMode
 
 @dataclass()
 class ADSAddDeviceNotificationRequest:
-    index_group: IndexGroup
+    index_group: Union[IndexGroup, int]
     index_offset: int
     """Index Offset, in which the data should be written."""
     length: int
@@ -33,7 +33,7 @@ class ADSAddDeviceNotificationRequest:
         format = "< I I I I I I 16s"
         return struct.pack(
             format,
-            self.index_group.value,
+            index_group_value(self.index_group),
             self.index_offset,
             self.length,
             self.transmission_mode.value,
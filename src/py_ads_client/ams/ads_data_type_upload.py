@@ -0,0 +1,128 @@
+import struct
+from dataclasses import dataclass, field
+from typing import Iterator, List, Tuple
+
+from typing_extensions import Self
+
+from ..constants.encoding import TWINCAT_STRING_ENCODING
+
+# Data type upload, read with the index groups SYM_DT_UPLOAD and SYM_DT_INFOBYNAMEEX
+# https://infosys.beckhoff.com/content/1033/tc3_adsdll2/117558283.html
+#
+# C++ AdsDatatypeEntry struct: entry length, version, hash value, type hash value, size, offset, data type, flags,
+#     name length, type length, comment length, array dimensions and number of sub items,
+#     followed by the null-terminated name, type and comment, the lower bound and the number of elements
+#     of every array dimension and the entries of the sub items,
+#     optional extended data fills the entry up to the entry length
+
+DATA_TYPE_ENTRY_HEADER = struct.Struct("< I I I I I I I I H H H H H")
+ARRAY_INFO = struct.Struct("< i I")
+
+
+@dataclass()
+class ADSDataTypeEntry:
+    name: str
+    """Name of the data type, or of the field for a sub item."""
+    type_name: str
+    """Name of the base type: the item type of an array, the type of a field or an alias, empty for a struct."""
+    size: int
+    """Size of a value in bytes."""
+    offset: int = 0
+    """Offset of the field in the struct, for a sub item."""
+    data_type: int = 0
+    """`ADSDataType` value, ADST_BIGTYPE for structures and arrays."""
+    flags: int = 0
+    comment: str = ""
+    array_info: List[Tuple[int, int]] = field(default_factory=list)
+    """Lower bound and number of elements of every array dimension, the first dimension first."""
+    sub_items: List["ADSDataTypeEntry"] = field(default_factory=list)
+    """The fields of a struct or function block."""
+    version: int = 1
+
+    @classmethod
+    def from_bytes(cls, data: bytes, offset: int = 0) -> Tuple[Self, int]:
+        """Parse the entry at `offset`, returns the entry and the offset of the next entry."""
+        (
+            entry_length,
+            version,
+            _hash_value,
+            _type_hash_value,
+            size,
+            item_offset,
+            data_type,
+            flags,
+            name_length,
+            type_length,
+            comment_length,
+            array_dimensions,
+            sub_item_count,
+        ) = DATA_TYPE_ENTRY_HEADER.unpack_from(data, offset)
+        start = offset + DATA_TYPE_ENTRY_HEADER.size
+        name = data[start : start + name_length].decode(TWINCAT_STRING_ENCODING)
+        start += name_length + 1
+        type_name = data[start : start + type_length].decode(TWINCAT_STRING_ENCODING)
+        start += type_length + 1
+        comment = data[start : start + comment_length].decode(TWINCAT_STRING_ENCODING)
+        start += comment_length + 1
+        array_info: List[Tuple[int, int]] = []
+        for _ in range(array_dimensions):
+            array_info.append(ARRAY_INFO.unpack_from(data, start))
+            start += ARRAY_INFO.size
+        sub_items: List["ADSDataTypeEntry"] = []
+        for _ in range(sub_item_count):
+            sub_item, start = cls.from_bytes(data, start)
+            sub_items.append(sub_item)
+        entry = cls(
+            name=name,
+            type_name=type_name,
+            size=size,
+            offset=item_offset,
+            data_type=data_type,
+            flags=flags,
+            comment=comment,
+            array_info=array_info,
+            sub_items=sub_items,
+            version=version,
+        )
+        return entry, offset + entry_length
+
+    def to_bytes(self) -> bytes:
+        name = self.name.encode(TWINCAT_STRING_ENCODING)
+        type_name = self.type_name.encode(TWINCAT_STRING_ENCODING)
+        comment = self.comment.encode(TWINCAT_STRING_ENCODING)
+        body = b"".join(
+            [
+                name + b"\x00" + type_name + b"\x00" + comment + b"\x00",
+                *(ARRAY_INFO.pack(lower_bound, elements) for lower_bound, elements in self.array_info),
+                *(sub_item.to_bytes() for sub_item in self.sub_items),
+            ]
+        )
+        # TwinCAT aligns the entries to 4 bytes
+        entry_length = (DATA_TYPE_ENTRY_HEADER.size + len(body) + 3) // 4 * 4
+        header = DATA_TYPE_ENTRY_HEADER.pack(
+            entry_length,
+            self.version,
+            0,
+            0,
+            self.size,
+            self.offset,
+            self.data_type,
+            self.flags,
+            len(name),
+            len(type_name),
+            len(comment),
+            len(self.array_info),
+            len(self.sub_items),
+        )
+        return (header + body).ljust(entry_length, b"\x00")
+
+
+def parse_data_type_entries(data: bytes) -> Iterator[ADSDataTypeEntry]:
+    """Parse the response of the data type upload."""
+    offset = 0
+    while offset + DATA_TYPE_ENTRY_HEADER.size <= len(data):
+        entry, next_offset = ADSDataTypeEntry.from_bytes(data, offset)
+        if next_offset <= offset:
+            return
+        yield entry
+        offset = next_offset
@@ -1,12 +1,43 @@
+import functools
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import List
+from typing import TYPE_CHECKING, Any, List
 
 from typing_extensions import Self
 
+if TYPE_CHECKING:
+    import numpy as np
+
 # C++ AdsNotificationHeader struct
 # https://infosys.beckhoff.com/content/1033/tc3_adsdll2/117554827.html
 
+# A file time is a 64-bit value that represents the number of 100-nanosecond intervals that have elapsed
+# since 12:00 A.M. January 1, 1601 Coordinated Universal Time (UTC).
+EPOCH_AS_FILETIME = 116444736000000000  # January 1, 1970 as MS file time
+_UNIX_EPOCH = datetime.fromtimestamp(0, tz=timezone.utc)
+
+
+def filetime_to_unix_ns(filetime: int) -> int:
+    """Nanoseconds since January 1, 1970 UTC."""
+    return (filetime - EPOCH_AS_FILETIME) * 100
+
+
+def datetime_to_filetime(value: datetime) -> int:
+    """File time of a timezone-aware datetime, naive datetimes are taken as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return EPOCH_AS_FILETIME + (value - _UNIX_EPOCH) // timedelta(microseconds=1) * 10
+
+
+@functools.lru_cache(maxsize=1024)
+def filetime_to_datetime(filetime: int) -> datetime:
+    """UTC datetime with microsecond resolution.
+
+    Cached, because all samples of a stamp, and usually the stamps of several notifications, share a file time.
+    """
+    unix_timestamp_us = (filetime - EPOCH_AS_FILETIME) // 10
+    return _UNIX_EPOCH + timedelta(microseconds=unix_timestamp_us)
+
 
 @dataclass()
 class AdsNotificationSample:
@@ -16,11 +47,12 @@ class AdsNotificationSample:
 
     @property
     def update_time(self) -> datetime:
-        # A file time is a 64-bit value that represents the number of 100-nanosecond intervals that have elapsed
-        # since 12:00 A.M. January 1, 1601 Coordinated Universal Time (UTC).
-        EPOCH_AS_FILETIME = 116444736000000000  # January 1, 1970 as MS file time
-        unix_timestamp_us = (self.timestamp - EPOCH_AS_FILETIME) // 10
-        return datetime.fromtimestamp(0, tz=timezone.utc) + timedelta(microseconds=unix_timestamp_us)
+        return filetime_to_datetime(self.timestamp)
+
+    @property
+    def update_time_ns(self) -> int:
+        """Update time in nanoseconds since January 1, 1970 UTC."""
+        return filetime_to_unix_ns(self.timestamp)
 
 
 @dataclass()
@@ -49,3 +81,21 @@ class ADSDeviceNotificationResponse:
                 offset += 8 + sample_size
 
         return cls(samples=samples)
+
+    def timestamps_ns(self) -> List[int]:
+        """Update time of every sample in nanoseconds since January 1, 1970 UTC."""
+        return [(sample.timestamp - EPOCH_AS_FILETIME) * 100 for sample in self.samples]
+
+    def timestamps_datetime64(self) -> "np.ndarray[Any, np.dtype[np.datetime64]]":
+        """Update time of every sample as a `datetime64[ns]` NumPy array, converted in one vectorised operation."""
+        return filetimes_to_datetime64([sample.timestamp for sample in self.samples])
+
+
+def filetimes_to_datetime64(filetimes: Any) -> "np.ndarray[Any, np.dtype[np.datetime64]]":
+    """Convert a sequence or an array of file times to a `datetime64[ns]` NumPy array."""
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("NumPy is required for datetime64 timestamps, install it with `pip install numpy`") from e
+    unix_ns = (numpy.asarray(filetimes, dtype=numpy.int64) - EPOCH_AS_FILETIME) * 100
+    return unix_ns.view("datetime64[ns]")
@@ -1,10 +1,10 @@
 import struct
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Tuple, Union
 
 from typing_extensions import Self
 
-from ..constants.index_group import IndexGroup
+from ..constants.index_group import IndexGroup, index_group_value
 from ..constants.return_code import ADSErrorCode
 
 # AMS Read network packet
@@ -13,7 +13,7 @@ from ..constants.return_code import ADSErrorCode
 
 @dataclass()
 class ADSReadRequest:
-    index_group: IndexGroup
+    index_group: Union[IndexGroup, int]
     index_offset: int
     length: int
     """Length of the data (in bytes) which should be read."""
@@ -22,7 +22,7 @@ class ADSReadRequest:
         format = "< I I I"
         return struct.pack(
             format,
-            self.index_group.value,
+            index_group_value(self.index_group),
             self.index_offset,
             self.length,
         )
@@ -1,11 +1,11 @@
 import struct
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Tuple, Union
 
 from typing_extensions import Self
 
 from ..constants.encoding import TWINCAT_STRING_ENCODING
-from ..constants.index_group import IndexGroup
+from ..constants.index_group import IndexGroup, index_group_value
 from ..constants.return_code import ADSErrorCode
 
 # ADS Read Write packet
@@ -14,7 +14,7 @@ from ..constants.return_code import ADSErrorCode
 
 @dataclass()
 class ADSReadWriteRequest:
-    index_group: IndexGroup
+    index_group: Union[IndexGroup, int]
     """Index Group, in which the data should be written."""
     index_offset: int
     """Index Offset, in which the data should be written."""
@@ -28,7 +28,7 @@ class ADSReadWriteRequest:
         format = f"< I I I I {write_length}s"
         return struct.pack(
             format,
-            self.index_group.value,
+            index_group_value(self.index_group),
             self.index_offset,
             self.read_length,
             write_length,
@@ -45,6 +45,16 @@ class ADSReadWriteRequest:
             write_data=data,
         )
 
+    @classmethod
+    def data_type_info_by_name(cls, name: str, read_length: int = 0xFFFF) -> Self:
+        data = name.encode(encoding=TWINCAT_STRING_ENCODING) + b"\x00"
+        return cls(
+            index_group=IndexGroup.SYM_DT_INFOBYNAMEEX,
+            index_offset=0,
+            read_length=read_length,
+            write_data=data,
+        )
+
 
 @dataclass()
 class ADSReadWriteResponse:
@@ -0,0 +1,44 @@
+from typing import Callable, Dict, Optional, Union
+
+from ..constants.command_id import ADSCommand
+from .ads_add_device_notification import ADSAddDeviceNotificationResponse
+from .ads_delete_device_notification import ADSDeleteDeviceNotificationResponse
+from .ads_read import ADSReadResponse
+from .ads_read_device_info import ADSReadDeviceInfoResponse
+from .ads_read_state import ADSReadStateResponse
+from .ads_read_write import ADSReadWriteResponse
+from .ads_write import ADSWriteResponse
+from .ads_write_control import ADSWriteControlResponse
+
+ADSResponse = Union[
+    ADSReadResponse,
+    ADSReadDeviceInfoResponse,
+    ADSReadWriteResponse,
+    ADSWriteResponse,
+    ADSAddDeviceNotificationResponse,
+    ADSDeleteDeviceNotificationResponse,
+    ADSReadStateResponse,
+    ADSWriteControlResponse,
+]
+
+_RESPONSE_PARSERS: Dict[ADSCommand, Callable[[bytes], ADSResponse]] = {
+    ADSCommand.ADSSRVID_READDEVICEINFO: ADSReadDeviceInfoResponse.from_bytes,
+    ADSCommand.ADSSRVID_READ: ADSReadResponse.from_bytes,
+    ADSCommand.ADSSRVID_WRITE: ADSWriteResponse.from_bytes,
+    ADSCommand.ADSSRVID_READSTATE: ADSReadStateResponse.from_bytes,
+    ADSCommand.ADSSRVID_WRITECTRL: ADSWriteControlResponse.from_bytes,
+    ADSCommand.ADSSRVID_ADDDEVICENOTE: ADSAddDeviceNotificationResponse.from_bytes,
+    ADSCommand.ADSSRVID_DELDEVICENOTE: ADSDeleteDeviceNotificationResponse.from_bytes,
+    ADSCommand.ADSSRVID_READWRITE: ADSReadWriteResponse.from_bytes,
+}
+
+
+def parse_ads_response(*, command_id: ADSCommand, data: bytes) -> Optional[ADSResponse]:
+    """Parse the ADS body of a response packet.
+
+    Returns `None` for commands which are not a response to a request, e.g. `ADSSRVID_DEVICENOTE`.
+    """
+    parser = _RESPONSE_PARSERS.get(command_id, None)
+    if parser is None:
+        return None
+    return parser(data)
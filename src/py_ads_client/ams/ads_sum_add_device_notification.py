@@ -0,0 +1,52 @@
+import struct
+from dataclasses import dataclass
+from typing import List, Sequence
+
+from typing_extensions import Self
+
+from ..constants.index_group import IndexGroup
+from ..constants.return_code import ADSErrorCode
+from .ads_add_device_notification import ADSAddDeviceNotificationRequest, ADSAddDeviceNotificationResponse
+from .ads_read_write import ADSReadWriteRequest
+
+# ADS Sum Add Device Notification, several ADS Add Device Notification requests packed into one ADS ReadWrite request
+#
+# write data: index group, index offset, length, transmission mode, max delay, cycle time and 16 reserved bytes
+#             of every sub request
+# read data: error code and notification handle of every sub request
+
+
+@dataclass()
+class ADSSumAddDeviceNotificationRequest:
+    items: List[ADSAddDeviceNotificationRequest]
+
+    @property
+    def read_length(self) -> int:
+        return 8 * len(self.items)
+
+    def to_read_write_request(self) -> ADSReadWriteRequest:
+        return ADSReadWriteRequest(
+            index_group=IndexGroup.SUMUP_ADDDEVNOTE,
+            index_offset=len(self.items),
+            read_length=self.read_length,
+            write_data=b"".join(item.to_bytes() for item in self.items),
+        )
+
+    def to_bytes(self) -> bytes:
+        return self.to_read_write_request().to_bytes()
+
+
+@dataclass()
+class ADSSumAddDeviceNotificationResponse:
+    results: List[ADSAddDeviceNotificationResponse]
+    """Result of every sub request, in the same order as the requested items."""
+
+    @classmethod
+    def from_bytes(cls, data: bytes, count: int) -> Self:
+        items: Sequence[int] = struct.unpack_from(f"< {2 * count}I", data)
+        return cls(
+            results=[
+                ADSAddDeviceNotificationResponse(result=ADSErrorCode(error_code), handle=handle)
+                for error_code, handle in zip(items[0::2], items[1::2])
+            ]
+        )
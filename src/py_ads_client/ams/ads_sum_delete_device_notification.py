@@ -0,0 +1,49 @@
+import struct
+from dataclasses import dataclass
+from typing import List, Sequence
+
+from typing_extensions import Self
+
+from ..constants.index_group import IndexGroup
+from ..constants.return_code import ADSErrorCode
+from .ads_delete_device_notification import ADSDeleteDeviceNotificationRequest, ADSDeleteDeviceNotificationResponse
+from .ads_read_write import ADSReadWriteRequest
+
+# ADS Sum Delete Device Notification, several ADS Delete Device Notification requests packed into one
+# ADS ReadWrite request
+#
+# write data: notification handle of every sub request
+# read data: error code of every sub request
+
+
+@dataclass()
+class ADSSumDeleteDeviceNotificationRequest:
+    items: List[ADSDeleteDeviceNotificationRequest]
+
+    @property
+    def read_length(self) -> int:
+        return 4 * len(self.items)
+
+    def to_read_write_request(self) -> ADSReadWriteRequest:
+        return ADSReadWriteRequest(
+            index_group=IndexGroup.SUMUP_DELDEVNOTE,
+            index_offset=len(self.items),
+            read_length=self.read_length,
+            write_data=b"".join(item.to_bytes() for item in self.items),
+        )
+
+    def to_bytes(self) -> bytes:
+        return self.to_read_write_request().to_bytes()
+
+
+@dataclass()
+class ADSSumDeleteDeviceNotificationResponse:
+    results: List[ADSDeleteDeviceNotificationResponse]
+    """Result of every sub request, in the same order as the requested items."""
+
+    @classmethod
+    def from_bytes(cls, data: bytes, count: int) -> Self:
+        error_codes: Sequence[int] = struct.unpack_from(f"< {count}I", data)
+        return cls(
+            results=[ADSDeleteDeviceNotificationResponse(result=ADSErrorCode(error_code)) for error_code in error_codes]
+        )
@@ -0,0 +1,59 @@
+import struct
+from dataclasses import dataclass
+from typing import List, Sequence
+
+from typing_extensions import Self
+
+from ..constants.index_group import IndexGroup
+from ..constants.return_code import ADSErrorCode
+from .ads_read import ADSReadRequest, ADSReadResponse
+from .ads_read_write import ADSReadWriteRequest
+
+# ADS Sum Read, several ADS read requests packed into one ADS ReadWrite request
+#
+# write data: index group, index offset and length of every sub request
+# read data: error code of every sub request, followed by the data of every sub request
+
+
+@dataclass()
+class ADSSumReadRequest:
+    items: List[ADSReadRequest]
+
+    @property
+    def read_length(self) -> int:
+        return sum(4 + item.length for item in self.items)
+
+    def to_read_write_request(self) -> ADSReadWriteRequest:
+        return ADSReadWriteRequest(
+            index_group=IndexGroup.SUMUP_READ,
+            index_offset=len(self.items),
+            read_length=self.read_length,
+            write_data=b"".join(item.to_bytes() for item in self.items),
+        )
+
+    def to_bytes(self) -> bytes:
+        return self.to_read_write_request().to_bytes()
+
+
+@dataclass()
+class ADSSumReadResponse:
+    results: List[ADSReadResponse]
+    """Result of every sub request, in the same order as the requested items."""
+
+    @classmethod
+    def from_bytes(cls, data: bytes, lengths: Sequence[int]) -> Self:
+        """Split the sum read response into the result of every sub request.
+
+        `lengths` is the requested data length of every sub request, the device always reserves that many bytes
+        per sub request, even if the sub request failed.
+        """
+        count = len(lengths)
+        error_codes: Sequence[int] = struct.unpack_from(f"< {count}I", data)
+        offset = 4 * count
+        results: List[ADSReadResponse] = []
+        for error_code, length in zip(error_codes, lengths):
+            result = ADSErrorCode(error_code)
+            item_data = data[offset : offset + length] if result == ADSErrorCode.ERR_NOERROR else b""
+            results.append(ADSReadResponse(result=result, data=item_data))
+            offset += length
+        return cls(results=results)
@@ -0,0 +1,57 @@
+import struct
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+from typing_extensions import Self
+
+from ..constants.index_group import IndexGroup, index_group_value
+from ..constants.return_code import ADSErrorCode
+from .ads_read_write import ADSReadWriteRequest, ADSReadWriteResponse
+
+# ADS Sum ReadWrite, several ADS ReadWrite requests packed into one ADS ReadWrite request
+#
+# write data: index group, index offset, read length and write length of every sub request,
+#             followed by the write data of every sub request
+# read data: error code and returned data length of every sub request, followed by the data of every sub request
+
+
+@dataclass()
+class ADSSumReadWriteRequest:
+    items: List[ADSReadWriteRequest]
+
+    @property
+    def read_length(self) -> int:
+        return sum(8 + item.read_length for item in self.items)
+
+    def to_read_write_request(self) -> ADSReadWriteRequest:
+        s = struct.Struct("< I I I I")
+        headers = b"".join(
+            s.pack(index_group_value(item.index_group), item.index_offset, item.read_length, len(item.write_data))
+            for item in self.items
+        )
+        return ADSReadWriteRequest(
+            index_group=IndexGroup.SUMUP_READWRITE,
+            index_offset=len(self.items),
+            read_length=self.read_length,
+            write_data=headers + b"".join(item.write_data for item in self.items),
+        )
+
+    def to_bytes(self) -> bytes:
+        return self.to_read_write_request().to_bytes()
+
+
+@dataclass()
+class ADSSumReadWriteResponse:
+    results: List[ADSReadWriteResponse]
+    """Result of every sub request, in the same order as the requested items."""
+
+    @classmethod
+    def from_bytes(cls, data: bytes, count: int) -> Self:
+        items: Sequence[int] = struct.unpack_from(f"< {2 * count}I", data)
+        headers: List[Tuple[int, int]] = list(zip(items[0::2], items[1::2]))
+        offset = 8 * count
+        results: List[ADSReadWriteResponse] = []
+        for error_code, length in headers:
+            results.append(ADSReadWriteResponse(result=ADSErrorCode(error_code), data=data[offset : offset + length]))
+            offset += length
+        return cls(results=results)
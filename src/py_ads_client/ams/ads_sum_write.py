@@ -0,0 +1,50 @@
+import struct
+from dataclasses import dataclass
+from typing import List, Sequence
+
+from typing_extensions import Self
+
+from ..constants.index_group import IndexGroup, index_group_value
+from ..constants.return_code import ADSErrorCode
+from .ads_read_write import ADSReadWriteRequest
+from .ads_write import ADSWriteRequest, ADSWriteResponse
+
+# ADS Sum Write, several ADS write requests packed into one ADS ReadWrite request
+#
+# write data: index group, index offset and length of every sub request, followed by the data of every sub request
+# read data: error code of every sub request
+
+
+@dataclass()
+class ADSSumWriteRequest:
+    items: List[ADSWriteRequest]
+
+    @property
+    def read_length(self) -> int:
+        return 4 * len(self.items)
+
+    def to_read_write_request(self) -> ADSReadWriteRequest:
+        s = struct.Struct("< I I I")
+        headers = b"".join(
+            s.pack(index_group_value(item.index_group), item.index_offset, len(item.data)) for item in self.items
+        )
+        return ADSReadWriteRequest(
+            index_group=IndexGroup.SUMUP_WRITE,
+            index_offset=len(self.items),
+            read_length=self.read_length,
+            write_data=headers + b"".join(item.data for item in self.items),
+        )
+
+    def to_bytes(self) -> bytes:
+        return self.to_read_write_request().to_bytes()
+
+
+@dataclass()
+class ADSSumWriteResponse:
+    results: List[ADSWriteResponse]
+    """Result of every sub request, in the same order as the requested items."""
+
+    @classmethod
+    def from_bytes(cls, data: bytes, count: int) -> Self:
+        error_codes: Sequence[int] = struct.unpack_from(f"< {count}I", data)
+        return cls(results=[ADSWriteResponse(result=ADSErrorCode(error_code)) for error_code in error_codes])
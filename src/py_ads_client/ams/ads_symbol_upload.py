@@ -0,0 +1,124 @@
+import struct
+from dataclasses import dataclass
+from typing import Iterator, Tuple
+
+from typing_extensions import Self
+
+from ..constants.encoding import TWINCAT_STRING_ENCODING
+
+# Symbol upload, read with the index groups SYM_UPLOADINFO2 and SYM_UPLOAD
+# https://infosys.beckhoff.com/content/1033/tc3_adsdll2/117553803.html
+#
+# C++ AdsSymbolUploadInfo2 struct: number and size of the symbol and data type entries
+# C++ AdsSymbolEntry struct: entry length, index group, index offset, size, data type, flags, name length,
+#     type length and comment length, followed by the null-terminated name, type and comment,
+#     optional extended data fills the entry up to the entry length
+
+SYMBOL_ENTRY_HEADER = struct.Struct("< I I I I I I H H H")
+
+
+@dataclass()
+class ADSSymbolUploadInfo:
+    symbol_count: int
+    symbol_size: int
+    """Total size of the symbol entries in bytes, the read length of the symbol upload."""
+    data_type_count: int
+    data_type_size: int
+    """Total size of the data type entries in bytes, the read length of the data type upload."""
+    max_dynamic_symbol_count: int
+    used_dynamic_symbol_count: int
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        s = struct.Struct("< I I I I I I")
+        items: Tuple[int, int, int, int, int, int] = s.unpack(data[: s.size])
+        return cls(*items)
+
+    def to_bytes(self) -> bytes:
+        return struct.pack(
+            "< I I I I I I",
+            self.symbol_count,
+            self.symbol_size,
+            self.data_type_count,
+            self.data_type_size,
+            self.max_dynamic_symbol_count,
+            self.used_dynamic_symbol_count,
+        )
+
+
+@dataclass()
+class ADSSymbolEntry:
+    index_group: int
+    index_offset: int
+    size: int
+    """Size of the value in bytes."""
+    data_type: int
+    """`ADSDataType` value, ADST_BIGTYPE for structures and arrays."""
+    flags: int
+    """`SymbolFlag` values."""
+    name: str
+    type_name: str
+    comment: str
+
+    @classmethod
+    def from_bytes(cls, data: bytes, offset: int = 0) -> Tuple[Self, int]:
+        """Parse the entry at `offset`, returns the entry and the offset of the next entry."""
+        (
+            entry_length,
+            index_group,
+            index_offset,
+            size,
+            data_type,
+            flags,
+            name_length,
+            type_length,
+            comment_length,
+        ) = SYMBOL_ENTRY_HEADER.unpack_from(data, offset)
+        start = offset + SYMBOL_ENTRY_HEADER.size
+        name = data[start : start + name_length].decode(TWINCAT_STRING_ENCODING)
+        start += name_length + 1
+        type_name = data[start : start + type_length].decode(TWINCAT_STRING_ENCODING)
+        start += type_length + 1
+        comment = data[start : start + comment_length].decode(TWINCAT_STRING_ENCODING)
+        entry = cls(
+            index_group=index_group,
+            index_offset=index_offset,
+            size=size,
+            data_type=data_type,
+            flags=flags,
+            name=name,
+            type_name=type_name,
+            comment=comment,
+        )
+        return entry, offset + entry_length
+
+    def to_bytes(self) -> bytes:
+        name = self.name.encode(TWINCAT_STRING_ENCODING)
+        type_name = self.type_name.encode(TWINCAT_STRING_ENCODING)
+        comment = self.comment.encode(TWINCAT_STRING_ENCODING)
+        strings = name + b"\x00" + type_name + b"\x00" + comment + b"\x00"
+        # TwinCAT aligns the entries to 4 bytes
+        entry_length = (SYMBOL_ENTRY_HEADER.size + len(strings) + 3) // 4 * 4
+        header = SYMBOL_ENTRY_HEADER.pack(
+            entry_length,
+            self.index_group,
+            self.index_offset,
+            self.size,
+            self.data_type,
+            self.flags,
+            len(name),
+            len(type_name),
+            len(comment),
+        )
+        return (header + strings).ljust(entry_length, b"\x00")
+
+
+def parse_symbol_entries(data: bytes) -> Iterator[ADSSymbolEntry]:
+    """Parse the response of the symbol upload."""
+    offset = 0
+    while offset + SYMBOL_ENTRY_HEADER.size <= len(data):
+        entry, next_offset = ADSSymbolEntry.from_bytes(data, offset)
+        if next_offset <= offset:
+            return
+        yield entry
+        offset = next_offset
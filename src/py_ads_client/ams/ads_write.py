@@ -1,10 +1,10 @@
 import struct
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Tuple, Union
 
 from typing_extensions import Self
 
-from ..constants.index_group import IndexGroup
+from ..constants.index_group import IndexGroup, index_group_value
 from ..constants.return_code import ADSErrorCode
 
 # AMS Write network packet
@@ -13,7 +13,7 @@ from ..constants.return_code import ADSErrorCode
 
 @dataclass()
 class ADSWriteRequest:
-    index_group: IndexGroup
+    index_group: Union[IndexGroup, int]
     """Index Group, in which the data should be written."""
     index_offset: int
     """Index Offset, in which the data should be written."""
@@ -25,7 +25,7 @@ class ADSWriteRequest:
         format = f"< I I I {write_length}s"
         return struct.pack(
             format,
-            self.index_group.value,
+            index_group_value(self.index_group),
             self.index_offset,
             write_length,
             self.data,
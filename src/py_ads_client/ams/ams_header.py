@@ -1,6 +1,7 @@
 import struct
 from dataclasses import dataclass
-from typing import Tuple
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, Union
 
 from typing_extensions import Self
 
@@ -11,6 +12,27 @@ from ..constants.state_flag import StateFlag
 # AMS Header struct
 # https://infosys.beckhoff.com/content/1033/tc3_grundlagen/115847307.html
 
+AMS_HEADER_STRUCT = struct.Struct("< 6s H 6s H H H I I I")
+
+AMS_TCP_HEADER_LENGTH = 6
+"""reserved (2 bytes) and length (4 bytes) of the AMS/TCP header."""
+
+_AMS_FRAME_HEADER_STRUCT = struct.Struct("< H I 6s H 6s H H H I I I")
+_AMS_FRAME_LENGTH_STRUCT = struct.Struct("< I")
+_AMS_FRAME_VARIABLE_FIELDS_STRUCT = struct.Struct("< H H I I I")
+_AMS_FRAME_VARIABLE_FIELDS_OFFSET = AMS_TCP_HEADER_LENGTH + 16
+_AMS_HEADER_RESPONSE_FIELDS_STRUCT = struct.Struct("< H 2x I I I")
+_AMS_HEADER_RESPONSE_FIELDS_OFFSET = 16
+
+_ADS_COMMANDS: Dict[int, ADSCommand] = {command.value: command for command in ADSCommand}
+_ADS_COMMAND_VALUES: Dict[ADSCommand, int] = {command: command.value for command in ADSCommand}
+_ADSCMD_STATE_FLAGS = StateFlag.AMSCMDSF_ADSCMD.value
+
+
+@lru_cache(maxsize=None)
+def net_id_to_bytes(net_id: str) -> bytes:
+    return bytes(int(x) for x in net_id.split("."))
+
 
 @dataclass()
 class AMSHeader:
@@ -28,9 +50,8 @@ class AMSHeader:
     """Free usable 32 bit array. Usually this array serves to send an Id."""
 
     @classmethod
-    def from_bytes(cls, data: bytes) -> Self:
-        s = struct.Struct("< 6s H 6s H H H I I I")
-        items: Tuple[bytes, int, bytes, int, int, int, int, int, int] = s.unpack(data)
+    def from_bytes(cls, data: Union[bytes, memoryview]) -> Self:
+        items: Tuple[bytes, int, bytes, int, int, int, int, int, int] = AMS_HEADER_STRUCT.unpack(data)
         (
             target_net_id,
             target_port,
@@ -61,13 +82,10 @@ class AMSHeader:
         )
 
     def to_bytes(self) -> bytes:
-        target_net_id = bytes(int(x) for x in self.target_net_id.split("."))
-        source_net_id = bytes(int(x) for x in self.source_net_id.split("."))
-        return struct.pack(
-            "< 6s H 6s H H H I I I",
-            target_net_id,
+        return AMS_HEADER_STRUCT.pack(
+            net_id_to_bytes(self.target_net_id),
             self.target_port,
-            source_net_id,
+            net_id_to_bytes(self.source_net_id),
             self.source_port,
             self.command_id.value,
             self.state_flags.value,
@@ -75,3 +93,60 @@ class AMSHeader:
             self.error_code.value,
             self.invoke_id,
         )
+
+
+def unpack_ams_header_fields(data: Union[bytes, memoryview]) -> Tuple[Optional[ADSCommand], int, int, int]:
+    """Fast path to read the fields of an AMS header which are needed to handle a response.
+
+    Returns command id, length, error code and invoke id. The command id is looked up in a dict instead of
+    constructing the Enum and is `None` for unknown commands, the error code is returned as `int`,
+    so no Enum is constructed for the common `ERR_NOERROR` case.
+    """
+    command_id, length, error_code, invoke_id = _AMS_HEADER_RESPONSE_FIELDS_STRUCT.unpack_from(
+        data, _AMS_HEADER_RESPONSE_FIELDS_OFFSET
+    )
+    return _ADS_COMMANDS.get(command_id, None), length, error_code, invoke_id
+
+
+class AMSHeaderTemplate:
+    """Precompiled AMS/TCP header and AMS header for the requests of one connection.
+
+    The net ids and ports are packed once, a request only packs command id, length and invoke id
+    into a copy of the template.
+    """
+
+    def __init__(self, *, target_net_id: str, target_port: int, source_net_id: str, source_port: int) -> None:
+        self.__template = _AMS_FRAME_HEADER_STRUCT.pack(
+            0,
+            AMS_HEADER_STRUCT.size,
+            net_id_to_bytes(target_net_id),
+            target_port,
+            net_id_to_bytes(source_net_id),
+            source_port,
+            0,
+            StateFlag.AMSCMDSF_ADSCMD.value,
+            0,
+            ADSErrorCode.ERR_NOERROR.value,
+            0,
+        )
+        self.__header_length = len(self.__template)
+
+    def pack_frame(self, *, command_id: ADSCommand, invoke_id: int, payload: bytes) -> bytearray:
+        """Return the complete AMS/TCP frame of a request: AMS/TCP header, AMS header and `payload`.
+
+        The AMS header is at `[AMS_TCP_HEADER_LENGTH : AMS_TCP_HEADER_LENGTH + AMS_HEADER_STRUCT.size]`.
+        """
+        frame = bytearray(self.__header_length + len(payload))
+        frame[: self.__header_length] = self.__template
+        frame[self.__header_length :] = payload
+        _AMS_FRAME_LENGTH_STRUCT.pack_into(frame, 2, AMS_HEADER_STRUCT.size + len(payload))
+        _AMS_FRAME_VARIABLE_FIELDS_STRUCT.pack_into(
+            frame,
+            _AMS_FRAME_VARIABLE_FIELDS_OFFSET,
+            _ADS_COMMAND_VALUES[command_id],
+            _ADSCMD_STATE_FLAGS,
+            len(payload),
+            0,
+            invoke_id,
+        )
+        return frame
@@ -0,0 +1,49 @@
+from ...constants.ads_data_type import ADSDataType
+from ..ads_data_type_upload import ADSDataTypeEntry, parse_data_type_entries
+
+
+def test_ads_data_type_entry() -> None:
+    # entry of the alias "T_X" of type "INT", padded to 4 bytes
+    raw_data = bytes.fromhex(
+        "34 00 00 00 01 00 00 00 00 00 00 00 00 00 00 00 02 00 00 00 00 00 00 00 02 00 00 00 00 00 00 00"
+        "03 00 03 00 00 00 00 00 00 00 54 5f 58 00 49 4e 54 00 00 00"
+    )
+
+    entry, next_offset = ADSDataTypeEntry.from_bytes(raw_data)
+
+    assert next_offset == 0x34
+    assert entry == ADSDataTypeEntry(name="T_X", type_name="INT", size=2, data_type=ADSDataType.ADST_INT16.value)
+    assert entry.to_bytes() == raw_data
+
+
+def test_ads_data_type_entry_sub_items() -> None:
+    entries = [
+        ADSDataTypeEntry(
+            name="ST_Data",
+            type_name="",
+            size=12,
+            data_type=ADSDataType.ADST_BIGTYPE.value,
+            comment="data",
+            sub_items=[
+                ADSDataTypeEntry(name="bFlag", type_name="BOOL", size=1, data_type=ADSDataType.ADST_BIT.value),
+                ADSDataTypeEntry(
+                    name="aValues",
+                    type_name="ARRAY [1..2,0..1] OF INT",
+                    size=8,
+                    offset=2,
+                    data_type=ADSDataType.ADST_BIGTYPE.value,
+                ),
+            ],
+        ),
+        ADSDataTypeEntry(
+            name="ARRAY [1..2,0..1] OF INT",
+            type_name="INT",
+            size=8,
+            data_type=ADSDataType.ADST_BIGTYPE.value,
+            array_info=[(1, 2), (0, 2)],
+        ),
+    ]
+    data = b"".join(entry.to_bytes() for entry in entries)
+
+    assert all(len(entry.to_bytes()) % 4 == 0 for entry in entries)
+    assert list(parse_data_type_entries(data)) == entries
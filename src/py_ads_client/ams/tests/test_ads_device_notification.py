@@ -1,6 +1,8 @@
 from datetime import datetime, timezone
 
-from ..ads_device_notification import ADSDeviceNotificationResponse
+import pytest
+
+from ..ads_device_notification import EPOCH_AS_FILETIME, ADSDeviceNotificationResponse, filetime_to_unix_ns
 
 
 def test_device_notification_response() -> None:
@@ -15,3 +17,23 @@ def test_device_notification_response() -> None:
     assert sample.update_time == datetime(
         year=2024, month=3, day=21, hour=1, minute=59, second=50, microsecond=79000, tzinfo=timezone.utc
     )
+
+
+def test_device_notification_timestamps() -> None:
+    raw_data = bytes.fromhex(
+        "30 00 00 00 02 00 00 00"
+        "f0 bc 34 75 33 7b da 01 01 00 00 00 ab 00 00 00 02 00 00 00 02 00"
+        "f1 bc 34 75 33 7b da 01 01 00 00 00 ac 00 00 00 02 00 00 00 03 00"
+    )
+
+    response = ADSDeviceNotificationResponse.from_bytes(data=raw_data)
+    assert response.timestamps_ns() == [1710986390079000000, 1710986390079000100]
+    assert response.samples[1].update_time_ns == 1710986390079000100
+    assert response.samples[0].update_time is response.samples[0].update_time
+    assert filetime_to_unix_ns(EPOCH_AS_FILETIME) == 0
+
+    np = pytest.importorskip("numpy")
+    timestamps = response.timestamps_datetime64()
+    assert timestamps.dtype == np.dtype("datetime64[ns]")
+    assert timestamps.tolist() == [1710986390079000000, 1710986390079000100]
+    assert timestamps[0] == np.datetime64("2024-03-21T01:59:50.079", "ns")
@@ -10,6 +10,11 @@ def test_ads_read_request() -> None:
 
     assert request.to_bytes() == raw_data
 
+    # a raw index group, e.g. of a symbol in the symbol upload
+    request = ADSReadRequest(index_group=0xF005, index_offset=0x5F000003, length=5)
+
+    assert request.to_bytes() == raw_data
+
 
 def test_ads_write_response() -> None:
     raw_data = bytes.fromhex("00 00 00 00 05 00 00 00 01 01 00 01 01")
@@ -0,0 +1,51 @@
+from ...constants.index_group import IndexGroup
+from ...constants.return_code import ADSErrorCode
+from ...constants.transmission_mode import TransmissionMode
+from ..ads_add_device_notification import ADSAddDeviceNotificationRequest
+from ..ads_sum_add_device_notification import ADSSumAddDeviceNotificationRequest, ADSSumAddDeviceNotificationResponse
+
+
+def test_ads_sum_add_device_notification_request() -> None:
+    raw_data = bytes.fromhex(
+        " ".join(
+            [
+                "85 f0 00 00 02 00 00 00 10 00 00 00 50 00 00 00",
+                "05 f0 00 00 01 00 00 00 02 00 00 00 03 00 00 00 00 00 00 00 64 00 00 00",
+                "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00",
+                "05 f0 00 00 02 00 00 00 04 00 00 00 04 00 00 00 0a 00 00 00 00 00 00 00",
+                "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00",
+            ]
+        )
+    )
+
+    request = ADSSumAddDeviceNotificationRequest(
+        items=[
+            ADSAddDeviceNotificationRequest(
+                index_group=IndexGroup.SYMVAL_BYHANDLE,
+                index_offset=1,
+                length=2,
+                max_delay_ms=0,
+                cycle_time_ms=100,
+                transmission_mode=TransmissionMode.ADSTRANS_SERVERCYCLE,
+            ),
+            ADSAddDeviceNotificationRequest(
+                index_group=IndexGroup.SYMVAL_BYHANDLE,
+                index_offset=2,
+                length=4,
+                max_delay_ms=10,
+                cycle_time_ms=0,
+                transmission_mode=TransmissionMode.ADSTRANS_SERVERONCHA,
+            ),
+        ]
+    )
+
+    assert request.to_bytes() == raw_data
+
+
+def test_ads_sum_add_device_notification_response() -> None:
+    raw_data = bytes.fromhex("00 00 00 00 ab 00 00 00 10 07 00 00 00 00 00 00")
+
+    response = ADSSumAddDeviceNotificationResponse.from_bytes(raw_data, count=2)
+
+    assert [r.result for r in response.results] == [ADSErrorCode.ERR_NOERROR, ADSErrorCode.ADSERR_DEVICE_SYMBOLNOTFOUND]
+    assert response.results[0].handle == 0xAB
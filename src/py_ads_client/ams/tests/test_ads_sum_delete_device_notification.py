@@ -0,0 +1,27 @@
+from ...constants.return_code import ADSErrorCode
+from ..ads_delete_device_notification import ADSDeleteDeviceNotificationRequest
+from ..ads_sum_delete_device_notification import (
+    ADSSumDeleteDeviceNotificationRequest,
+    ADSSumDeleteDeviceNotificationResponse,
+)
+
+
+def test_ads_sum_delete_device_notification_request() -> None:
+    raw_data = bytes.fromhex("86 f0 00 00 02 00 00 00 08 00 00 00 08 00 00 00 ab 00 00 00 ac 00 00 00")
+
+    request = ADSSumDeleteDeviceNotificationRequest(
+        items=[ADSDeleteDeviceNotificationRequest(handle=0xAB), ADSDeleteDeviceNotificationRequest(handle=0xAC)]
+    )
+
+    assert request.to_bytes() == raw_data
+
+
+def test_ads_sum_delete_device_notification_response() -> None:
+    raw_data = bytes.fromhex("00 00 00 00 14 07 00 00")
+
+    response = ADSSumDeleteDeviceNotificationResponse.from_bytes(raw_data, count=2)
+
+    assert [r.result for r in response.results] == [
+        ADSErrorCode.ERR_NOERROR,
+        ADSErrorCode.ADSERR_DEVICE_NOTIFYHNDINVALID,
+    ]
@@ -0,0 +1,40 @@
+from ...constants.index_group import IndexGroup
+from ...constants.return_code import ADSErrorCode
+from ..ads_read import ADSReadRequest
+from ..ads_sum_read import ADSSumReadRequest, ADSSumReadResponse
+
+
+def test_ads_sum_read_request() -> None:
+    raw_data = bytes.fromhex(
+        " ".join(
+            [
+                "80 f0 00 00 02 00 00 00 0e 00 00 00 18 00 00 00",
+                "05 f0 00 00 01 00 00 00 02 00 00 00",
+                "05 f0 00 00 02 00 00 00 04 00 00 00",
+            ]
+        )
+    )
+
+    request = ADSSumReadRequest(
+        items=[
+            ADSReadRequest(index_group=IndexGroup.SYMVAL_BYHANDLE, index_offset=1, length=2),
+            ADSReadRequest(index_group=IndexGroup.SYMVAL_BYHANDLE, index_offset=2, length=4),
+        ]
+    )
+
+    assert request.read_length == 14
+    assert request.to_bytes() == raw_data
+
+
+def test_ads_sum_read_response() -> None:
+    raw_data = bytes.fromhex("00 00 00 00 10 07 00 00 00 00 00 00 01 02 00 00 00 00 05")
+
+    response = ADSSumReadResponse.from_bytes(raw_data, lengths=[2, 4, 1])
+
+    assert len(response.results) == 3
+    assert response.results[0].result == ADSErrorCode.ERR_NOERROR
+    assert response.results[0].data == bytes.fromhex("01 02")
+    assert response.results[1].result == ADSErrorCode.ADSERR_DEVICE_SYMBOLNOTFOUND
+    assert response.results[1].data == b""
+    assert response.results[2].result == ADSErrorCode.ERR_NOERROR
+    assert response.results[2].data == bytes.fromhex("05")
@@ -0,0 +1,38 @@
+from ...constants.return_code import ADSErrorCode
+from ..ads_read_write import ADSReadWriteRequest
+from ..ads_sum_read_write import ADSSumReadWriteRequest, ADSSumReadWriteResponse
+
+
+def test_ads_sum_read_write_request() -> None:
+    raw_data = bytes.fromhex(
+        " ".join(
+            [
+                "82 f0 00 00 02 00 00 00 18 00 00 00 2a 00 00 00",
+                "03 f0 00 00 00 00 00 00 04 00 00 00 06 00 00 00",
+                "03 f0 00 00 00 00 00 00 04 00 00 00 04 00 00 00",
+                "47 56 4c 2e 61 00",
+                "47 56 4c 00",
+            ]
+        )
+    )
+
+    request = ADSSumReadWriteRequest(
+        items=[
+            ADSReadWriteRequest.get_handle_by_name(name="GVL.a"),
+            ADSReadWriteRequest.get_handle_by_name(name="GVL"),
+        ]
+    )
+
+    assert request.to_bytes() == raw_data
+
+
+def test_ads_sum_read_write_response() -> None:
+    raw_data = bytes.fromhex("00 00 00 00 04 00 00 00 10 07 00 00 00 00 00 00 0e 00 80 4b")
+
+    response = ADSSumReadWriteResponse.from_bytes(raw_data, count=2)
+
+    assert len(response.results) == 2
+    assert response.results[0].result == ADSErrorCode.ERR_NOERROR
+    assert response.results[0].get_handle_by_name_result == 0x4B80000E
+    assert response.results[1].result == ADSErrorCode.ADSERR_DEVICE_SYMBOLNOTFOUND
+    assert response.results[1].data == b""
@@ -0,0 +1,34 @@
+from ...constants.index_group import IndexGroup
+from ...constants.return_code import ADSErrorCode
+from ..ads_sum_write import ADSSumWriteRequest, ADSSumWriteResponse
+from ..ads_write import ADSWriteRequest
+
+
+def test_ads_sum_write_request() -> None:
+    raw_data = bytes.fromhex(
+        " ".join(
+            [
+                "81 f0 00 00 02 00 00 00 08 00 00 00 1b 00 00 00",
+                "05 f0 00 00 01 00 00 00 02 00 00 00",
+                "05 f0 00 00 02 00 00 00 01 00 00 00",
+                "7b 00 01",
+            ]
+        )
+    )
+
+    request = ADSSumWriteRequest(
+        items=[
+            ADSWriteRequest(index_group=IndexGroup.SYMVAL_BYHANDLE, index_offset=1, data=bytes.fromhex("7b 00")),
+            ADSWriteRequest(index_group=IndexGroup.SYMVAL_BYHANDLE, index_offset=2, data=bytes.fromhex("01")),
+        ]
+    )
+
+    assert request.to_bytes() == raw_data
+
+
+def test_ads_sum_write_response() -> None:
+    raw_data = bytes.fromhex("00 00 00 00 05 07 00 00")
+
+    response = ADSSumWriteResponse.from_bytes(raw_data, count=2)
+
+    assert [r.result for r in response.results] == [ADSErrorCode.ERR_NOERROR, ADSErrorCode.ADSERR_DEVICE_INVALIDSIZE]
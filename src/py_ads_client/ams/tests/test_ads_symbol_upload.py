@@ -0,0 +1,58 @@
+from ...constants.ads_data_type import ADSDataType
+from ...constants.symbol_flag import SymbolFlag
+from ..ads_symbol_upload import ADSSymbolEntry, ADSSymbolUploadInfo, parse_symbol_entries
+
+
+def test_ads_symbol_upload_info() -> None:
+    raw_data = bytes.fromhex("02 00 00 00 48 00 00 00 01 00 00 00 80 00 00 00 00 00 00 00 00 00 00 00")
+
+    info = ADSSymbolUploadInfo.from_bytes(raw_data)
+
+    assert info.symbol_count == 2
+    assert info.symbol_size == 0x48
+    assert info.data_type_count == 1
+    assert info.data_type_size == 0x80
+    assert info.to_bytes() == raw_data
+
+
+def test_ads_symbol_entry() -> None:
+    # entry of "MAIN.x" of type "INT" with the comment "ab", padded to 4 bytes
+    raw_data = bytes.fromhex(
+        "2c 00 00 00 40 40 00 00 04 00 00 00 02 00 00 00 02 00 00 00 20 00 00 00 06 00 03 00 02 00"
+        "4d 41 49 4e 2e 78 00 49 4e 54 00 61 62 00"
+    )
+
+    entry, next_offset = ADSSymbolEntry.from_bytes(raw_data)
+
+    assert next_offset == 0x2C
+    assert entry == ADSSymbolEntry(
+        index_group=0x4040,
+        index_offset=4,
+        size=2,
+        data_type=ADSDataType.ADST_INT16.value,
+        flags=SymbolFlag.ADSSYMBOLFLAG_READONLY.value,
+        name="MAIN.x",
+        type_name="INT",
+        comment="ab",
+    )
+    assert entry.to_bytes() == raw_data
+
+
+def test_parse_symbol_entries() -> None:
+    entries = [
+        ADSSymbolEntry(
+            index_group=0x4040,
+            index_offset=i * 4,
+            size=4,
+            data_type=ADSDataType.ADST_REAL32.value,
+            flags=0,
+            name=f"GVL.value{i}",
+            type_name="REAL",
+            comment="",
+        )
+        for i in range(3)
+    ]
+    data = b"".join(entry.to_bytes() for entry in entries)
+
+    assert all(len(entry.to_bytes()) % 4 == 0 for entry in entries)
+    assert list(parse_symbol_entries(data)) == entries
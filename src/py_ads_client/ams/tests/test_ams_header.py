@@ -1,7 +1,7 @@
 from ...constants.command_id import ADSCommand
 from ...constants.return_code import ADSErrorCode
 from ...constants.state_flag import StateFlag
-from ..ams_header import AMSHeader
+from ..ams_header import AMSHeader, AMSHeaderTemplate, unpack_ams_header_fields
 
 
 def test_ams_header() -> None:
@@ -19,3 +19,41 @@ def test_ams_header() -> None:
     assert header.invoke_id == 1
 
     assert header.to_bytes() == raw_data
+
+
+def test_ams_header_template() -> None:
+    template = AMSHeaderTemplate(
+        target_net_id="192.168.88.100.1.1", target_port=851, source_net_id="192.168.88.20.1.1", source_port=30000
+    )
+    payload = bytes(range(55))
+
+    frame = template.pack_frame(command_id=ADSCommand.ADSSRVID_READWRITE, invoke_id=1, payload=payload)
+
+    header = AMSHeader(
+        target_net_id="192.168.88.100.1.1",
+        target_port=851,
+        source_net_id="192.168.88.20.1.1",
+        source_port=30000,
+        command_id=ADSCommand.ADSSRVID_READWRITE,
+        state_flags=StateFlag.AMSCMDSF_ADSCMD,
+        length=55,
+        error_code=ADSErrorCode.ERR_NOERROR,
+        invoke_id=1,
+    )
+    assert frame == bytes.fromhex("00 00 57 00 00 00") + header.to_bytes() + payload
+
+
+def test_unpack_ams_header_fields() -> None:
+    raw_data = bytes.fromhex(
+        "c0 a8 58 64 01 01 53 03 c0 a8 58 14 01 01 30 75 09 00 05 00 37 00 00 00 05 07 00 00 01 02 00 00"
+    )
+
+    command_id, length, error_code, invoke_id = unpack_ams_header_fields(memoryview(raw_data))
+
+    assert command_id is ADSCommand.ADSSRVID_READWRITE
+    assert length == 55
+    assert error_code == ADSErrorCode.ADSERR_DEVICE_INVALIDSIZE.value
+    assert invoke_id == 0x0201
+
+    command_id, _, _, _ = unpack_ams_header_fields(raw_data[:16] + b"\xff\x00" + raw_data[18:])
+    assert command_id is None
@@ -0,0 +1,517 @@
+import asyncio
+from logging import Logger, getLogger
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple, Union
+
+from .ads_symbol import ADSSymbol
+from .ams.ads_add_device_notification import ADSAddDeviceNotificationRequest, ADSAddDeviceNotificationResponse
+from .ams.ads_delete_device_notification import ADSDeleteDeviceNotificationRequest, ADSDeleteDeviceNotificationResponse
+from .ams.ads_device_notification import ADSDeviceNotificationResponse, AdsNotificationSample
+from .ams.ads_read import ADSReadRequest, ADSReadResponse
+from .ams.ads_read_device_info import ADSReadDeviceInfoResponse
+from .ams.ads_read_state import ADSReadStateResponse
+from .ams.ads_read_write import ADSReadWriteRequest, ADSReadWriteResponse
+from .ams.ads_response import ADSResponse, parse_ads_response
+from .ams.ads_symbol_upload import ADSSymbolUploadInfo
+from .ams.ads_write import ADSWriteRequest, ADSWriteResponse
+from .ams.ads_write_control import ADSWriteControlRequest, ADSWriteControlResponse
+from .ams.ams_header import AMS_HEADER_STRUCT, AMS_TCP_HEADER_LENGTH, AMSHeaderTemplate, unpack_ams_header_fields
+from .constants.ads_state import ADSState
+from .constants.command_id import ADSCommand
+from .constants.index_group import IndexGroup
+from .constants.return_code import ADSErrorCode
+from .constants.transmission_mode import TransmissionMode
+from .exceptions import STALE_HANDLE_ERRORS, ADSError, is_stale_handle_error
+from .helpers.check_value_type import check_value_type
+from .helpers.decode_ams_payload import decode_ams_payload
+from .helpers.encode_ams_payload import encode_ams_payload
+from .helpers.split_sum_command import MAX_SUM_COMMAND_BYTES, MAX_SUM_COMMAND_ITEMS
+from .helpers.sum_requests import (
+    decode_read_results,
+    get_handle_requests,
+    get_handle_results,
+    read_symbol_requests,
+    release_handle_requests,
+    write_results,
+    write_symbol_requests,
+)
+from .helpers.symbol_address import handle_names
+from .symbol_catalog import SymbolCatalog
+from .types import PLCData
+from .wire_trace import WireDirection, WireTrace
+
+DeviceNotification = Tuple[ADSSymbol[PLCData], AdsNotificationSample, Any]
+
+
+class AsyncADSClient:
+    """asyncio version of `ADSClient`.
+
+    All requests share one TCP connection and are completed by a single reader task,
+    so thousands of requests can be in flight on one event loop without a thread per request.
+    """
+
+    def __init__(
+        self,
+        local_ams_net_id: str,
+        local_ams_port: int = 8000,
+        timeout_s: float = 3,
+        logger: Optional[Logger] = None,
+        max_sum_command_items: int = MAX_SUM_COMMAND_ITEMS,
+        max_sum_command_bytes: int = MAX_SUM_COMMAND_BYTES,
+        wire_trace: Optional[WireTrace] = None,
+    ) -> None:
+        self.__local_ams_net_id = local_ams_net_id
+        self.__local_ams_port = local_ams_port
+        if logger is None:
+            logger = getLogger(name=self.__class__.__name__)
+
+        self.__logger = logger
+        if wire_trace is None:
+            wire_trace = WireTrace(logger)
+        self.__wire_trace = wire_trace
+        self.__timeout = timeout_s
+        self.__max_sum_command_items = max_sum_command_items
+        self.__max_sum_command_bytes = max_sum_command_bytes
+        self.__writer: Optional[asyncio.StreamWriter] = None
+        self.__read_task: Optional["asyncio.Task[None]"] = None
+
+        self._current_invoke_id = 0
+        self._pending_requests: Dict[int, asyncio.Future[ADSResponse]] = {}  # key is invoke_id
+
+        self.__variable_handles: Dict[str, int] = {}  # key is variable name, value is handle
+
+        self.__device_notification_queue: Optional[asyncio.Queue[Optional[DeviceNotification]]] = None
+        self.__device_notification_handles: Dict[int, ADSSymbol[PLCData]] = {}  # key is handle
+        # samples of unknown handles, which are received while notifications are added, key is handle
+        self.__early_device_notifications: Dict[int, List[AdsNotificationSample]] = {}
+        self.__device_notification_adds = 0  # number of notifications which are being added
+
+    def get_invoke_id(self) -> int:
+        max_invoke_id = 0xFFFFFFFF
+        if self._current_invoke_id >= max_invoke_id:
+            self._current_invoke_id = 0
+        self._current_invoke_id += 1
+        return self._current_invoke_id
+
+    async def open(
+        self, target_ip: str, target_ams_net_id: str, target_ams_port: int = 851, target_tcp_port: int = 48898
+    ) -> None:
+        """Open a connection to the target ADS device.
+
+        Port 851: TC3 PLC runtime system 1
+        https://infosys.beckhoff.com/content/1033/tc3_ads_intro/116159883.html
+
+        TCP port 48898: ADS over TCP
+        https://infosys.beckhoff.com/content/1033/ipc_security_win7/11019143435.html
+        """
+        self.__header_template = AMSHeaderTemplate(
+            target_net_id=target_ams_net_id,
+            target_port=target_ams_port,
+            source_net_id=self.__local_ams_net_id,
+            source_port=self.__local_ams_port,
+        )
+
+        reader, self.__writer = await asyncio.open_connection(host=target_ip, port=target_tcp_port)
+        self.__device_notification_queue = asyncio.Queue()
+        self.__read_task = asyncio.ensure_future(self._read_stream_background(reader))
+
+    async def close(self) -> None:
+        for handle in list(self.__device_notification_handles.keys()):
+            await self.del_device_notification_by_handle(handle=handle)
+        self.__device_notification_handles.clear()
+
+        variable_handles = list(set(self.__variable_handles.values()))
+        self.__variable_handles.clear()
+        if variable_handles:
+            await self.release_handles(handles=variable_handles)
+
+        if self.__writer is not None:
+            self.__writer.close()
+            self.__writer = None
+        if self.__read_task is not None:
+            await asyncio.gather(self.__read_task, return_exceptions=True)
+            self.__read_task = None
+
+    async def _read_stream_background(self, reader: asyncio.StreamReader) -> None:
+        TCP_HEADER_LENGTH = 6
+        try:
+            while True:
+                tcp_header = await reader.readexactly(TCP_HEADER_LENGTH)
+                if tcp_header[:2] != b"\x00\x00":
+                    self.__logger.warning(f"Received invalid TCP header: {tcp_header[:2].hex()}")
+                length = int.from_bytes(tcp_header[2:TCP_HEADER_LENGTH], byteorder="little", signed=False)
+                packet = await reader.readexactly(length)
+                try:
+                    self._handle_ams_raw_packet(packet=packet)
+                except Exception as e:
+                    self.__logger.error(f"Error while handling AMS packet: {e}")
+        except (asyncio.IncompleteReadError, ConnectionError):
+            self.__logger.info("connection disconnected")
+        finally:
+            for future in self._pending_requests.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Connection closed"))
+            self._pending_requests.clear()
+            if self.__device_notification_queue is not None:
+                self.__device_notification_queue.put_nowait(None)
+
+    def _handle_ams_raw_packet(self, packet: bytes) -> None:
+        AMS_HEADER_LENGTH = 32
+        ams_header = packet[:AMS_HEADER_LENGTH]
+        ads_body = packet[AMS_HEADER_LENGTH:]
+        if self.__wire_trace.enabled:
+            self.__wire_trace.trace(WireDirection.RECEIVED, ams_header, ads_body)
+
+        command_id, _, error_code, invoke_id = unpack_ams_header_fields(ams_header)
+
+        if error_code != 0:  # ERR_NOERROR
+            self._set_response(invoke_id=invoke_id, response=ADSErrorCode(error_code))
+            return
+
+        if command_id is ADSCommand.ADSSRVID_DEVICENOTE:
+            notification_response = ADSDeviceNotificationResponse.from_bytes(ads_body)
+            self._handle_device_notification(notification_response)
+            return
+
+        response = parse_ads_response(command_id=command_id, data=ads_body) if command_id is not None else None
+        if response is None:
+            self.__logger.warning(f"Received unknown command_id: {command_id}, {packet.hex()}")
+            return
+
+        if response.result == ADSErrorCode.ERR_NOERROR:
+            self._set_response(invoke_id=invoke_id, response=response)
+        else:
+            self._set_response(invoke_id=invoke_id, response=response.result)
+
+    def _set_response(self, *, invoke_id: int, response: Union[ADSErrorCode, ADSResponse]) -> None:
+        future = self._pending_requests.pop(invoke_id, None)
+        if future is None or future.done():
+            self.__logger.warning(f"Received response for unknown invoke_id: {invoke_id}")
+            return
+        if isinstance(response, ADSErrorCode):
+            future.set_exception(ADSError(response))
+        else:
+            future.set_result(response)
+
+    def _handle_device_notification(self, notification_response: ADSDeviceNotificationResponse) -> None:
+        assert self.__device_notification_queue is not None
+        for sample in notification_response.samples:
+            symbol = self.__device_notification_handles.get(sample.handle, None)
+            if symbol is None and self.__device_notification_adds:
+                # the first notification arrives before the response of the added notification
+                self.__early_device_notifications.setdefault(sample.handle, []).append(sample)
+                continue
+            if symbol is None:
+                self.__logger.warning(f"Received device notification for unknown handle: {sample.handle}")
+                continue
+            self._put_notification(symbol, sample)
+
+    def _put_notification(self, symbol: ADSSymbol[PLCData], sample: AdsNotificationSample) -> None:
+        assert self.__device_notification_queue is not None
+        decoded = decode_ams_payload(raw_data=sample.data, plc_t=symbol.plc_t)  # type: ignore
+        self.__device_notification_queue.put_nowait((symbol, sample, decoded))
+
+    async def _send_ams_packet(self, *, command: ADSCommand, payload: bytes) -> ADSResponse:
+        assert self.__writer is not None, "Connection is not open"
+
+        invoke_id = self.get_invoke_id()
+        frame = self.__header_template.pack_frame(command_id=command, invoke_id=invoke_id, payload=payload)
+
+        future: asyncio.Future[ADSResponse] = asyncio.get_running_loop().create_future()
+        self._pending_requests[invoke_id] = future
+
+        if self.__wire_trace.enabled:
+            ams_header = memoryview(frame)[AMS_TCP_HEADER_LENGTH : AMS_TCP_HEADER_LENGTH + AMS_HEADER_STRUCT.size]
+            self.__wire_trace.trace(WireDirection.SENT, ams_header, payload)
+        self.__writer.write(frame)
+        try:
+            await self.__writer.drain()
+            return await asyncio.wait_for(future, timeout=self.__timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Timeout while waiting for response to invoke_id: {invoke_id}")
+        finally:
+            self._pending_requests.pop(invoke_id, None)
+
+    async def read_device_info(self) -> ADSReadDeviceInfoResponse:
+        response = await self._send_ams_packet(command=ADSCommand.ADSSRVID_READDEVICEINFO, payload=b"")
+        assert isinstance(response, ADSReadDeviceInfoResponse)
+        return response
+
+    async def read_state(self) -> ADSReadStateResponse:
+        response = await self._send_ams_packet(command=ADSCommand.ADSSRVID_READSTATE, payload=b"")
+        assert isinstance(response, ADSReadStateResponse)
+        return response
+
+    async def write_control(self, ads_state: ADSState, device_state: int) -> None:
+        request = ADSWriteControlRequest(ads_state=ads_state, device_state=device_state, data=b"")
+        response = await self._send_ams_packet(command=ADSCommand.ADSSRVID_WRITECTRL, payload=request.to_bytes())
+        assert isinstance(response, ADSWriteControlResponse)
+
+    async def read_symbol_upload_info(self) -> ADSSymbolUploadInfo:
+        request = ADSReadRequest(index_group=IndexGroup.SYM_UPLOADINFO2, index_offset=0, length=24)
+        response = await self._send_ams_packet(command=ADSCommand.ADSSRVID_READ, payload=request.to_bytes())
+        assert isinstance(response, ADSReadResponse)
+        return ADSSymbolUploadInfo.from_bytes(response.data)
+
+    async def upload_symbols(self) -> SymbolCatalog:
+        info = await self.read_symbol_upload_info()
+        request = ADSReadRequest(index_group=IndexGroup.SYM_UPLOAD, index_offset=0, length=info.symbol_size)
+        response = await self._send_ams_packet(command=ADSCommand.ADSSRVID_READ, payload=request.to_bytes())
+        assert isinstance(response, ADSReadResponse)
+        return SymbolCatalog.from_bytes(response.data)
+
+    async def get_handle_by_name(self, name: str) -> int:
+        request = ADSReadWriteRequest.get_handle_by_name(name=name)
+        response = await self._send_ams_packet(command=ADSCommand.ADSSRVID_READWRITE, payload=request.to_bytes())
+        assert isinstance(response, ADSReadWriteResponse)
+        return response.get_handle_by_name_result
+
+    async def get_handles_by_name(self, names: Sequence[str]) -> List[Union[int, ADSErrorCode]]:
+        """Get the handles of several variables with ADS sum ReadWrite commands, see `ADSClient.get_handles_by_name`."""
+        requests = get_handle_requests(
+            names, max_items=self.__max_sum_command_items, max_bytes=self.__max_sum_command_bytes
+        )
+        responses = await asyncio.gather(
+            *(
+                self._send_ams_packet(command=ADSCommand.ADSSRVID_READWRITE, payload=request.to_bytes())
+                for request in requests
+            )
+        )
+        handles: List[Union[int, ADSErrorCode]] = []
+        for request, response in zip(requests, responses):
+            handles.extend(get_handle_results(request, response))
+        return handles
+
+    async def release_handles(self, handles: Sequence[int]) -> List[ADSErrorCode]:
+        """Release several handles with ADS sum write commands, see `ADSClient.release_handles`."""
+        results: List[ADSErrorCode] = []
+        for request in release_handle_requests(
+            handles, max_items=self.__max_sum_command_items, max_bytes=self.__max_sum_command_bytes
+        ):
+            response = await self._send_ams_packet(command=ADSCommand.ADSSRVID_READWRITE, payload=request.to_bytes())
+            results.extend(write_results(request, response))
+        return results
+
+    async def _get_variable_handles(self, names: Sequence[str]) -> Dict[str, Union[int, ADSErrorCode]]:
+        handles: Dict[str, Union[int, ADSErrorCode]] = {}
+        for name in names:
+            handle = self.__variable_handles.get(name, None)
+            if handle is not None:
+                handles[name] = handle
+        missing_names = list(dict.fromkeys(name for name in names if name not in handles))
+        if not missing_names:
+            return handles
+
+        missing_handles = await self.get_handles_by_name(names=missing_names)
+        surplus_handles: List[int] = []
+        for name, missing_handle in zip(missing_names, missing_handles):
+            if isinstance(missing_handle, int):
+                handle = self._cache_variable_handle(name, missing_handle)
+                if handle != missing_handle:
+                    surplus_handles.append(missing_handle)
+                missing_handle = handle
+            handles[name] = missing_handle
+        if surplus_handles:
+            await self.release_handles(handles=surplus_handles)
+        return handles
+
+    async def _get_variable_handle(self, name: str) -> int:
+        handle = self.__variable_handles.get(name, None)
+        if handle is None:
+            new_handle = await self.get_handle_by_name(name=name)
+            handle = self._cache_variable_handle(name, new_handle)
+            if handle != new_handle:
+                await self.release_handles(handles=[new_handle])
+        return handle
+
+    def _cache_variable_handle(self, name: str, handle: int) -> int:
+        """Cache the handle of a variable and return the cached handle.
+
+        If another coroutine has got a handle of the same name in the meantime, its handle is kept
+        and the caller has to release the surplus `handle` on the server.
+        """
+        return self.__variable_handles.setdefault(name, handle)
+
+    async def _renew_variable_handle(self, name: str, handle: int) -> int:
+        """Remove a stale handle from the cache and get a new one, unless it has been renewed already."""
+        self._forget_variable_handles({name: handle})
+        return await self._get_variable_handle(name=name)
+
+    def _forget_variable_handles(self, handles: Dict[str, int]) -> None:
+        """Remove stale handles from the cache, unless another coroutine has renewed them already."""
+        for name, handle in handles.items():
+            if self.__variable_handles.get(name, None) == handle:
+                del self.__variable_handles[name]
+
+    async def read_symbol(self, symbol: ADSSymbol[PLCData]) -> Any:
+        """Read a symbol at its index group and offset, or by its handle, see `ADSClient.read_symbol`."""
+        if symbol.index_group is not None and symbol.index_offset is not None:
+            request = ADSReadRequest(
+                index_group=symbol.index_group, index_offset=symbol.index_offset, length=symbol.plc_t.bytes_length
+            )
+            response = await self._send_ams_packet(command=ADSCommand.ADSSRVID_READ, payload=request.to_bytes())
+            assert isinstance(response, ADSReadResponse)
+            return decode_ams_payload(raw_data=response.data, plc_t=symbol.plc_t)  # type: ignore
+        handle = await self._get_variable_handle(name=symbol.name)
+        try:
+            raw_data = await self._read_value_by_handle(handle=handle, data_length=symbol.plc_t.bytes_length)
+        except ADSError as error:
+            if error.error_code not in STALE_HANDLE_ERRORS:
+                raise
+            handle = await self._renew_variable_handle(symbol.name, handle)
+            raw_data = await self._read_value_by_handle(handle=handle, data_length=symbol.plc_t.bytes_length)
+        return decode_ams_payload(raw_data=raw_data, plc_t=symbol.plc_t)  # type: ignore
+
+    async def _read_value_by_handle(self, handle: int, data_length: int) -> bytes:
+        request = ADSReadRequest(index_group=IndexGroup.SYMVAL_BYHANDLE, index_offset=handle, length=data_length)
+        response = await self._send_ams_packet(command=ADSCommand.ADSSRVID_READ, payload=request.to_bytes())
+        assert isinstance(response, ADSReadResponse)
+        return response.data
+
+    async def write_symbol(self, symbol: ADSSymbol[PLCData], value: Any) -> None:
+        """Write a symbol at its index group and offset, or by its handle, see `ADSClient.write_symbol`."""
+        check_value_type(plc_t=symbol.plc_t, value=value)
+        raw_data = encode_ams_payload(data=value, plc_t=symbol.plc_t)  # type: ignore
+        if symbol.index_group is not None and symbol.index_offset is not None:
+            request = ADSWriteRequest(index_group=symbol.index_group, index_offset=symbol.index_offset, data=raw_data)
+            response = await self._send_ams_packet(command=ADSCommand.ADSSRVID_WRITE, payload=request.to_bytes())
+            assert isinstance(response, ADSWriteResponse)
+            return
+        handle = await self._get_variable_handle(name=symbol.name)
+        try:
+            await self._write_value_by_handle(handle=handle, data=raw_data)
+        except ADSError as error:
+            if error.error_code not in STALE_HANDLE_ERRORS:
+                raise
+            handle = await self._renew_variable_handle(symbol.name, handle)
+            await self._write_value_by_handle(handle=handle, data=raw_data)
+
+    async def _write_value_by_handle(self, handle: int, data: bytes) -> None:
+        request = ADSWriteRequest.write_value_by_handle_request(handle=handle, data=data)
+        response = await self._send_ams_packet(command=ADSCommand.ADSSRVID_WRITE, payload=request.to_bytes())
+        assert isinstance(response, ADSWriteResponse)
+
+    async def read_symbols(self, symbols: Sequence[ADSSymbol[PLCData]]) -> List[Any]:
+        """Read several symbols with ADS sum read commands, see `ADSClient.read_symbols`.
+
+        If the request is split into several sum commands, all of them are in flight at the same time.
+        """
+        results, handles = await self._read_symbols(symbols)
+        stale: List[int] = []
+        stale_handles: Dict[str, int] = {}
+        for i, (symbol, result) in enumerate(zip(symbols, results)):
+            handle = handles.get(symbol.name, None)
+            if symbol.index_group is None and is_stale_handle_error(result) and isinstance(handle, int):
+                stale.append(i)
+                stale_handles[symbol.name] = handle
+        if stale:
+            self._forget_variable_handles(stale_handles)
+            retried, _ = await self._read_symbols([symbols[i] for i in stale])
+            for i, result in zip(stale, retried):
+                results[i] = result
+        return results
+
+    async def _read_symbols(
+        self, symbols: Sequence[ADSSymbol[PLCData]]
+    ) -> Tuple[List[Any], Dict[str, Union[int, ADSErrorCode]]]:
+        """Read the symbols, returns the results and the handles which were used."""
+        handles = await self._get_variable_handles(names=handle_names(symbols))
+        results, chunks = read_symbol_requests(
+            symbols, handles, max_items=self.__max_sum_command_items, max_bytes=self.__max_sum_command_bytes
+        )
+        responses = await asyncio.gather(
+            *(
+                self._send_ams_packet(command=ADSCommand.ADSSRVID_READWRITE, payload=request.to_bytes())
+                for _, request in chunks
+            )
+        )
+        for chunk, response in zip(chunks, responses):
+            decode_read_results(symbols, chunk, response, results)
+        return results, handles
+
+    async def write_symbols(self, values: Dict[ADSSymbol[PLCData], Any]) -> Dict[ADSSymbol[PLCData], ADSErrorCode]:
+        """Write several symbols with ADS sum write commands, see `ADSClient.write_symbols`."""
+        results, handles = await self._write_symbols(values)
+        stale_handles: Dict[str, int] = {}
+        for symbol, result in results.items():
+            handle = handles.get(symbol.name, None)
+            if symbol.index_group is None and is_stale_handle_error(result) and isinstance(handle, int):
+                stale_handles[symbol.name] = handle
+        if stale_handles:
+            self._forget_variable_handles(stale_handles)
+            retried, _ = await self._write_symbols(
+                {
+                    symbol: value
+                    for symbol, value in values.items()
+                    if symbol.index_group is None and symbol.name in stale_handles
+                }
+            )
+            results.update(retried)
+        return results
+
+    async def _write_symbols(
+        self, values: Dict[ADSSymbol[PLCData], Any]
+    ) -> Tuple[Dict[ADSSymbol[PLCData], ADSErrorCode], Dict[str, Union[int, ADSErrorCode]]]:
+        """Write the values, returns the results and the handles which were used."""
+        handles = await self._get_variable_handles(names=handle_names(values))
+        results, chunks = write_symbol_requests(
+            values, handles, max_items=self.__max_sum_command_items, max_bytes=self.__max_sum_command_bytes
+        )
+        for symbols, request in chunks:
+            response = await self._send_ams_packet(command=ADSCommand.ADSSRVID_READWRITE, payload=request.to_bytes())
+            results.update(zip(symbols, write_results(request, response)))
+        return results, handles
+
+    async def add_device_notification(
+        self,
+        symbol: ADSSymbol[PLCData],
+        max_delay_ms: int = 0,
+        cycle_time_ms: int = 0,
+        transmission_mode: TransmissionMode = TransmissionMode.ADSTRANS_SERVERONCHA,
+    ) -> int:
+        variable_handle = await self._get_variable_handle(name=symbol.name)
+        request = ADSAddDeviceNotificationRequest(
+            index_group=IndexGroup.SYMVAL_BYHANDLE,
+            index_offset=variable_handle,
+            length=symbol.plc_t.bytes_length,
+            max_delay_ms=max_delay_ms,
+            cycle_time_ms=cycle_time_ms,
+            transmission_mode=transmission_mode,
+        )
+        self.__device_notification_adds += 1
+        try:
+            response = await self._send_ams_packet(
+                command=ADSCommand.ADSSRVID_ADDDEVICENOTE, payload=request.to_bytes()
+            )
+            assert isinstance(response, ADSAddDeviceNotificationResponse)
+            self.__device_notification_handles[response.handle] = symbol
+            for sample in self.__early_device_notifications.pop(response.handle, []):
+                self._put_notification(symbol, sample)
+        finally:
+            self.__device_notification_adds -= 1
+            if not self.__device_notification_adds:
+                self.__early_device_notifications.clear()
+        return response.handle
+
+    async def del_device_notification(self, symbol: ADSSymbol[PLCData]) -> None:
+        handles = [handle for handle, s in self.__device_notification_handles.items() if s == symbol]
+        for handle in handles:
+            await self.del_device_notification_by_handle(handle=handle)
+
+    async def del_device_notification_by_handle(self, handle: int) -> None:
+        request = ADSDeleteDeviceNotificationRequest(handle=handle)
+        response = await self._send_ams_packet(command=ADSCommand.ADSSRVID_DELDEVICENOTE, payload=request.to_bytes())
+        assert isinstance(response, ADSDeleteDeviceNotificationResponse)
+        self.__device_notification_handles.pop(handle, None)
+
+    async def notifications(self) -> AsyncIterator[DeviceNotification]:
+        """Iterate over the received device notifications, until the connection is closed.
+
+        async for symbol, sample, value in client.notifications():
+            ...
+        """
+        assert self.__device_notification_queue is not None, "Connection is not open"
+        while True:
+            notification = await self.__device_notification_queue.get()
+            if notification is None:
+                return
+            yield notification
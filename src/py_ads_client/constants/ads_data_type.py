@@ -0,0 +1,24 @@
+from enum import Enum
+
+# C++ ADS_DATATYPE Enum, the data type of a symbol in the symbol upload
+# https://infosys.beckhoff.com/content/1033/tc3_adsdll2/117555595.html
+
+
+class ADSDataType(Enum):
+    ADST_VOID = 0
+    ADST_INT16 = 2
+    ADST_INT32 = 3
+    ADST_REAL32 = 4
+    ADST_REAL64 = 5
+    ADST_INT8 = 16
+    ADST_UINT8 = 17
+    ADST_UINT16 = 18
+    ADST_UINT32 = 19
+    ADST_INT64 = 20
+    ADST_UINT64 = 21
+    ADST_STRING = 30
+    ADST_WSTRING = 31
+    ADST_REAL80 = 32
+    ADST_BIT = 33
+    ADST_BIGTYPE = 65
+    """Structures, arrays, function blocks and other types which are described by a data type entry."""
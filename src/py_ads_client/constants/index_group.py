@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Union
 
 # Specification of the ADS system services
 # https://infosys.beckhoff.com/content/1033/tc3_ads_intro/117463563.html
@@ -14,3 +15,30 @@ class IndexGroup(Enum):
     """Reads the value of the variable identified by 'symHdl' or assigns a value to the variable."""
     RELEASE_SYMHANDLE = 0xF006
     """The code (handle) contained in the write data for an interrogated, named PLC variable is released."""
+    SYM_VERSION = 0xF008
+    """Reads the symbol version, a counter which is incremented with every online change or download."""
+    SYM_UPLOAD = 0xF00B
+    """Reads the symbol table, the entries of all symbols."""
+    SYM_DT_UPLOAD = 0xF00E
+    """Reads the data type table, the entries of all data types."""
+    SYM_UPLOADINFO2 = 0xF00F
+    """Reads the number and the total size of the symbol and data type entries."""
+    SYM_DT_INFOBYNAMEEX = 0xF011
+    """Reads the data type entry of the data type whose name is contained in the write data."""
+    SUMUP_READ = 0xF080
+    """Sum command: several ADS read requests are executed with one ADS ReadWrite request."""
+    SUMUP_WRITE = 0xF081
+    """Sum command: several ADS write requests are executed with one ADS ReadWrite request."""
+    SUMUP_READWRITE = 0xF082
+    """Sum command: several ADS ReadWrite requests are executed with one ADS ReadWrite request."""
+    SUMUP_ADDDEVNOTE = 0xF085
+    """Sum command: several ADS Add Device Notification requests are executed with one ADS ReadWrite request."""
+    SUMUP_DELDEVNOTE = 0xF086
+    """Sum command: several ADS Delete Device Notification requests are executed with one ADS ReadWrite request."""
+    DEVICE_DATA = 0xF100
+    """State of the device, index offset 0 reads the ADS state and index offset 2 the device state."""
+
+
+def index_group_value(index_group: Union[IndexGroup, int]) -> int:
+    """Value of a reserved index group, or a raw index group, e.g. of a symbol in the symbol upload."""
+    return index_group.value if isinstance(index_group, IndexGroup) else index_group
@@ -0,0 +1,17 @@
+from enum import Flag
+
+# ADSSYMBOLFLAG constants, the flags of a symbol in the symbol upload
+# https://infosys.beckhoff.com/content/1033/tc3_adsdll2/117553803.html
+
+
+class SymbolFlag(Flag):
+    ADSSYMBOLFLAG_PERSISTENT = 0x1
+    ADSSYMBOLFLAG_BITVALUE = 0x2
+    ADSSYMBOLFLAG_REFERENCETO = 0x4
+    ADSSYMBOLFLAG_TYPEGUID = 0x8
+    ADSSYMBOLFLAG_TCCOMIFACEPTR = 0x10
+    ADSSYMBOLFLAG_READONLY = 0x20
+    ADSSYMBOLFLAG_ATTRIBUTES = 0x1000
+    ADSSYMBOLFLAG_STATIC = 0x2000
+    ADSSYMBOLFLAG_INITONRESET = 0x4000
+    ADSSYMBOLFLAG_EXTENDEDFLAGS = 0x8000
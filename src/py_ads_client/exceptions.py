@@ -0,0 +1,21 @@
+from typing import Any
+
+from .constants.return_code import ADSErrorCode
+
+STALE_HANDLE_ERRORS = frozenset(
+    {ADSErrorCode.ADSERR_DEVICE_SYMBOLNOTFOUND, ADSErrorCode.ADSERR_DEVICE_SYMBOLVERSIONINVALID}
+)
+"""Errors of a variable handle which has become invalid, e.g. by an online change or a download of the PLC program."""
+
+
+def is_stale_handle_error(result: Any) -> bool:
+    """Whether the result of a request by handle is one of `STALE_HANDLE_ERRORS`, and not a read value."""
+    return isinstance(result, ADSErrorCode) and result in STALE_HANDLE_ERRORS
+
+
+class ADSError(RuntimeError):
+    """The ADS device answered a request with an error code."""
+
+    def __init__(self, error_code: ADSErrorCode) -> None:
+        super().__init__(f"Received error code: {error_code}")
+        self.error_code = error_code
@@ -0,0 +1,43 @@
+from datetime import date, datetime, time, timedelta
+from typing import Any
+
+from ..types import (
+    ARRAY,
+    STRING,
+    STRUCT,
+    WSTRING,
+    PLCData,
+    _PLCBoolType,
+    _PLCDateAndTimeType,
+    _PLCDateType,
+    _PLCFloatType,
+    _PLCIntType,
+    _PLCTimeDeltaType,
+    _PLCTimeOfDayType,
+)
+
+
+def check_value_type(*, plc_t: PLCData, value: Any) -> None:
+    """Check that `value` has the Python type which `plc_t` is encoded from."""
+    if isinstance(plc_t, _PLCBoolType):
+        assert isinstance(value, bool)
+    elif isinstance(plc_t, _PLCIntType):
+        assert isinstance(value, int)
+    elif isinstance(plc_t, _PLCFloatType):
+        assert isinstance(value, float)
+    elif isinstance(plc_t, (STRING, WSTRING)):
+        assert isinstance(value, str)
+    elif isinstance(plc_t, _PLCTimeDeltaType):
+        assert isinstance(value, timedelta)
+    elif isinstance(plc_t, _PLCDateType):
+        assert isinstance(value, date)
+    elif isinstance(plc_t, _PLCDateAndTimeType):
+        assert isinstance(value, datetime)
+    elif isinstance(plc_t, _PLCTimeOfDayType):
+        assert isinstance(value, time)
+    elif isinstance(plc_t, STRUCT):
+        assert isinstance(value, dict)
+    elif isinstance(plc_t, ARRAY):
+        assert plc_t.numpy or isinstance(value, list)
+    else:
+        raise ValueError(f"Unsupported PLC data type: {plc_t}")
@@ -0,0 +1,215 @@
+import struct
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
+
+from ..types import (
+    ARRAY,
+    STRING,
+    STRUCT,
+    WSTRING,
+    PLCData,
+    _PLCBoolType,
+    _PLCDateAndTimeType,
+    _PLCDateType,
+    _PLCFloatType,
+    _PLCIntType,
+    _PLCTimeDeltaType,
+    _PLCTimeOfDayType,
+)
+from .numpy_array import NumpyArrayCodec
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+_Decoder = Callable[[Sequence[Any], int], Any]
+"""Build the value of a node from the unpacked values, starting at the given index."""
+_Encoder = Callable[[Any, List[Any]], None]
+"""Append the values to pack of a node to the list."""
+
+
+class _Node:
+    __slots__ = ("format", "count", "decode", "encode")
+
+    def __init__(self, *, format: str, count: int, decode: Optional[_Decoder], encode: Optional[_Encoder]) -> None:
+        self.format = format
+        """`struct` format of the node, without byte order."""
+        self.count = count
+        """Number of values the format packs."""
+        self.decode = decode
+        """`None` if the node is a single value which is unpacked as is."""
+        self.encode = encode
+        """`None` if the node is a single value which is packed as is."""
+
+
+def _compile_leaf(plc_t: PLCData) -> _Node:
+    if isinstance(plc_t, (_PLCBoolType, _PLCIntType, _PLCFloatType)):
+        return _Node(format=plc_t.struct_format, count=1, decode=None, encode=None)
+    elif isinstance(plc_t, (_PLCTimeDeltaType, _PLCDateType, _PLCDateAndTimeType, _PLCTimeOfDayType, STRING, WSTRING)):
+        # packed as raw bytes and converted by the type itself
+        convert_from = plc_t.decode
+        convert_to = plc_t.encode
+
+        def decode(values: Sequence[Any], i: int) -> Any:
+            return convert_from(values[i])
+
+        def encode(value: Any, out: List[Any]) -> None:
+            out.append(convert_to(value))
+
+        return _Node(format=f"{plc_t.bytes_length}s", count=1, decode=decode, encode=encode)
+    else:
+        raise TypeError(f"Unsupported type: {type(plc_t).__name__}")
+
+
+def _compile_struct(plc_t: STRUCT) -> _Node:
+    names = tuple(name for name, _ in plc_t.fields)
+    nodes = [_compile(item_t) for _, item_t in plc_t.fields]
+    count = sum(node.count for node in nodes)
+    # padding between the fields and at the end is skipped with pad bytes, which unpack to no value
+    formats: List[str] = []
+    end = 0
+    for offset, node, (_, item_t) in zip(plc_t.offsets, nodes, plc_t.fields):
+        if offset > end:
+            formats.append(f"{offset - end}x")
+        formats.append(node.format)
+        end = offset + item_t.bytes_length
+    if plc_t.bytes_length > end:
+        formats.append(f"{plc_t.bytes_length - end}x")
+    format = "".join(formats)
+
+    if all(node.decode is None for node in nodes):
+
+        def decode(values: Sequence[Any], i: int) -> Any:
+            return dict(zip(names, values[i : i + count]))
+
+        def encode(value: Any, out: List[Any]) -> None:
+            assert isinstance(value, dict)
+            out.extend([value[name] for name in names])
+
+        return _Node(format=format, count=count, decode=decode, encode=encode)
+
+    fields: List[Tuple[str, int, _Node]] = []  # name, index of the first value and node of each field
+    index = 0
+    for name, node in zip(names, nodes):
+        fields.append((name, index, node))
+        index += node.count
+
+    def decode_fields(values: Sequence[Any], i: int) -> Any:
+        data = {}
+        for name, index, node in fields:
+            data[name] = values[i + index] if node.decode is None else node.decode(values, i + index)
+        return data
+
+    def encode_fields(value: Any, out: List[Any]) -> None:
+        assert isinstance(value, dict)
+        for name, _, node in fields:
+            if node.encode is None:
+                out.append(value[name])
+            else:
+                node.encode(value[name], out)
+
+    return _Node(format=format, count=count, decode=decode_fields, encode=encode_fields)
+
+
+def _compile_numpy_array(plc_t: ARRAY) -> _Node:
+    codec = NumpyArrayCodec(plc_t)
+
+    def decode(values: Sequence[Any], i: int) -> Any:
+        return codec.decode(values[i])
+
+    def encode(value: Any, out: List[Any]) -> None:
+        out.append(codec.encode(value))
+
+    return _Node(format=f"{plc_t.bytes_length}s", count=1, decode=decode, encode=encode)
+
+
+def _compile_array(plc_t: ARRAY) -> _Node:
+    if plc_t.numpy:
+        return _compile_numpy_array(plc_t)
+    length = plc_t.length
+    item = _compile(plc_t.item_type)
+    count = length * item.count
+
+    if item.decode is None and item.encode is None:
+
+        def decode(values: Sequence[Any], i: int) -> Any:
+            return list(values[i : i + count])
+
+        def encode(value: Any, out: List[Any]) -> None:
+            assert isinstance(value, list)
+            assert len(value) == length
+            out.extend(value)
+
+        return _Node(format=f"{length}{item.format}", count=count, decode=decode, encode=encode)
+
+    item_count = item.count
+    item_decode = item.decode
+    item_encode = item.encode
+    assert item_decode is not None and item_encode is not None
+
+    def decode_items(values: Sequence[Any], i: int) -> Any:
+        return [item_decode(values, j) for j in range(i, i + count, item_count)]
+
+    def encode_items(value: Any, out: List[Any]) -> None:
+        assert isinstance(value, list)
+        assert len(value) == length
+        for item_value in value:
+            item_encode(item_value, out)
+
+    return _Node(format=item.format * length, count=count, decode=decode_items, encode=encode_items)
+
+
+def _compile(plc_t: PLCData) -> _Node:
+    if isinstance(plc_t, STRUCT):
+        return _compile_struct(plc_t)
+    elif isinstance(plc_t, ARRAY):
+        return _compile_array(plc_t)
+    else:
+        return _compile_leaf(plc_t)
+
+
+class CodecPlan:
+    """Compiled decoder and encoder of a PLC data type.
+
+    The whole type is packed by a single `struct.Struct`,
+    so decoding is one `unpack_from` and encoding is one `pack` or `pack_into`.
+    """
+
+    def __init__(self, plc_t: PLCData) -> None:
+        # an array decoded by NumPy is not unpacked, so the array can share the memory of the raw data
+        self.__numpy_codec = NumpyArrayCodec(plc_t) if isinstance(plc_t, ARRAY) and plc_t.numpy else None
+        node = _compile(plc_t)
+        self.__struct = struct.Struct("<" + node.format)
+        assert self.__struct.size == plc_t.bytes_length
+        self.__decode = node.decode
+        self.__encode = node.encode
+
+    @property
+    def bytes_length(self) -> int:
+        return self.__struct.size
+
+    def decode(self, raw_data: Buffer, offset: int = 0) -> Any:
+        if self.__numpy_codec is not None:
+            return self.__numpy_codec.decode(raw_data, offset)
+        values = self.__struct.unpack_from(raw_data, offset)
+        if self.__decode is None:
+            return values[0]
+        return self.__decode(values, 0)
+
+    def encode(self, data: Any) -> bytes:
+        if self.__numpy_codec is not None:
+            return self.__numpy_codec.encode(data)
+        if self.__encode is None:
+            return self.__struct.pack(data)
+        values: List[Any] = []
+        self.__encode(data, values)
+        return self.__struct.pack(*values)
+
+
+def get_codec_plan(plc_t: PLCData) -> CodecPlan:
+    """Get the codec plan of `plc_t`, the plan is compiled on first use and cached on the instance.
+
+    The fields of a `STRUCT` must not be changed after its plan was compiled.
+    """
+    plan = plc_t._codec_plan
+    if plan is None:
+        plan = CodecPlan(plc_t)
+        plc_t._codec_plan = plan
+    return plan  # type: ignore[no-any-return]
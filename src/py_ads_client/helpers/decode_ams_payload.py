@@ -1,5 +1,5 @@
 from datetime import date, datetime, time, timedelta
-from typing import Any, Dict, List, Union, overload
+from typing import Any, Dict, Union, overload
 
 from ..types import (
     ARRAY,
@@ -14,6 +14,7 @@ from ..types import (
     _PLCTimeDeltaType,
     _PLCTimeOfDayType,
 )
+from .codec_plan import get_codec_plan
 
 
 @overload
@@ -49,7 +50,7 @@ def decode_ams_payload(*, raw_data: bytes, plc_t: Union[STRING, WSTRING]) -> str
 
 
 @overload
-def decode_ams_payload(*, raw_data: bytes, plc_t: ARRAY) -> List[Any]: ...
+def decode_ams_payload(*, raw_data: bytes, plc_t: ARRAY) -> Any: ...  # `list`, or `numpy.ndarray` if `ARRAY(..., numpy=True)`
 
 
 @overload
@@ -67,21 +68,9 @@ def decode_ams_payload(*, raw_data: bytes, plc_t: Any) -> Any:
     ):
         return plc_t.decode(raw_data=raw_data)
     elif isinstance(plc_t, STRUCT):
-        data: Dict[str, Any] = {}
-        offset = 0
-        for name, item_t in plc_t.fields:
-            item_bytes_length = item_t.bytes_length
-            item_raw_data = raw_data[offset : offset + item_bytes_length]
-            offset += item_bytes_length
-            data[name] = decode_ams_payload(raw_data=item_raw_data, plc_t=item_t)  # type: ignore
-        return data
+        return get_codec_plan(plc_t).decode(raw_data)
     elif isinstance(plc_t, ARRAY):
         assert len(raw_data) == plc_t.length * plc_t.item_type.bytes_length
-        item_bytes_length = plc_t.item_type.bytes_length
-        arr: List[Any] = []
-        for i in range(plc_t.length):
-            item_raw_data = raw_data[i * item_bytes_length : (i + 1) * item_bytes_length]
-            arr.append(decode_ams_payload(raw_data=item_raw_data, plc_t=plc_t.item_type))  # type: ignore
-        return arr
+        return get_codec_plan(plc_t).decode(raw_data)
     else:
         raise TypeError(f"Unsupported type: {type(plc_t).__name__}")
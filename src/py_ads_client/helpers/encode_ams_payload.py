@@ -1,5 +1,5 @@
 from datetime import date, datetime, time, timedelta
-from typing import Any, Dict, List, Union, overload
+from typing import Any, Dict, Union, overload
 
 from ..types import (
     ARRAY,
@@ -14,6 +14,7 @@ from ..types import (
     _PLCTimeDeltaType,
     _PLCTimeOfDayType,
 )
+from .codec_plan import get_codec_plan
 
 
 @overload
@@ -49,7 +50,7 @@ def encode_ams_payload(*, data: str, plc_t: Union[STRING, WSTRING]) -> bytes: ..
 
 
 @overload
-def encode_ams_payload(*, data: List[Any], plc_t: ARRAY) -> bytes: ...
+def encode_ams_payload(*, data: Any, plc_t: ARRAY) -> bytes: ...
 
 
 @overload
@@ -82,19 +83,7 @@ def encode_ams_payload(*, data: Any, plc_t: Any) -> bytes:
     elif isinstance(plc_t, (STRING, WSTRING)):
         assert isinstance(data, str)
         return plc_t.encode(data)
-    elif isinstance(plc_t, STRUCT):
-        assert isinstance(data, dict)
-        raw_data = b""
-        for name, item_t in plc_t.fields:
-            item_v = data[name]
-            raw_data += encode_ams_payload(data=item_v, plc_t=item_t)  # type: ignore
-        return raw_data
-    elif isinstance(plc_t, ARRAY):
-        assert isinstance(data, list)
-        assert len(data) == plc_t.length
-        raw_data = b""
-        for i in range(len(data)):
-            raw_data += encode_ams_payload(data=data[i], plc_t=plc_t.item_type)  # type: ignore
-        return raw_data
+    elif isinstance(plc_t, (STRUCT, ARRAY)):
+        return get_codec_plan(plc_t).encode(data)
     else:
         raise TypeError(f"Unsupported type: {type(plc_t).__name__}")
@@ -0,0 +1,78 @@
+from typing import TYPE_CHECKING, Any, List, Tuple, Union
+
+from ..types import ARRAY, STRING, STRUCT, PLCData, _PLCBoolType, _PLCFloatType, _PLCIntType
+
+if TYPE_CHECKING:
+    import numpy as np
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("NumPy is required for ARRAY(..., numpy=True), install it with `pip install numpy`") from e
+    return numpy
+
+
+def _dtype(np: Any, plc_t: PLCData) -> "np.dtype[Any]":
+    if isinstance(plc_t, (_PLCBoolType, _PLCIntType, _PLCFloatType)):
+        return np.dtype("<" + plc_t.struct_format)  # type: ignore[no-any-return]
+    elif isinstance(plc_t, STRING):
+        return np.dtype(f"S{plc_t.bytes_length}")  # type: ignore[no-any-return]
+    elif isinstance(plc_t, STRUCT):
+        return np.dtype(  # type: ignore[no-any-return]
+            {
+                "names": [name for name, _ in plc_t.fields],
+                "formats": [_dtype(np, item_t) for _, item_t in plc_t.fields],
+                "offsets": plc_t.offsets,
+                "itemsize": plc_t.bytes_length,
+            }
+        )
+    elif isinstance(plc_t, ARRAY):
+        return np.dtype((_dtype(np, plc_t.item_type), (plc_t.length,)))  # type: ignore[no-any-return]
+    else:
+        raise TypeError(f"Unsupported type for NumPy array: {type(plc_t).__name__}")
+
+
+class NumpyArrayCodec:
+    """Decoder and encoder of an `ARRAY` as `numpy.ndarray`.
+
+    Arrays of primitives map to a little-endian dtype, arrays of structs map to a structured dtype.
+    An `ARRAY` of `ARRAY` maps to an N-d array of the innermost item type.
+    """
+
+    def __init__(self, plc_t: ARRAY) -> None:
+        np = _import_numpy()
+        shape: List[int] = []
+        item_t: PLCData = plc_t
+        while isinstance(item_t, ARRAY):
+            shape.append(item_t.length)
+            item_t = item_t.item_type
+        self.__np = np
+        self.__shape: Tuple[int, ...] = tuple(shape)
+        self.__count = 1
+        for length in shape:
+            self.__count *= length
+        self.__dtype = _dtype(np, item_t)
+        assert self.__dtype.itemsize * self.__count == plc_t.bytes_length
+
+    @property
+    def dtype(self) -> "np.dtype[Any]":
+        return self.__dtype
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self.__shape
+
+    def decode(self, raw_data: Buffer, offset: int = 0) -> "np.ndarray[Any, Any]":
+        """Decode without copying, the returned array is read-only if `raw_data` is."""
+        arr = self.__np.frombuffer(raw_data, dtype=self.__dtype, count=self.__count, offset=offset)
+        return arr.reshape(self.__shape)  # type: ignore[no-any-return]
+
+    def encode(self, data: Any) -> bytes:
+        """Encode an `numpy.ndarray` or anything `numpy.asarray` accepts, such as nested lists."""
+        arr = self.__np.asarray(data, dtype=self.__dtype)
+        assert arr.shape == self.__shape, f"Expected shape {self.__shape}, got {arr.shape}"
+        return arr.tobytes()  # type: ignore[no-any-return]
@@ -0,0 +1,132 @@
+import re
+from typing import Dict, Optional, Tuple
+
+from ..constants.ads_data_type import ADSDataType
+from ..types import (
+    ARRAY,
+    BOOL,
+    BYTE,
+    DATE,
+    DATE_AND_TIME,
+    DINT,
+    DWORD,
+    INT,
+    LINT,
+    LREAL,
+    LTIME,
+    LWORD,
+    REAL,
+    SINT,
+    STRING,
+    TIME,
+    TIME_OF_DAY,
+    UDINT,
+    UINT,
+    ULINT,
+    USINT,
+    WORD,
+    WSTRING,
+    PLCData,
+)
+
+# the primitive types are singletons, BYTE and USINT, WORD and UINT, DWORD and UDINT, LWORD and ULINT
+# are distinct objects with the same encoding
+_PRIMITIVE_TYPES: Dict[int, Tuple[str, ADSDataType]] = {
+    id(BOOL): ("BOOL", ADSDataType.ADST_BIT),
+    id(BYTE): ("BYTE", ADSDataType.ADST_UINT8),
+    id(WORD): ("WORD", ADSDataType.ADST_UINT16),
+    id(DWORD): ("DWORD", ADSDataType.ADST_UINT32),
+    id(LWORD): ("LWORD", ADSDataType.ADST_UINT64),
+    id(SINT): ("SINT", ADSDataType.ADST_INT8),
+    id(USINT): ("USINT", ADSDataType.ADST_UINT8),
+    id(INT): ("INT", ADSDataType.ADST_INT16),
+    id(UINT): ("UINT", ADSDataType.ADST_UINT16),
+    id(DINT): ("DINT", ADSDataType.ADST_INT32),
+    id(UDINT): ("UDINT", ADSDataType.ADST_UINT32),
+    id(LINT): ("LINT", ADSDataType.ADST_INT64),
+    id(ULINT): ("ULINT", ADSDataType.ADST_UINT64),
+    id(TIME): ("TIME", ADSDataType.ADST_UINT32),
+    id(LTIME): ("LTIME", ADSDataType.ADST_UINT64),
+    id(DATE): ("DATE", ADSDataType.ADST_UINT32),
+    id(DATE_AND_TIME): ("DATE_AND_TIME", ADSDataType.ADST_UINT32),
+    id(TIME_OF_DAY): ("TIME_OF_DAY", ADSDataType.ADST_UINT32),
+    id(REAL): ("REAL", ADSDataType.ADST_REAL32),
+    id(LREAL): ("LREAL", ADSDataType.ADST_REAL64),
+}
+
+
+def plc_type_name(plc_t: PLCData) -> str:
+    """TwinCAT type name of `plc_t`, e.g. `INT`, `STRING(80)` or `ARRAY [0..9,1..2] OF REAL`.
+
+    A `STRUCT` has no name of its own, it is named `STRUCT`.
+    """
+    primitive = _PRIMITIVE_TYPES.get(id(plc_t))
+    if primitive is not None:
+        return primitive[0]
+    if isinstance(plc_t, STRING):
+        return f"STRING({plc_t.length})"
+    if isinstance(plc_t, WSTRING):
+        return f"WSTRING({plc_t.length})"
+    if isinstance(plc_t, ARRAY):
+        # an ARRAY of ARRAY has the same memory layout as a multi-dimensional array
+        bounds = []
+        item_t: PLCData = plc_t
+        while isinstance(item_t, ARRAY):
+            bounds.append(f"{item_t.lower_bound}..{item_t.lower_bound + item_t.length - 1}")
+            item_t = item_t.item_type
+        return f"ARRAY [{','.join(bounds)}] OF {plc_type_name(item_t)}"
+    return "STRUCT"
+
+
+_PRIMITIVE_TYPES_BY_NAME: Dict[str, PLCData] = {
+    "BOOL": BOOL,
+    "BYTE": BYTE,
+    "WORD": WORD,
+    "DWORD": DWORD,
+    "LWORD": LWORD,
+    "SINT": SINT,
+    "USINT": USINT,
+    "INT": INT,
+    "UINT": UINT,
+    "DINT": DINT,
+    "UDINT": UDINT,
+    "LINT": LINT,
+    "ULINT": ULINT,
+    "TIME": TIME,
+    "LTIME": LTIME,
+    "DATE": DATE,
+    "DATE_AND_TIME": DATE_AND_TIME,
+    "DT": DATE_AND_TIME,
+    "TIME_OF_DAY": TIME_OF_DAY,
+    "TOD": TIME_OF_DAY,
+    "REAL": REAL,
+    "LREAL": LREAL,
+    "STRING": STRING(),
+    "WSTRING": WSTRING(),
+}
+_STRING_TYPE_NAME = re.compile(r"(W?STRING)\s*[(\[]\s*(\d+)\s*[)\]]")
+
+
+def builtin_plc_type(type_name: str) -> Optional[PLCData]:
+    """`PLCData` of a built-in TwinCAT type name, e.g. `INT` or `STRING(80)`, `None` for other types."""
+    type_name = type_name.strip().upper()
+    primitive = _PRIMITIVE_TYPES_BY_NAME.get(type_name)
+    if primitive is not None:
+        return primitive
+    match = _STRING_TYPE_NAME.fullmatch(type_name)
+    if match is None:
+        return None
+    length = int(match.group(2))
+    return STRING(length) if match.group(1) == "STRING" else WSTRING(length)
+
+
+def plc_ads_data_type(plc_t: PLCData) -> ADSDataType:
+    """`ADSDataType` of `plc_t` in the symbol upload."""
+    primitive = _PRIMITIVE_TYPES.get(id(plc_t))
+    if primitive is not None:
+        return primitive[1]
+    if isinstance(plc_t, STRING):
+        return ADSDataType.ADST_STRING
+    if isinstance(plc_t, WSTRING):
+        return ADSDataType.ADST_WSTRING
+    return ADSDataType.ADST_BIGTYPE
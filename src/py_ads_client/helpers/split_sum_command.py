@@ -0,0 +1,29 @@
+from typing import List, Sequence
+
+MAX_SUM_COMMAND_ITEMS = 500
+"""Beckhoff recommends not to pack more than 500 sub commands into one sum command."""
+
+MAX_SUM_COMMAND_BYTES = 64 * 1024
+"""Upper limit for the request and the response size of one sum command."""
+
+
+def split_sum_command(item_sizes: Sequence[int], *, max_items: int, max_bytes: int) -> List[range]:
+    """Split the sub commands of a sum command into chunks which the router is able to process.
+
+    `item_sizes` is the number of bytes every sub command occupies in the request or in the response,
+    whichever is larger. A chunk holds at most `max_items` sub commands and at most `max_bytes` bytes,
+    a single sub command which is larger than `max_bytes` is sent in a chunk of its own.
+    """
+    assert max_items > 0
+    chunks: List[range] = []
+    start = 0
+    chunk_bytes = 0
+    for i, size in enumerate(item_sizes):
+        if i > start and (i - start >= max_items or chunk_bytes + size > max_bytes):
+            chunks.append(range(start, i))
+            start = i
+            chunk_bytes = 0
+        chunk_bytes += size
+    if start < len(item_sizes):
+        chunks.append(range(start, len(item_sizes)))
+    return chunks
@@ -0,0 +1,134 @@
+from typing import Any, Dict, List, Mapping, Sequence, Tuple, Union
+
+from ..ads_symbol import ADSSymbol
+from ..ams.ads_read import ADSReadRequest
+from ..ams.ads_read_write import ADSReadWriteRequest, ADSReadWriteResponse
+from ..ams.ads_response import ADSResponse
+from ..ams.ads_sum_read import ADSSumReadRequest, ADSSumReadResponse
+from ..ams.ads_sum_read_write import ADSSumReadWriteRequest, ADSSumReadWriteResponse
+from ..ams.ads_sum_write import ADSSumWriteRequest, ADSSumWriteResponse
+from ..ams.ads_write import ADSWriteRequest
+from ..constants.return_code import ADSErrorCode
+from ..types import PLCData
+from .check_value_type import check_value_type
+from .decode_ams_payload import decode_ams_payload
+from .encode_ams_payload import encode_ams_payload
+from .split_sum_command import split_sum_command
+from .symbol_address import symbol_address
+
+# The sum requests of the clients are built and their responses are split here, the clients only send them.
+# Every function which builds requests splits the sub requests into chunks with `split_sum_command`,
+# one sum request per chunk.
+
+ReadChunk = Tuple[List[int], ADSSumReadRequest]
+"""Sum read request and the index of the symbol of every sub request."""
+WriteChunk = Tuple[List[ADSSymbol[PLCData]], ADSSumWriteRequest]
+"""Sum write request and the symbol of every sub request."""
+
+
+def get_handle_requests(names: Sequence[str], *, max_items: int, max_bytes: int) -> List[ADSSumReadWriteRequest]:
+    items = [ADSReadWriteRequest.get_handle_by_name(name=name) for name in names]
+    # every sub request occupies 16 bytes + name length in the request, and 12 bytes in the response
+    chunks = split_sum_command([16 + len(item.write_data) for item in items], max_items=max_items, max_bytes=max_bytes)
+    return [ADSSumReadWriteRequest(items=items[chunk.start : chunk.stop]) for chunk in chunks]
+
+
+def get_handle_results(request: ADSSumReadWriteRequest, response: ADSResponse) -> List[Union[int, ADSErrorCode]]:
+    """The handles, or the `ADSErrorCode` of a name which could not be resolved."""
+    assert isinstance(response, ADSReadWriteResponse)
+    sum_response = ADSSumReadWriteResponse.from_bytes(response.data, count=len(request.items))
+    return [
+        (
+            item_response.get_handle_by_name_result
+            if item_response.result == ADSErrorCode.ERR_NOERROR
+            else item_response.result
+        )
+        for item_response in sum_response.results
+    ]
+
+
+def release_handle_requests(handles: Sequence[int], *, max_items: int, max_bytes: int) -> List[ADSSumWriteRequest]:
+    items = [ADSWriteRequest.release_handle(handle=handle) for handle in handles]
+    # every sub request occupies 16 bytes in the request
+    chunks = split_sum_command([16] * len(items), max_items=max_items, max_bytes=max_bytes)
+    return [ADSSumWriteRequest(items=items[chunk.start : chunk.stop]) for chunk in chunks]
+
+
+def write_results(request: ADSSumWriteRequest, response: ADSResponse) -> List[ADSErrorCode]:
+    assert isinstance(response, ADSReadWriteResponse)
+    sum_response = ADSSumWriteResponse.from_bytes(response.data, count=len(request.items))
+    return [item_response.result for item_response in sum_response.results]
+
+
+def read_symbol_requests(
+    symbols: Sequence[ADSSymbol[PLCData]],
+    handles: Dict[str, Union[int, ADSErrorCode]],
+    *,
+    max_items: int,
+    max_bytes: int,
+) -> Tuple[List[Any], List[ReadChunk]]:
+    """The results, with the `ADSErrorCode` of the symbols whose handle could not be got, and the sum requests."""
+    results: List[Any] = [None] * len(symbols)
+    indexes: List[int] = []
+    items: List[ADSReadRequest] = []
+    for i, symbol in enumerate(symbols):
+        address = symbol_address(symbol, handles)
+        if isinstance(address, ADSErrorCode):
+            results[i] = address
+            continue
+        indexes.append(i)
+        index_group, index_offset = address
+        items.append(
+            ADSReadRequest(index_group=index_group, index_offset=index_offset, length=symbol.plc_t.bytes_length)
+        )
+
+    # every sub request occupies 12 bytes in the request, and 4 bytes + data length in the response
+    chunks = split_sum_command([max(12, 4 + item.length) for item in items], max_items=max_items, max_bytes=max_bytes)
+    return results, [
+        (indexes[chunk.start : chunk.stop], ADSSumReadRequest(items=items[chunk.start : chunk.stop]))
+        for chunk in chunks
+    ]
+
+
+def decode_read_results(
+    symbols: Sequence[ADSSymbol[PLCData]], chunk: ReadChunk, response: ADSResponse, results: List[Any]
+) -> None:
+    """Decode the values of a sum read into `results`, or set the `ADSErrorCode` of a failed symbol."""
+    indexes, request = chunk
+    assert isinstance(response, ADSReadWriteResponse)
+    sum_response = ADSSumReadResponse.from_bytes(response.data, lengths=[item.length for item in request.items])
+    for i, item_response in zip(indexes, sum_response.results):
+        if item_response.result != ADSErrorCode.ERR_NOERROR:
+            results[i] = item_response.result
+            continue
+        results[i] = decode_ams_payload(raw_data=item_response.data, plc_t=symbols[i].plc_t)  # type: ignore
+
+
+def write_symbol_requests(
+    values: Mapping[ADSSymbol[PLCData], Any],
+    handles: Dict[str, Union[int, ADSErrorCode]],
+    *,
+    max_items: int,
+    max_bytes: int,
+) -> Tuple[Dict[ADSSymbol[PLCData], ADSErrorCode], List[WriteChunk]]:
+    """The `ADSErrorCode` of the symbols whose handle could not be got, and the sum requests."""
+    results: Dict[ADSSymbol[PLCData], ADSErrorCode] = {}
+    symbols: List[ADSSymbol[PLCData]] = []
+    items: List[ADSWriteRequest] = []
+    for symbol, value in values.items():
+        check_value_type(plc_t=symbol.plc_t, value=value)
+        raw_data = encode_ams_payload(data=value, plc_t=symbol.plc_t)  # type: ignore
+        address = symbol_address(symbol, handles)
+        if isinstance(address, ADSErrorCode):
+            results[symbol] = address
+            continue
+        symbols.append(symbol)
+        index_group, index_offset = address
+        items.append(ADSWriteRequest(index_group=index_group, index_offset=index_offset, data=raw_data))
+
+    # every sub request occupies 12 bytes + data length in the request, and 4 bytes in the response
+    chunks = split_sum_command([12 + len(item.data) for item in items], max_items=max_items, max_bytes=max_bytes)
+    return results, [
+        (symbols[chunk.start : chunk.stop], ADSSumWriteRequest(items=items[chunk.start : chunk.stop]))
+        for chunk in chunks
+    ]
@@ -0,0 +1,26 @@
+from typing import Dict, Iterable, List, Tuple, Union
+
+from ..ads_symbol import ADSSymbol
+from ..constants.index_group import IndexGroup
+from ..constants.return_code import ADSErrorCode
+from ..types import PLCData
+
+
+def symbol_address(
+    symbol: ADSSymbol[PLCData], handles: Dict[str, Union[int, ADSErrorCode]]
+) -> Union[Tuple[Union[IndexGroup, int], int], ADSErrorCode]:
+    """Index group and offset of the value of `symbol`, its own address or its handle in `handles`.
+
+    The `ADSErrorCode` is returned if the handle could not be got.
+    """
+    if symbol.index_group is not None and symbol.index_offset is not None:
+        return symbol.index_group, symbol.index_offset
+    handle = handles[symbol.name]
+    if isinstance(handle, ADSErrorCode):
+        return handle
+    return IndexGroup.SYMVAL_BYHANDLE, handle
+
+
+def handle_names(symbols: Iterable[ADSSymbol[PLCData]]) -> List[str]:
+    """Names of the symbols which are accessed by a handle."""
+    return [symbol.name for symbol in symbols if symbol.index_group is None]
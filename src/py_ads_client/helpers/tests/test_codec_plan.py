@@ -0,0 +1,73 @@
+import struct
+from datetime import timedelta
+
+from ...types import ARRAY, BOOL, INT, REAL, STRING, STRUCT, TIME, UDINT
+from ..codec_plan import get_codec_plan
+
+
+def test_codec_plan_is_cached() -> None:
+    plc_t = ARRAY(INT, 3)
+
+    plan = get_codec_plan(plc_t)
+
+    assert get_codec_plan(plc_t) is plan
+    assert get_codec_plan(ARRAY(INT, 3)) is not plan
+    assert plan.bytes_length == 6
+
+
+def test_codec_plan_flat_struct() -> None:
+    plc_t = STRUCT([("flag", BOOL), ("count", UDINT), ("values", ARRAY(REAL, 2))])
+    raw_data = struct.pack("< ? I 2f", True, 7, 1.5, -2.0)
+    decoded = {"flag": True, "count": 7, "values": [1.5, -2.0]}
+
+    plan = get_codec_plan(plc_t)
+
+    assert plan.decode(raw_data) == decoded
+    assert plan.encode(decoded) == raw_data
+
+
+def test_codec_plan_nested() -> None:
+    item_t = STRUCT([("name", STRING(3)), ("cycle", TIME), ("id", INT)])
+    plc_t = STRUCT([("items", ARRAY(item_t, 2)), ("names", ARRAY(ARRAY(STRING(1), 2), 2))])
+    raw_data = (
+        b"abc\x00"
+        + struct.pack("< I h", 100, 1)
+        + b"d\x00\x00\x00"
+        + struct.pack("< I h", 2000, -2)
+        + b"w\x00x\x00y\x00z\x00"
+    )
+    decoded = {
+        "items": [
+            {"name": "abc", "cycle": timedelta(milliseconds=100), "id": 1},
+            {"name": "d", "cycle": timedelta(seconds=2), "id": -2},
+        ],
+        "names": [["w", "x"], ["y", "z"]],
+    }
+
+    plan = get_codec_plan(plc_t)
+
+    assert plan.decode(raw_data) == decoded
+    assert plan.encode(decoded) == raw_data
+
+
+def test_codec_plan_offset() -> None:
+    plan = get_codec_plan(ARRAY(INT, 2))
+    buffer = b"\x00\x00" + plan.encode([1, -1]) + b"\x00\x00"
+
+    assert plan.decode(memoryview(buffer), 2) == [1, -1]
+
+
+def test_codec_plan_struct_offsets() -> None:
+    # {attribute 'pack_mode' := '8'}: 1 padding byte after flag and 2 at the end
+    item_t = STRUCT([("flag", BOOL), ("id", INT)], offsets=[0, 2], size=4)
+    plc_t = STRUCT([("flag", BOOL), ("count", UDINT), ("items", ARRAY(item_t, 2))], offsets=[0, 4, 8], size=16)
+    raw_data = struct.pack("< ? 3x I ? x h ? x h", True, 7, False, 1, True, -1)
+    decoded = {"flag": True, "count": 7, "items": [{"flag": False, "id": 1}, {"flag": True, "id": -1}]}
+
+    plan = get_codec_plan(plc_t)
+
+    assert plc_t.bytes_length == 16
+    assert item_t.offsets == [0, 2]
+    assert STRUCT([("flag", BOOL), ("id", INT)]).offsets == [0, 1]
+    assert plan.decode(raw_data) == decoded
+    assert plan.encode(decoded) == raw_data
@@ -0,0 +1,60 @@
+import struct
+
+import pytest
+
+from ...types import ARRAY, BOOL, INT, REAL, STRING, STRUCT, UDINT
+from ..decode_ams_payload import decode_ams_payload
+from ..encode_ams_payload import encode_ams_payload
+
+np = pytest.importorskip("numpy")
+
+
+def test_numpy_array() -> None:
+    plc_t = ARRAY(REAL, 4, numpy=True)
+    raw_data = struct.pack("< 4f", 1.0, 2.5, -3.0, 0.0)
+
+    decoded = decode_ams_payload(raw_data=raw_data, plc_t=plc_t)
+
+    assert isinstance(decoded, np.ndarray)
+    assert decoded.dtype == np.dtype("<f4")
+    assert decoded.tolist() == [1.0, 2.5, -3.0, 0.0]
+    assert encode_ams_payload(data=decoded, plc_t=plc_t) == raw_data
+    assert encode_ams_payload(data=[1.0, 2.5, -3.0, 0.0], plc_t=plc_t) == raw_data
+
+
+def test_numpy_2d_array() -> None:
+    plc_t = ARRAY(ARRAY(INT, 3), 2, numpy=True)
+    raw_data = struct.pack("< 6h", 1, 2, 3, -4, -5, -6)
+
+    decoded = decode_ams_payload(raw_data=raw_data, plc_t=plc_t)
+
+    assert decoded.shape == (2, 3)
+    assert decoded.tolist() == [[1, 2, 3], [-4, -5, -6]]
+    assert encode_ams_payload(data=decoded, plc_t=plc_t) == raw_data
+    with pytest.raises(AssertionError):
+        encode_ams_payload(data=np.zeros(6), plc_t=plc_t)
+
+
+def test_numpy_struct_array() -> None:
+    item_t = STRUCT([("flag", BOOL), ("count", UDINT), ("name", STRING(3)), ("values", ARRAY(INT, 2))])
+    plc_t = ARRAY(item_t, 2, numpy=True)
+    raw_data = struct.pack("< ? I 4s 2h", True, 7, b"ab", 1, 2) + struct.pack("< ? I 4s 2h", False, 8, b"cde", 3, 4)
+
+    decoded = decode_ams_payload(raw_data=raw_data, plc_t=plc_t)
+
+    assert decoded.shape == (2,)
+    assert decoded["count"].tolist() == [7, 8]
+    assert decoded["name"].tolist() == [b"ab", b"cde"]
+    assert decoded["values"].tolist() == [[1, 2], [3, 4]]
+    assert encode_ams_payload(data=decoded, plc_t=plc_t) == raw_data
+
+
+def test_numpy_array_in_struct() -> None:
+    plc_t = STRUCT([("id", INT), ("samples", ARRAY(REAL, 2, numpy=True))])
+    raw_data = struct.pack("< h 2f", 5, 0.5, 1.5)
+
+    decoded = decode_ams_payload(raw_data=raw_data, plc_t=plc_t)
+
+    assert decoded["id"] == 5
+    assert decoded["samples"].tolist() == [0.5, 1.5]
+    assert encode_ams_payload(data=decoded, plc_t=plc_t) == raw_data
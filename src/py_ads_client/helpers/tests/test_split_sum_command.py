@@ -0,0 +1,15 @@
+from ..split_sum_command import split_sum_command
+
+
+def test_split_sum_command_by_items() -> None:
+    chunks = split_sum_command([1] * 7, max_items=3, max_bytes=100)
+    assert chunks == [range(0, 3), range(3, 6), range(6, 7)]
+
+
+def test_split_sum_command_by_bytes() -> None:
+    chunks = split_sum_command([40, 40, 40, 200, 10], max_items=100, max_bytes=100)
+    assert chunks == [range(0, 2), range(2, 3), range(3, 4), range(4, 5)]
+
+
+def test_split_sum_command_empty() -> None:
+    assert split_sum_command([], max_items=3, max_bytes=100) == []
@@ -0,0 +1,60 @@
+import struct
+from typing import Any, Dict, List, Union
+
+from ...ads_symbol import ADSSymbol
+from ...ams.ads_read_write import ADSReadWriteResponse
+from ...constants.index_group import IndexGroup
+from ...constants.return_code import ADSErrorCode
+from ...types import DINT, INT, PLCData
+from ..sum_requests import decode_read_results, read_symbol_requests, write_results, write_symbol_requests
+
+
+def test_read_symbol_requests() -> None:
+    symbols: List[ADSSymbol[PLCData]] = [
+        ADSSymbol(name="GVL.a", plc_t=INT),
+        ADSSymbol(name="GVL.unknown", plc_t=INT),
+        ADSSymbol(name="GVL.b", plc_t=DINT, index_group=0x4040, index_offset=8),
+        ADSSymbol(name="GVL.c", plc_t=INT),
+    ]
+    handles: Dict[str, Union[int, ADSErrorCode]] = {
+        "GVL.a": 1,
+        "GVL.unknown": ADSErrorCode.ADSERR_DEVICE_SYMBOLNOTFOUND,
+        "GVL.c": 3,
+    }
+
+    results, chunks = read_symbol_requests(symbols, handles, max_items=2, max_bytes=1000)
+
+    assert results == [None, ADSErrorCode.ADSERR_DEVICE_SYMBOLNOTFOUND, None, None]
+    assert [indexes for indexes, _ in chunks] == [[0, 2], [3]]
+    first = chunks[0][1].items
+    assert (first[0].index_group, first[0].index_offset, first[0].length) == (IndexGroup.SYMVAL_BYHANDLE, 1, 2)
+    assert (first[1].index_group, first[1].index_offset, first[1].length) == (0x4040, 8, 4)
+
+    response = ADSReadWriteResponse(
+        result=ADSErrorCode.ERR_NOERROR,
+        data=struct.pack("< I I h i", 0, ADSErrorCode.ADSERR_DEVICE_INVALIDOFFSET.value, -5, 0),
+    )
+    decode_read_results(symbols, chunks[0], response, results)
+    assert results[:3] == [-5, ADSErrorCode.ADSERR_DEVICE_SYMBOLNOTFOUND, ADSErrorCode.ADSERR_DEVICE_INVALIDOFFSET]
+
+
+def test_write_symbol_requests() -> None:
+    a = ADSSymbol(name="GVL.a", plc_t=INT)
+    b = ADSSymbol(name="GVL.b", plc_t=DINT, index_group=0x4040, index_offset=8)
+    unknown = ADSSymbol(name="GVL.unknown", plc_t=INT)
+    values: Dict[ADSSymbol[PLCData], Any] = {a: 1, unknown: 2, b: 3}
+    handles: Dict[str, Union[int, ADSErrorCode]] = {
+        "GVL.a": 1,
+        "GVL.unknown": ADSErrorCode.ADSERR_DEVICE_SYMBOLNOTFOUND,
+    }
+
+    results, chunks = write_symbol_requests(values, handles, max_items=500, max_bytes=1000)
+
+    assert results == {unknown: ADSErrorCode.ADSERR_DEVICE_SYMBOLNOTFOUND}
+    assert len(chunks) == 1
+    symbols, request = chunks[0]
+    assert symbols == [a, b]
+    assert [item.data for item in request.items] == [struct.pack("< h", 1), struct.pack("< i", 3)]
+
+    response = ADSReadWriteResponse(result=ADSErrorCode.ERR_NOERROR, data=struct.pack("< I I", 0, 0))
+    assert write_results(request, response) == [ADSErrorCode.ERR_NOERROR, ADSErrorCode.ERR_NOERROR]
@@ -0,0 +1,51 @@
+import time
+from typing import Any, Callable, Optional
+
+from .helpers.decode_ams_payload import decode_ams_payload
+from .types import PLCData
+
+_NOT_DECODED = object()
+
+
+class LazyValue:
+    """The raw data of a device notification which is decoded on the first access of `value`.
+
+    The decoded value is cached, so the data is decoded at most once, and not at all
+    if the notification is dropped or replaced before its value is accessed.
+    """
+
+    __slots__ = ("__plc_t", "__data", "__on_decoded", "__value")
+
+    def __init__(self, plc_t: PLCData, data: bytes, on_decoded: Optional[Callable[[int], None]] = None) -> None:
+        self.__plc_t = plc_t
+        self.__data = data
+        self.__on_decoded = on_decoded  # called with the decode time in ns
+        self.__value: Any = _NOT_DECODED
+
+    @property
+    def decoded(self) -> bool:
+        return self.__value is not _NOT_DECODED
+
+    @property
+    def value(self) -> Any:
+        # decoding twice when two threads access it at the same time is harmless, so there is no lock
+        if self.__value is _NOT_DECODED:
+            start_ns = time.perf_counter_ns()
+            self.__value = decode_ams_payload(raw_data=self.__data, plc_t=self.__plc_t)  # type: ignore
+            if self.__on_decoded is not None:
+                self.__on_decoded(time.perf_counter_ns() - start_ns)
+        return self.__value
+
+    def __repr__(self) -> str:
+        if self.decoded:
+            return f"{self.__class__.__name__}({self.__value!r})"
+        return f"{self.__class__.__name__}(<{len(self.__data)} bytes>)"
+
+
+class DecodeOnGet(LazyValue):
+    """The value of a notification for a `NotificationBuffer` of a client without `lazy_decode`.
+
+    The buffer hands out the decoded value instead, so the notifications it drops are never decoded.
+    """
+
+    __slots__ = ()
@@ -0,0 +1,70 @@
+import os
+import sqlite3
+import threading
+from typing import Any, Optional, Union
+
+# One SQLite file holds the metadata of any number of targets. Every row is the raw response of an upload,
+# the symbol upload or the concatenated data type entries, so loading it is the same as parsing a fresh upload.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS metadata (
+    target TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    symbol_version INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (target, kind)
+)
+"""
+
+SYMBOLS = "symbols"
+DATA_TYPES = "data_types"
+
+
+class MetadataCache:
+    """Persistent cache of the symbol and data type uploads, pass it as `metadata_cache` to `ADSClient`.
+
+    The uploads are stored per target, the AMS net id and port, together with the symbol version of the PLC
+    and the size of the upload. An entry is only used while the symbol version and the size are unchanged,
+    i.e. until the next online change or download of the PLC program.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(os.fspath(path), check_same_thread=False)
+        with self.__connection:
+            self.__connection.execute(_SCHEMA)
+
+    def __enter__(self) -> "MetadataCache":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def get(self, target: str, kind: str, symbol_version: int, size: int) -> Optional[bytes]:
+        """The stored upload, `None` if there is none of this symbol version and size."""
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT data FROM metadata WHERE target = ? AND kind = ? AND symbol_version = ? AND size = ?",
+                (target, kind, symbol_version, size),
+            ).fetchone()
+        return None if row is None else bytes(row[0])
+
+    def put(self, target: str, kind: str, symbol_version: int, data: bytes) -> None:
+        """Store an upload, it replaces the upload of another symbol version."""
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO metadata (target, kind, symbol_version, size, data) VALUES (?, ?, ?, ?, ?)",
+                (target, kind, symbol_version, len(data), data),
+            )
+
+    def clear(self, target: Optional[str] = None) -> None:
+        """Remove the uploads of `target`, or of all targets."""
+        with self.__lock, self.__connection:
+            if target is None:
+                self.__connection.execute("DELETE FROM metadata")
+            else:
+                self.__connection.execute("DELETE FROM metadata WHERE target = ?", (target,))
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__connection.close()
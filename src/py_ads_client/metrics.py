@@ -0,0 +1,275 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from logging import Logger, getLogger
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .constants.command_id import ADSCommand
+from .constants.return_code import ADSErrorCode
+
+_SUB_BUCKET_BITS = 7
+"""Values are recorded with 7 significant bits, i.e. the relative error of a recorded value is below 1 %."""
+
+
+@dataclass()
+class HistogramSnapshot:
+    count: int
+    min_s: float
+    max_s: float
+    mean_s: float
+    p50_s: float
+    p90_s: float
+    p99_s: float
+    p999_s: float
+    buckets: List[Tuple[int, int]]
+    """Lower bound in ns and count of every non-empty bucket."""
+
+
+class LatencyHistogram:
+    """Histogram of durations with logarithmic buckets of a fixed relative precision, like an HDR histogram.
+
+    A value is counted in the bucket of its 7 most significant bits, so recording is a dict update
+    and the memory is bounded by the number of octaves, independent of the number of values.
+    """
+
+    def __init__(self) -> None:
+        self.__counts: Dict[int, int] = {}  # key is the lower bound of the bucket in ns
+        self.__count = 0
+        self.__sum_ns = 0
+        self.__min_ns = 0
+        self.__max_ns = 0
+
+    def record_ns(self, value_ns: int) -> None:
+        value_ns = max(value_ns, 0)
+        shift = value_ns.bit_length() - _SUB_BUCKET_BITS
+        bucket = value_ns if shift <= 0 else (value_ns >> shift) << shift
+        self.__counts[bucket] = self.__counts.get(bucket, 0) + 1
+        if self.__count == 0 or value_ns < self.__min_ns:
+            self.__min_ns = value_ns
+        if value_ns > self.__max_ns:
+            self.__max_ns = value_ns
+        self.__count += 1
+        self.__sum_ns += value_ns
+
+    def percentile_ns(self, q: float) -> int:
+        """Lower bound of the bucket which holds the `q` quantile, 0 <= q <= 1."""
+        if self.__count == 0:
+            return 0
+        rank = max(1, round(q * self.__count))
+        seen = 0
+        for bucket in sorted(self.__counts):
+            seen += self.__counts[bucket]
+            if seen >= rank:
+                return max(bucket, self.__min_ns)
+        return self.__max_ns
+
+    def snapshot(self) -> HistogramSnapshot:
+        return HistogramSnapshot(
+            count=self.__count,
+            min_s=self.__min_ns / 1e9,
+            max_s=self.__max_ns / 1e9,
+            mean_s=self.__sum_ns / self.__count / 1e9 if self.__count else 0.0,
+            p50_s=self.percentile_ns(0.5) / 1e9,
+            p90_s=self.percentile_ns(0.9) / 1e9,
+            p99_s=self.percentile_ns(0.99) / 1e9,
+            p999_s=self.percentile_ns(0.999) / 1e9,
+            buckets=sorted(self.__counts.items()),
+        )
+
+
+@dataclass()
+class CommandStats:
+    requests: int
+    responses: int
+    bytes_sent: int
+    """AMS/TCP frames of the requests."""
+    bytes_received: int
+    """AMS/TCP frames of the responses."""
+    timeouts: int
+    errors: Dict[ADSErrorCode, int]
+    """Number of responses per error code, in the AMS header or in the result of the ADS response."""
+    latency: HistogramSnapshot
+    """From sending the request to receiving the response."""
+    decode: HistogramSnapshot
+    """From receiving the response to the decoded value, for `read_symbol` and `read_symbols`."""
+
+
+@dataclass()
+class NotificationStats:
+    packets: int
+    samples: int
+    bytes_received: int
+    queue_depth: int
+    """Current number of decoded samples in `device_notification_queue`."""
+    decode: HistogramSnapshot
+    """Decode time of a sample."""
+
+
+@dataclass()
+class MetricsSnapshot:
+    timestamp_ns: int
+    """`time.time_ns()` when the snapshot was taken."""
+    in_flight: int
+    """Number of requests which are waiting for their response."""
+    max_in_flight: int
+    commands: Dict[ADSCommand, CommandStats]
+    notifications: NotificationStats
+
+
+MetricsExporter = Callable[[MetricsSnapshot], None]
+
+
+@dataclass()
+class _CommandMetrics:
+    requests: int = 0
+    responses: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    timeouts: int = 0
+    errors: Dict[ADSErrorCode, int] = field(default_factory=dict)
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    decode: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+
+class ClientMetrics:
+    """Opt-in instrumentation of a client, pass it as `metrics` to `ADSClient`.
+
+    Records per command request and response counts, bytes, error codes, timeouts and latency histograms,
+    the number of requests in flight, and the count and decode time of device notifications.
+
+    `snapshot()` returns the current values. If `exporter` is given, it is called with a snapshot
+    every `export_interval_s` seconds from a background thread, e.g. to push the values into a metrics pipeline,
+    until `close()` is called. An exporter call which raises is logged, the next snapshot is exported as usual.
+    The values are cumulative, they are never reset.
+    """
+
+    def __init__(
+        self,
+        exporter: Optional[MetricsExporter] = None,
+        export_interval_s: float = 10,
+        logger: Optional[Logger] = None,
+    ) -> None:
+        self.__lock = threading.Lock()
+        self.__commands: Dict[ADSCommand, _CommandMetrics] = {}
+        self.__in_flight: Dict[int, Tuple[ADSCommand, int, bool]] = {}  # key is invoke_id
+        self.__max_in_flight = 0
+        self.__received_ns: Dict[int, int] = {}  # key is invoke_id, for the decode time of waiting requests
+        self.__notification_packets = 0
+        self.__notification_samples = 0
+        self.__notification_bytes = 0
+        self.__notification_decode = LatencyHistogram()
+        self.__queue_depth: Callable[[], int] = lambda: 0
+
+        self.__logger = logger or getLogger(self.__class__.__name__)
+        self.__exporter = exporter
+        self.__export_interval_s = export_interval_s
+        self.__closed = threading.Event()
+        if exporter is not None:
+            threading.Thread(target=self._export_background, daemon=True).start()
+
+    def close(self) -> None:
+        """Stop the exporter thread."""
+        self.__closed.set()
+
+    def _export_background(self) -> None:
+        assert self.__exporter is not None
+        while not self.__closed.wait(self.__export_interval_s):
+            try:
+                self.__exporter(self.snapshot())
+            except Exception:
+                self.__logger.exception("Error in metrics exporter")
+
+    def _command(self, command: ADSCommand) -> _CommandMetrics:
+        metrics = self.__commands.get(command)
+        if metrics is None:
+            metrics = self.__commands[command] = _CommandMetrics()
+        return metrics
+
+    def set_queue_depth(self, queue_depth: Callable[[], int]) -> None:
+        """Set the function which returns the depth of the notification queue."""
+        self.__queue_depth = queue_depth
+
+    def on_send(self, *, invoke_id: int, command: ADSCommand, length: int, track_decode: bool = False) -> None:
+        now = time.perf_counter_ns()
+        with self.__lock:
+            metrics = self._command(command)
+            metrics.requests += 1
+            metrics.bytes_sent += length
+            self.__in_flight[invoke_id] = (command, now, track_decode)
+            self.__max_in_flight = max(self.__max_in_flight, len(self.__in_flight))
+
+    def on_send_failed(self, *, invoke_id: int) -> None:
+        with self.__lock:
+            self.__in_flight.pop(invoke_id, None)
+
+    def on_response(self, *, invoke_id: int, length: int, error_code: ADSErrorCode) -> None:
+        now = time.perf_counter_ns()
+        with self.__lock:
+            request = self.__in_flight.pop(invoke_id, None)
+            if request is None:
+                return
+            command, sent_ns, track_decode = request
+            metrics = self._command(command)
+            metrics.responses += 1
+            metrics.bytes_received += length
+            metrics.latency.record_ns(now - sent_ns)
+            if error_code is not ADSErrorCode.ERR_NOERROR:
+                metrics.errors[error_code] = metrics.errors.get(error_code, 0) + 1
+            if track_decode:
+                self.__received_ns[invoke_id] = now
+
+    def on_timeout(self, *, invoke_id: int) -> None:
+        with self.__lock:
+            request = self.__in_flight.pop(invoke_id, None)
+            self.__received_ns.pop(invoke_id, None)
+            if request is not None:
+                self._command(request[0]).timeouts += 1
+
+    def take_received_ns(self, *, invoke_id: int) -> Optional[int]:
+        """`time.perf_counter_ns()` when the response of a request with `track_decode` was received."""
+        with self.__lock:
+            return self.__received_ns.pop(invoke_id, None)
+
+    def on_decoded(self, *, command: ADSCommand, received_ns: int) -> None:
+        now = time.perf_counter_ns()
+        with self.__lock:
+            self._command(command).decode.record_ns(now - received_ns)
+
+    def on_notification(self, *, length: int, samples: int) -> None:
+        with self.__lock:
+            self.__notification_packets += 1
+            self.__notification_samples += samples
+            self.__notification_bytes += length
+
+    def on_notification_decoded(self, *, decode_ns: int) -> None:
+        with self.__lock:
+            self.__notification_decode.record_ns(decode_ns)
+
+    def snapshot(self) -> MetricsSnapshot:
+        queue_depth = self.__queue_depth()
+        with self.__lock:
+            return MetricsSnapshot(
+                timestamp_ns=time.time_ns(),
+                in_flight=len(self.__in_flight),
+                max_in_flight=self.__max_in_flight,
+                commands={
+                    command: CommandStats(
+                        requests=metrics.requests,
+                        responses=metrics.responses,
+                        bytes_sent=metrics.bytes_sent,
+                        bytes_received=metrics.bytes_received,
+                        timeouts=metrics.timeouts,
+                        errors=dict(metrics.errors),
+                        latency=metrics.latency.snapshot(),
+                        decode=metrics.decode.snapshot(),
+                    )
+                    for command, metrics in self.__commands.items()
+                },
+                notifications=NotificationStats(
+                    packets=self.__notification_packets,
+                    samples=self.__notification_samples,
+                    bytes_received=self.__notification_bytes,
+                    queue_depth=queue_depth,
+                    decode=self.__notification_decode.snapshot(),
+                ),
+            )
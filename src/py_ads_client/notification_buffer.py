@@ -0,0 +1,137 @@
+import queue
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from enum import Enum
+from typing import Any, Deque, Optional, Tuple
+
+from .ads_symbol import ADSSymbol
+from .ams.ads_device_notification import AdsNotificationSample
+from .lazy_value import DecodeOnGet
+from .types import PLCData
+
+DeviceNotification = Tuple[ADSSymbol[PLCData], AdsNotificationSample, Any]
+"""The symbol, the sample and the decoded value of a device notification."""
+
+
+class OverflowPolicy(Enum):
+    DROP_OLDEST = "drop_oldest"
+    """The oldest notification in the buffer is dropped to make room for the new one."""
+    DROP_NEWEST = "drop_newest"
+    """The new notification is dropped."""
+    BLOCK = "block"
+    """`put` waits until there is room. This blocks the thread which delivers the notifications,
+    with the default `InlineDispatcher` the socket reader thread, i.e. also all responses of the client."""
+
+
+class NotificationBuffer(ABC):
+    """Holds the notifications of one subscription until they are consumed, pass it as `buffer`
+    to `ADSClient.add_device_notification`.
+
+    `get` works like `queue.Queue.get` and raises `queue.Empty` if there is no notification.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._dropped = 0
+
+    @property
+    def dropped(self) -> int:
+        """Number of notifications which were dropped without being consumed."""
+        with self._condition:
+            return self._dropped
+
+    @abstractmethod
+    def put(self, notification: DeviceNotification) -> None: ...
+
+    @abstractmethod
+    def qsize(self) -> int: ...
+
+    @abstractmethod
+    def _pop(self) -> DeviceNotification: ...
+
+    def empty(self) -> bool:
+        return self.qsize() == 0
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> DeviceNotification:
+        with self._condition:
+            if block and not self._condition.wait_for(lambda: self.qsize() > 0, timeout=timeout):
+                raise queue.Empty
+            if self.qsize() == 0:
+                raise queue.Empty
+            notification = self._pop()
+            self._condition.notify_all()
+        symbol, sample, value = notification
+        if isinstance(value, DecodeOnGet):
+            # decoded by the consumer, outside of the lock
+            return symbol, sample, value.value
+        return notification
+
+    def get_nowait(self) -> DeviceNotification:
+        return self.get(block=False)
+
+
+class LatestValueBuffer(NotificationBuffer):
+    """Keeps only the latest notification, a new notification replaces the one which was not consumed yet.
+
+    For consumers which only need the current value, e.g. a UI, of a value which may change faster
+    than they consume it.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.__latest: Optional[DeviceNotification] = None
+
+    def put(self, notification: DeviceNotification) -> None:
+        with self._condition:
+            if self.__latest is not None:
+                self._dropped += 1
+            self.__latest = notification
+            self._condition.notify_all()
+
+    def qsize(self) -> int:
+        return 0 if self.__latest is None else 1
+
+    def _pop(self) -> DeviceNotification:
+        assert self.__latest is not None
+        notification, self.__latest = self.__latest, None
+        return notification
+
+
+class BoundedBuffer(NotificationBuffer):
+    """Keeps up to `maxsize` notifications in order, `overflow` decides what happens when it is full."""
+
+    def __init__(self, maxsize: int, overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST) -> None:
+        assert maxsize > 0
+        super().__init__()
+        self.__maxsize = maxsize
+        self.__overflow = overflow
+        self.__notifications: Deque[DeviceNotification] = deque()
+
+    @property
+    def maxsize(self) -> int:
+        return self.__maxsize
+
+    @property
+    def overflow(self) -> OverflowPolicy:
+        return self.__overflow
+
+    def put(self, notification: DeviceNotification) -> None:
+        with self._condition:
+            if len(self.__notifications) >= self.__maxsize:
+                if self.__overflow is OverflowPolicy.DROP_NEWEST:
+                    self._dropped += 1
+                    return
+                if self.__overflow is OverflowPolicy.DROP_OLDEST:
+                    self.__notifications.popleft()
+                    self._dropped += 1
+                else:
+                    self._condition.wait_for(lambda: len(self.__notifications) < self.__maxsize)
+            self.__notifications.append(notification)
+            self._condition.notify_all()
+
+    def qsize(self) -> int:
+        return len(self.__notifications)
+
+    def _pop(self) -> DeviceNotification:
+        return self.__notifications.popleft()
@@ -0,0 +1,90 @@
+import queue
+import threading
+from abc import ABC, abstractmethod
+from logging import Logger, getLogger
+from typing import Any, Callable, Hashable, List, Optional
+
+from .ads_symbol import ADSSymbol
+from .ams.ads_device_notification import AdsNotificationSample
+from .types import PLCData
+
+NotificationCallback = Callable[[ADSSymbol[PLCData], AdsNotificationSample, Any], None]
+"""Called with the symbol, the sample and the decoded value of a device notification."""
+
+
+class NotificationDispatcher(ABC):
+    """Runs the delivery of device notifications to their callbacks.
+
+    Deliveries with the same key, i.e. the notifications of one subscription, must run in the order
+    they are dispatched.
+    """
+
+    @abstractmethod
+    def dispatch(self, key: Hashable, delivery: Callable[[], None]) -> None: ...
+
+    def close(self) -> None:
+        """Stop the dispatcher after the pending deliveries have run."""
+
+
+class InlineDispatcher(NotificationDispatcher):
+    """Runs the callbacks on the socket reader thread.
+
+    Lowest latency, but a slow callback delays all responses and notifications of the client.
+    """
+
+    def __init__(self, logger: Optional[Logger] = None) -> None:
+        self.__logger = logger or getLogger(self.__class__.__name__)
+
+    def dispatch(self, key: Hashable, delivery: Callable[[], None]) -> None:
+        try:
+            delivery()
+        except Exception:
+            self.__logger.exception("Error in device notification callback")
+
+
+class ThreadPoolDispatcher(NotificationDispatcher):
+    """Runs the callbacks on `max_workers` threads.
+
+    Every key is assigned to one worker by its hash, so the notifications of a subscription are delivered
+    in order, while a slow callback only delays the subscriptions which share its worker.
+    """
+
+    def __init__(self, max_workers: int = 4, logger: Optional[Logger] = None) -> None:
+        assert max_workers > 0
+        self.__logger = logger or getLogger(self.__class__.__name__)
+        self.__queues: List["queue.SimpleQueue[Optional[Callable[[], None]]]"] = [
+            queue.SimpleQueue() for _ in range(max_workers)
+        ]
+        self.__workers = [
+            threading.Thread(target=self._work, args=(q,), name=f"{self.__class__.__name__}-{i}", daemon=True)
+            for i, q in enumerate(self.__queues)
+        ]
+        for worker in self.__workers:
+            worker.start()
+
+    def dispatch(self, key: Hashable, delivery: Callable[[], None]) -> None:
+        self.__queues[hash(key) % len(self.__queues)].put(delivery)
+
+    def close(self) -> None:
+        for q in self.__queues:
+            q.put(None)
+        for worker in self.__workers:
+            if worker is not threading.current_thread():
+                worker.join()
+
+    def _work(self, deliveries: "queue.SimpleQueue[Optional[Callable[[], None]]]") -> None:
+        while True:
+            delivery = deliveries.get()
+            if delivery is None:
+                return
+            try:
+                delivery()
+            except Exception:
+                self.__logger.exception("Error in device notification callback")
+
+
+class ThreadDispatcher(ThreadPoolDispatcher):
+    """Runs the callbacks on one dedicated thread, in the order the notifications are received."""
+
+    def __init__(self, logger: Optional[Logger] = None) -> None:
+        super().__init__(max_workers=1, logger=logger)
@@ -0,0 +1,345 @@
+import bisect
+import json
+import mmap
+import os
+import struct
+import threading
+from datetime import datetime
+from typing import IO, Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union, overload
+
+from .ads_symbol import ADSSymbol
+from .ams.ads_device_notification import (
+    AdsNotificationSample,
+    datetime_to_filetime,
+    filetime_to_unix_ns,
+    filetimes_to_datetime64,
+)
+from .helpers.decode_ams_payload import decode_ams_payload
+from .types import PLCData
+
+# A recording is a directory with a manifest and two column files per symbol:
+#
+# manifest.json: name, file stem, sample size and notification handle of every symbol
+# <stem>.time: header (magic, sample count, flags), followed by the FILETIME of every sample as little-endian uint64
+# <stem>.data: the raw data of every sample, every sample has the same size
+#
+# The files are memory-mapped and grow by doubling, the sample count in the header is updated after
+# the sample was written, so a reader never sees a partially written sample.
+#
+# The samples are stored in the order they are received. The samples of several subscriptions of one symbol,
+# or of different notification stamps, may not be in time order, then the `_UNORDERED` flag is set
+# and time ranges are found by a scan instead of a binary search.
+
+MANIFEST_FILE_NAME = "manifest.json"
+_MAGIC = b"PYADSNR2"
+_TIME_HEADER = struct.Struct("< 8s Q Q")
+_UNORDERED = 0x1  # a sample is older than the sample before it
+_FILETIME = struct.Struct("< Q")
+
+
+class _MappedFile:
+    """Append-only file which is written through a memory map that grows by doubling."""
+
+    def __init__(self, path: str, header_size: int, capacity: int) -> None:
+        self.__file: IO[bytes] = open(path, "w+b")
+        self.__header_size = header_size
+        self.size = header_size
+        self.__file.truncate(header_size + capacity)
+        self.map = mmap.mmap(self.__file.fileno(), header_size + capacity)
+
+    def reserve(self, length: int) -> int:
+        """Make room for `length` bytes at the end of the file and return their offset."""
+        offset = self.size
+        if offset + length > len(self.map):
+            capacity = max(2 * (len(self.map) - self.__header_size), offset + length - self.__header_size)
+            self.map.close()
+            self.__file.truncate(self.__header_size + capacity)
+            self.map = mmap.mmap(self.__file.fileno(), self.__header_size + capacity)
+        self.size = offset + length
+        return offset
+
+    def flush(self) -> None:
+        self.map.flush()
+
+    def close(self) -> None:
+        self.map.close()
+        self.__file.truncate(self.size)
+        self.__file.close()
+
+
+class _SymbolWriter:
+    def __init__(self, path: str, sample_size: int, capacity: int) -> None:
+        self.sample_size = sample_size
+        self.count = 0
+        self.flags = 0
+        self.last_filetime = 0
+        self.time = _MappedFile(path + ".time", _TIME_HEADER.size, 8 * capacity)
+        self.data = _MappedFile(path + ".data", 0, max(sample_size, 1) * capacity)
+        _TIME_HEADER.pack_into(self.time.map, 0, _MAGIC, 0, 0)
+
+    def append(self, filetime: int, data: bytes) -> None:
+        assert len(data) == self.sample_size, f"Sample of {len(data)} bytes, expected {self.sample_size}"
+        offset = self.data.reserve(self.sample_size)
+        self.data.map[offset : offset + self.sample_size] = data
+        time_offset = self.time.reserve(8)
+        _FILETIME.pack_into(self.time.map, time_offset, filetime)
+        if filetime < self.last_filetime:
+            self.flags |= _UNORDERED
+        self.last_filetime = filetime
+        self.count += 1
+        _TIME_HEADER.pack_into(self.time.map, 0, _MAGIC, self.count, self.flags)
+
+    def flush(self) -> None:
+        self.data.flush()
+        self.time.flush()
+
+    def close(self) -> None:
+        self.data.close()
+        self.time.close()
+
+
+class NotificationRecorder:
+    """Records the raw samples of device notifications into a columnar recording in `directory`.
+
+    Only the FILETIME and the raw data of every sample are stored, read them back with `NotificationRecording`.
+    The recorder can be passed as `callback` to `ADSClient.add_device_notification`. Create the client with
+    `lazy_decode=True`, so the samples are not decoded before they are recorded.
+
+    `capacity` is the initial number of samples per symbol the files are allocated for.
+    """
+
+    def __init__(self, directory: Union[str, "os.PathLike[str]"], capacity: int = 4096) -> None:
+        os.makedirs(directory, exist_ok=False)
+        self.__directory = os.fspath(directory)
+        self.__capacity = capacity
+        self.__lock = threading.Lock()
+        self.__writers: Dict[str, _SymbolWriter] = {}  # key is symbol name
+        self.__manifest: Dict[str, Dict[str, Any]] = {}  # key is symbol name
+        self.__closed = False
+        self._write_manifest()
+
+    def __enter__(self) -> "NotificationRecorder":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __call__(self, symbol: ADSSymbol[PLCData], sample: AdsNotificationSample, data: Any = None) -> None:
+        self.record(symbol, sample)
+
+    def record(self, symbol: ADSSymbol[PLCData], sample: AdsNotificationSample) -> None:
+        with self.__lock:
+            assert not self.__closed, "Recorder is closed"
+            writer = self.__writers.get(symbol.name)
+            if writer is None:
+                writer = self._add_symbol(symbol, sample)
+            writer.append(sample.timestamp, sample.data)
+
+    def _add_symbol(self, symbol: ADSSymbol[PLCData], sample: AdsNotificationSample) -> _SymbolWriter:
+        stem = f"{len(self.__writers):06d}"
+        writer = _SymbolWriter(
+            os.path.join(self.__directory, stem), sample_size=symbol.plc_t.bytes_length, capacity=self.__capacity
+        )
+        self.__writers[symbol.name] = writer
+        self.__manifest[symbol.name] = {"file": stem, "sample_size": writer.sample_size, "handle": sample.handle}
+        self._write_manifest()
+        return writer
+
+    def _write_manifest(self) -> None:
+        path = os.path.join(self.__directory, MANIFEST_FILE_NAME)
+        with open(path + ".tmp", "w") as f:
+            json.dump({"version": 1, "symbols": self.__manifest}, f, indent=2)
+        os.replace(path + ".tmp", path)
+
+    def flush(self) -> None:
+        """Flush the memory maps to disk."""
+        with self.__lock:
+            for writer in self.__writers.values():
+                writer.flush()
+
+    def close(self) -> None:
+        with self.__lock:
+            if self.__closed:
+                return
+            self.__closed = True
+            for writer in self.__writers.values():
+                writer.close()
+
+
+class _FileTimes(Sequence[int]):
+    """View of a time column, the little-endian FILETIMEs are decoded when they are accessed."""
+
+    def __init__(self, buffer: memoryview) -> None:
+        self.__buffer = buffer
+
+    def __len__(self) -> int:
+        return len(self.__buffer) // _FILETIME.size
+
+    @overload
+    def __getitem__(self, index: int) -> int: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "_FileTimes": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[int, "_FileTimes"]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            assert step == 1, "Only contiguous slices are supported"
+            return _FileTimes(self.__buffer[start * _FILETIME.size : stop * _FILETIME.size])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Sample index out of range")
+        (filetime,) = _FILETIME.unpack_from(self.__buffer, index * _FILETIME.size)
+        return filetime  # type: ignore[no-any-return]
+
+    def __iter__(self) -> Iterator[int]:
+        for (filetime,) in _FILETIME.iter_unpack(self.__buffer):
+            yield filetime
+
+
+class RecordedSamples(Sequence[Tuple[int, Any]]):
+    """Samples of one symbol in a recording, items are `(filetime, value)`.
+
+    The values are decoded with the `PLCData` of the symbol when they are accessed.
+    """
+
+    def __init__(self, symbol: ADSSymbol[PLCData], timestamps: _FileTimes, data: memoryview) -> None:
+        self.__symbol = symbol
+        self.__timestamps = timestamps
+        self.__data = data
+        self.__sample_size = symbol.plc_t.bytes_length
+
+    @property
+    def symbol(self) -> ADSSymbol[PLCData]:
+        return self.__symbol
+
+    def __len__(self) -> int:
+        return len(self.__timestamps)
+
+    @overload
+    def __getitem__(self, index: int) -> Tuple[int, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "RecordedSamples": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Tuple[int, Any], "RecordedSamples"]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            assert step == 1, "Only contiguous slices are supported"
+            return RecordedSamples(
+                self.__symbol,
+                self.__timestamps[start:stop],
+                self.__data[start * self.__sample_size : stop * self.__sample_size],
+            )
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Sample index out of range")
+        return self.__timestamps[index], self.value(index)
+
+    def raw(self, index: int) -> bytes:
+        """Raw data of the sample at `index`."""
+        return bytes(self.__data[index * self.__sample_size : (index + 1) * self.__sample_size])
+
+    def value(self, index: int) -> Any:
+        return decode_ams_payload(raw_data=self.raw(index), plc_t=self.__symbol.plc_t)  # type: ignore
+
+    def values(self) -> Iterator[Any]:
+        for index in range(len(self)):
+            yield self.value(index)
+
+    def filetimes(self) -> Sequence[int]:
+        """FILETIME of every sample, a view of the memory-mapped file."""
+        return self.__timestamps
+
+    def timestamps_ns(self) -> List[int]:
+        """Update time of every sample in nanoseconds since January 1, 1970 UTC."""
+        return [filetime_to_unix_ns(filetime) for filetime in self.__timestamps]
+
+    def timestamps_datetime64(self) -> Any:
+        """Update time of every sample as a `datetime64[ns]` NumPy array."""
+        return filetimes_to_datetime64(list(self.__timestamps))
+
+
+class NotificationRecording:
+    """Reads a recording of `NotificationRecorder`, also while it is being recorded.
+
+    The files are memory-mapped, samples are read and decoded only when they are accessed.
+    The samples of a symbol are in the order they were received, time ranges are found by a binary search
+    of their timestamps, or by a scan if they are not in time order.
+    """
+
+    def __init__(self, directory: Union[str, "os.PathLike[str]"]) -> None:
+        self.__directory = os.fspath(directory)
+        with open(os.path.join(self.__directory, MANIFEST_FILE_NAME)) as f:
+            self.__manifest: Dict[str, Dict[str, Any]] = json.load(f)["symbols"]
+        self.__maps: List[mmap.mmap] = []
+
+    def __enter__(self) -> "NotificationRecording":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def symbol_names(self) -> List[str]:
+        return list(self.__manifest)
+
+    def handle(self, name: str) -> int:
+        """Notification handle of the first recorded sample of the symbol."""
+        return int(self.__manifest[name]["handle"])
+
+    def samples(
+        self, symbol: ADSSymbol[PLCData], start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> RecordedSamples:
+        """Samples of `symbol` with `start <= update time < end`, in the order they were received."""
+        entry = self.__manifest[symbol.name]
+        assert entry["sample_size"] == symbol.plc_t.bytes_length, f"Samples of {symbol.name} have a different size"
+        path = os.path.join(self.__directory, entry["file"])
+        time_map = self._map(path + ".time")
+        magic, count, flags = _TIME_HEADER.unpack_from(time_map, 0)
+        assert magic == _MAGIC, f"Not a notification recording: {path}.time"
+        sample_size = entry["sample_size"]
+        data = memoryview(self._map(path + ".data")) if count and sample_size else memoryview(b"")
+        # the files may have grown after they were mapped
+        count = min(count, (len(time_map) - _TIME_HEADER.size) // 8)
+        if sample_size:
+            count = min(count, len(data) // sample_size)
+        timestamps = _FileTimes(memoryview(time_map)[_TIME_HEADER.size : _TIME_HEADER.size + 8 * count])
+        samples = RecordedSamples(symbol, timestamps, data[: count * sample_size])
+        if start is None and end is None:
+            return samples
+
+        start_filetime = 0 if start is None else datetime_to_filetime(start)
+        end_filetime = None if end is None else datetime_to_filetime(end)
+        if flags & _UNORDERED:
+            # the samples of the range are not contiguous, they are copied
+            indexes = [
+                i
+                for i, filetime in enumerate(timestamps)
+                if start_filetime <= filetime and (end_filetime is None or filetime < end_filetime)
+            ]
+            return RecordedSamples(
+                symbol,
+                _FileTimes(memoryview(b"".join(_FILETIME.pack(timestamps[i]) for i in indexes))),
+                memoryview(b"".join(data[i * sample_size : (i + 1) * sample_size] for i in indexes)),
+            )
+        first = bisect.bisect_left(timestamps, start_filetime)
+        last = count if end_filetime is None else bisect.bisect_left(timestamps, end_filetime)
+        return samples[first:last]
+
+    def _map(self, path: str) -> mmap.mmap:
+        with open(path, "rb") as f:
+            m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.__maps.append(m)
+        return m
+
+    def close(self) -> None:
+        """Close the memory maps, the samples which were returned can not be accessed anymore."""
+        for m in self.__maps:
+            try:
+                m.close()
+            except BufferError:
+                pass  # still referenced by samples, closed when they are garbage collected
+        self.__maps.clear()
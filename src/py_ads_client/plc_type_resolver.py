@@ -0,0 +1,159 @@
+import re
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .ams.ads_data_type_upload import ADSDataTypeEntry
+from .constants.ads_data_type import ADSDataType
+from .helpers.plc_type_name import builtin_plc_type
+from .types import (
+    ARRAY,
+    BOOL,
+    DINT,
+    INT,
+    LINT,
+    LREAL,
+    REAL,
+    SINT,
+    STRING,
+    STRUCT,
+    UDINT,
+    UINT,
+    ULINT,
+    USINT,
+    WSTRING,
+    PLCData,
+)
+
+_ARRAY_TYPE_NAME = re.compile(r"ARRAY\s*\[(?P<bounds>[^\]]*)\]\s*OF\s+(?P<item_type>.+)", re.IGNORECASE | re.DOTALL)
+_ARRAY_BOUNDS = re.compile(r"\s*(-?\d+)\s*\.\.\s*(-?\d+)\s*")
+
+# fallback for types which are only described by their ADS data type, e.g. enums without a base type
+_ADS_DATA_TYPES: Dict[int, PLCData] = {
+    ADSDataType.ADST_BIT.value: BOOL,
+    ADSDataType.ADST_INT8.value: SINT,
+    ADSDataType.ADST_UINT8.value: USINT,
+    ADSDataType.ADST_INT16.value: INT,
+    ADSDataType.ADST_UINT16.value: UINT,
+    ADSDataType.ADST_INT32.value: DINT,
+    ADSDataType.ADST_UINT32.value: UDINT,
+    ADSDataType.ADST_INT64.value: LINT,
+    ADSDataType.ADST_UINT64.value: ULINT,
+    ADSDataType.ADST_REAL32.value: REAL,
+    ADSDataType.ADST_REAL64.value: LREAL,
+}
+
+
+class PLCTypeResolver:
+    """Builds `PLCData` from the data type entries of the PLC, use it through `ADSClient.get_plc_type`.
+
+    Built-in types such as `INT` or `STRING(80)` and arrays with literal bounds are built without a request,
+    other entries are read with `fetch` when they are needed. Every type is built once and memoized by its
+    name, TwinCAT type names ignore case. Structs get the member offsets and the size of the entry,
+    i.e. the padding of the PLC, arrays get their lower bounds, multi-dimensional arrays become
+    an `ARRAY` of `ARRAY`.
+    """
+
+    def __init__(self, fetch: Optional[Callable[[str], ADSDataTypeEntry]] = None) -> None:
+        self.__fetch = fetch
+        self.__lock = threading.RLock()
+        self.__entries: Dict[str, ADSDataTypeEntry] = {}  # key is the lower case type name
+        self.__types: Dict[str, PLCData] = {}  # key is the lower case type name
+
+    @property
+    def entries(self) -> List[ADSDataTypeEntry]:
+        """The data type entries which were fetched or added."""
+        with self.__lock:
+            return list(self.__entries.values())
+
+    def add_entries(self, entries: Iterable[ADSDataTypeEntry]) -> None:
+        """Add entries, e.g. of the data type upload, so they do not have to be fetched."""
+        with self.__lock:
+            for entry in entries:
+                self.__entries[entry.name.lower()] = entry
+
+    def clear(self) -> None:
+        """Forget all entries and types, e.g. after an online change."""
+        with self.__lock:
+            self.__entries.clear()
+            self.__types.clear()
+
+    def resolve(self, type_name: str) -> PLCData:
+        key = type_name.strip().lower()
+        with self.__lock:
+            plc_t = self.__types.get(key)
+            if plc_t is None:
+                plc_t = self._build_type(type_name.strip())
+                self.__types[key] = plc_t
+            return plc_t
+
+    def _build_type(self, type_name: str) -> PLCData:
+        builtin = builtin_plc_type(type_name)
+        if builtin is not None:
+            return builtin
+        entry = self.__entries.get(type_name.lower())
+        if entry is None:
+            array = self._parse_array_type(type_name)
+            if array is not None:
+                return array
+            if self.__fetch is None:
+                raise KeyError(f"Unknown data type: {type_name}")
+            entry = self.__fetch(type_name)
+            self.__entries[type_name.lower()] = entry
+        return self._build_entry(entry)
+
+    def _parse_array_type(self, type_name: str) -> Optional[PLCData]:
+        """Build an array type like `ARRAY [0..2,1..4] OF INT` from its name, if the bounds are literals."""
+        match = _ARRAY_TYPE_NAME.fullmatch(type_name)
+        if match is None:
+            return None
+        array_info = []
+        for bounds in match.group("bounds").split(","):
+            bounds_match = _ARRAY_BOUNDS.fullmatch(bounds)
+            if bounds_match is None:
+                return None
+            lower_bound, upper_bound = int(bounds_match.group(1)), int(bounds_match.group(2))
+            array_info.append((lower_bound, upper_bound - lower_bound + 1))
+        return self._build_array(self.resolve(match.group("item_type")), array_info)
+
+    def _build_entry(self, entry: ADSDataTypeEntry) -> PLCData:
+        if entry.array_info:
+            item_type_name = entry.type_name
+            match = _ARRAY_TYPE_NAME.fullmatch(item_type_name)
+            if match is not None:
+                item_type_name = match.group("item_type")
+            plc_t = self._build_array(self.resolve(item_type_name), entry.array_info)
+        elif entry.sub_items:
+            plc_t = STRUCT(
+                fields=[(item.name, self._build_item(item)) for item in entry.sub_items],
+                offsets=[item.offset for item in entry.sub_items],
+                size=entry.size,
+            )
+        elif entry.type_name:
+            plc_t = self.resolve(entry.type_name)  # alias or enum
+        elif entry.data_type in _ADS_DATA_TYPES:
+            plc_t = _ADS_DATA_TYPES[entry.data_type]
+        elif entry.data_type == ADSDataType.ADST_STRING.value:
+            plc_t = STRING(entry.size - 1)
+        elif entry.data_type == ADSDataType.ADST_WSTRING.value:
+            plc_t = WSTRING(entry.size // 2 - 1)
+        else:
+            raise TypeError(f"Unsupported data type: {entry.name}")
+        if plc_t.bytes_length != entry.size:
+            raise TypeError(f"Size of {entry.name} is {entry.size} bytes, the built type has {plc_t.bytes_length}")
+        return plc_t
+
+    def _build_item(self, item: ADSDataTypeEntry) -> PLCData:
+        """Build the type of a struct member."""
+        if item.array_info or item.sub_items:
+            return self._build_entry(item)
+        upper_type_name = item.type_name.upper()
+        if upper_type_name.startswith(("POINTER TO ", "REFERENCE TO ")):
+            return ULINT if item.size == 8 else UDINT
+        return self.resolve(item.type_name)
+
+    @staticmethod
+    def _build_array(item_type: PLCData, array_info: List[Tuple[int, int]]) -> PLCData:
+        plc_t = item_type
+        for lower_bound, elements in reversed(array_info):
+            plc_t = ARRAY(plc_t, elements, lower_bound=lower_bound)
+        return plc_t
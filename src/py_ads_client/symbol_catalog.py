@@ -0,0 +1,216 @@
+import bisect
+import fnmatch
+import re
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, TypeVar
+
+from .ads_symbol import ADSSymbol
+from .ams.ads_symbol_upload import SYMBOL_ENTRY_HEADER, ADSSymbolEntry
+from .constants.encoding import TWINCAT_STRING_ENCODING
+from .constants.symbol_flag import SymbolFlag
+from .types import PLCData
+
+_GLOB_SPECIAL_CHARACTERS = re.compile(r"[*?\[]")
+
+T = TypeVar("T", bound=PLCData)
+
+
+def _decode(raw: bytes) -> str:
+    # the ASCII codec is implemented in C, unlike cp1252, and almost all PLC names are ASCII
+    return raw.decode("ascii") if raw.isascii() else raw.decode(TWINCAT_STRING_ENCODING)
+
+
+@dataclass()
+class SymbolInfo:
+    name: str
+    index_group: int
+    index_offset: int
+    size: int
+    """Size of the value in bytes."""
+    type_name: str
+    data_type: int
+    """`ADSDataType` value."""
+    flags: int
+    """`SymbolFlag` values."""
+    comment: str
+
+    @property
+    def read_only(self) -> bool:
+        return bool(self.flags & SymbolFlag.ADSSYMBOLFLAG_READONLY.value)
+
+
+class SymbolCatalog:
+    """The symbols of a PLC, as returned by `ADSClient.upload_symbols`.
+
+    The symbols are held in columns, the names are indexed case-insensitively, like TwinCAT resolves them,
+    and kept sorted, so prefix and glob lookups only scan the matching range of names.
+    `SymbolInfo` objects are created on access.
+    """
+
+    def __init__(self, entries: Iterable[ADSSymbolEntry] = ()) -> None:
+        self.__names: List[str] = []
+        self.__index_groups = array("I")
+        self.__index_offsets = array("I")
+        self.__sizes = array("I")
+        self.__data_types = array("I")
+        self.__flags = array("I")
+        self.__type_ids = array("I")
+        self.__type_names: List[str] = []
+        self.__type_name_ids: Dict[str, int] = {}
+        self.__comments: Dict[int, str] = {}  # key is the symbol index, only symbols with a comment
+        for entry in entries:
+            self._append(
+                entry.name,
+                entry.index_group,
+                entry.index_offset,
+                entry.size,
+                entry.data_type,
+                entry.flags,
+                entry.type_name,
+                entry.comment,
+            )
+        self._build_index()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SymbolCatalog":
+        """Build the catalog from the response of the symbol upload."""
+        catalog = cls()
+        unpack_from = SYMBOL_ENTRY_HEADER.unpack_from
+        header_size = SYMBOL_ENTRY_HEADER.size
+        type_names: Dict[bytes, str] = {}  # most symbols share a few type names, decode each only once
+        offset = 0
+        while offset + header_size <= len(data):
+            (
+                entry_length,
+                index_group,
+                index_offset,
+                size,
+                data_type,
+                flags,
+                name_length,
+                type_length,
+                comment_length,
+            ) = unpack_from(data, offset)
+            if entry_length <= 0:
+                break
+            start = offset + header_size
+            name = _decode(data[start : start + name_length])
+            start += name_length + 1
+            raw_type_name = data[start : start + type_length]
+            type_name = type_names.get(raw_type_name)
+            if type_name is None:
+                type_name = type_names[raw_type_name] = _decode(raw_type_name)
+            start += type_length + 1
+            comment = _decode(data[start : start + comment_length]) if comment_length else ""
+            catalog._append(name, index_group, index_offset, size, data_type, flags, type_name, comment)
+            offset += entry_length
+        catalog._build_index()
+        return catalog
+
+    def _append(
+        self,
+        name: str,
+        index_group: int,
+        index_offset: int,
+        size: int,
+        data_type: int,
+        flags: int,
+        type_name: str,
+        comment: str,
+    ) -> None:
+        type_id = self.__type_name_ids.get(type_name)
+        if type_id is None:
+            type_id = self.__type_name_ids[type_name] = len(self.__type_names)
+            self.__type_names.append(type_name)
+        if comment:
+            self.__comments[len(self.__names)] = comment
+        self.__names.append(name)
+        self.__index_groups.append(index_group)
+        self.__index_offsets.append(index_offset)
+        self.__sizes.append(size)
+        self.__data_types.append(data_type)
+        self.__flags.append(flags)
+        self.__type_ids.append(type_id)
+
+    def _build_index(self) -> None:
+        self.__by_name = {name.lower(): i for i, name in enumerate(self.__names)}
+        self.__sorted_names = sorted(self.__by_name)
+        self.__sorted_indexes = array("I", (self.__by_name[name] for name in self.__sorted_names))
+
+    def _info(self, index: int) -> SymbolInfo:
+        return SymbolInfo(
+            name=self.__names[index],
+            index_group=self.__index_groups[index],
+            index_offset=self.__index_offsets[index],
+            size=self.__sizes[index],
+            type_name=self.__type_names[self.__type_ids[index]],
+            data_type=self.__data_types[index],
+            flags=self.__flags[index],
+            comment=self.__comments.get(index, ""),
+        )
+
+    def __len__(self) -> int:
+        return len(self.__names)
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and name.lower() in self.__by_name
+
+    def __getitem__(self, name: str) -> SymbolInfo:
+        return self._info(self.__by_name[name.lower()])
+
+    def __iter__(self) -> Iterator[SymbolInfo]:
+        """The symbols in the order of the upload."""
+        return (self._info(i) for i in range(len(self.__names)))
+
+    def get(self, name: str) -> Optional[SymbolInfo]:
+        index = self.__by_name.get(name.lower())
+        return None if index is None else self._info(index)
+
+    def symbol(self, name: str, plc_t: T) -> ADSSymbol[T]:
+        """`ADSSymbol` with the index group and offset of the symbol, which is accessed without a handle.
+
+        `plc_t` can be built from the type name, e.g. `client.get_plc_type(catalog[name].type_name)`.
+        """
+        index = self.__by_name[name.lower()]
+        size = self.__sizes[index]
+        if plc_t.bytes_length != size:
+            raise TypeError(f"Size of {name} is {size} bytes, the type has {plc_t.bytes_length}")
+        return ADSSymbol(
+            name=self.__names[index],
+            plc_t=plc_t,
+            index_group=self.__index_groups[index],
+            index_offset=self.__index_offsets[index],
+        )
+
+    @property
+    def names(self) -> List[str]:
+        """The names of the symbols in the order of the upload."""
+        return list(self.__names)
+
+    @property
+    def type_names(self) -> List[str]:
+        """The distinct type names of the symbols."""
+        return list(self.__type_names)
+
+    def _prefix_range(self, prefix: str) -> range:
+        prefix = prefix.lower()
+        start = bisect.bisect_left(self.__sorted_names, prefix)
+        stop = bisect.bisect_left(self.__sorted_names, prefix + "\U0010ffff", lo=start)
+        return range(start, stop)
+
+    def with_prefix(self, prefix: str) -> List[SymbolInfo]:
+        """The symbols whose name starts with `prefix`, sorted by name."""
+        return [self._info(self.__sorted_indexes[i]) for i in self._prefix_range(prefix)]
+
+    def glob(self, pattern: str) -> List[SymbolInfo]:
+        """The symbols whose name matches the shell-style `pattern`, e.g. `MAIN.fb*.n?`, sorted by name."""
+        pattern = pattern.lower()
+        special = _GLOB_SPECIAL_CHARACTERS.search(pattern)
+        literal_prefix = pattern if special is None else pattern[: special.start()]
+        match = re.compile(fnmatch.translate(pattern)).match
+        return [
+            self._info(self.__sorted_indexes[i])
+            for i in self._prefix_range(literal_prefix)
+            if match(self.__sorted_names[i])
+        ]
@@ -1,14 +1,21 @@
+from concurrent.futures import Future
+from typing import Callable, List, Union
 from unittest import mock
 
 import pytest
 
 from ..ads_client import ADSClient
+from ..ads_symbol import ADSSymbol
 from ..ams.ads_read import ADSReadResponse
 from ..ams.ads_read_device_info import ADSReadDeviceInfoResponse
+from ..ams.ads_read_write import ADSReadWriteResponse
+from ..ams.ads_response import ADSResponse
 from ..ams.ams_header import AMSHeader
 from ..constants.command_id import ADSCommand
 from ..constants.return_code import ADSErrorCode
 from ..constants.state_flag import StateFlag
+from ..exceptions import ADSError
+from ..types import BOOL, DINT, INT
 
 
 def test_current_invoke_id() -> None:
@@ -35,14 +42,14 @@ def test_send_ams_packet_timeout() -> None:
 
     with mock.patch("socket.socket") as mock_socket_class:
         mock_socket = mock.Mock()
-        mock_socket.recv.return_value = b""
+        mock_socket.recv_into.return_value = 0
 
         mock_socket_class.side_effect = [mock_socket]
 
         client.open(target_ip=target_ip, target_ams_net_id="192.168.88.20.1.1")
         mock_socket.connect.assert_called_once_with((target_ip, 48898))
 
-        assert len(client._responses) == 0
+        assert len(client._pending_requests) == 0
 
         with pytest.raises(TimeoutError):
             client._send_ams_packet(command=ADSCommand.ADSSRVID_READ, payload=b"\x01\x02\x03\x04")
@@ -57,10 +64,10 @@ def test_send_ams_packet_timeout() -> None:
             )
         )
 
-        assert len(client._responses) == 0
+        assert len(client._pending_requests) == 0
 
         def mock_sendall(data: bytes) -> None:
-            client._responses[2] = ADSErrorCode.ADSERR_DEVICE_ERROR
+            client._set_response(invoke_id=2, response=ADSErrorCode.ADSERR_DEVICE_ERROR)
 
         mock_socket.sendall.side_effect = mock_sendall
 
@@ -78,7 +85,7 @@ def test_send_ams_packet_error() -> None:
 
     with mock.patch("socket.socket") as mock_socket_class:
         mock_socket = mock.Mock()
-        mock_socket.recv.return_value = b""
+        mock_socket.recv_into.return_value = 0
 
         mock_socket_class.side_effect = [mock_socket]
 
@@ -86,12 +93,14 @@ def test_send_ams_packet_error() -> None:
         mock_socket.connect.assert_called_once_with((target_ip, 48898))
 
         def mock_sendall(data: bytes) -> None:
-            client._responses[1] = ADSErrorCode.ADSERR_DEVICE_ERROR
+            client._set_response(invoke_id=1, response=ADSErrorCode.ADSERR_DEVICE_ERROR)
 
         mock_socket.sendall.side_effect = mock_sendall
 
-        with pytest.raises(RuntimeError):
+        with pytest.raises(ADSError) as exc_info:
             client._send_ams_packet(command=ADSCommand.ADSSRVID_READ, payload=b"\x01\x02\x03\x04")
+        assert exc_info.value.error_code == ADSErrorCode.ADSERR_DEVICE_ERROR
+        assert len(client._pending_requests) == 0
 
 
 def test_send_ams_packet_normal() -> None:
@@ -104,7 +113,7 @@ def test_send_ams_packet_normal() -> None:
 
     with mock.patch("socket.socket") as mock_socket_class:
         mock_socket = mock.Mock()
-        mock_socket.recv.return_value = b""
+        mock_socket.recv_into.return_value = 0
 
         mock_socket_class.side_effect = [mock_socket]
 
@@ -114,7 +123,7 @@ def test_send_ams_packet_normal() -> None:
         response = ADSReadResponse(result=ADSErrorCode.ERR_NOERROR, data=b"\x01\x02\x03\x04")
 
         def mock_sendall(data: bytes) -> None:
-            client._responses[1] = response
+            client._set_response(invoke_id=1, response=response)
 
         mock_socket.sendall.side_effect = mock_sendall
 
@@ -130,7 +139,7 @@ def test_client_close() -> None:
 
     with mock.patch("socket.socket") as mock_socket_class:
         mock_socket = mock.Mock()
-        mock_socket.recv.return_value = b""
+        mock_socket.recv_into.return_value = 0
 
         mock_socket_class.side_effect = [mock_socket]
 
@@ -141,6 +150,18 @@ def test_client_close() -> None:
         mock_socket.close.assert_called_once()
 
 
+def mock_recv_into(chunks: List[bytes]) -> Callable[[memoryview], int]:
+    def recv_into(buffer: memoryview) -> int:
+        chunk = chunks.pop(0)
+        if len(chunk) > len(buffer):
+            chunks.insert(0, chunk[len(buffer) :])
+            chunk = chunk[: len(buffer)]
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+    return recv_into
+
+
 def test_read_socket_background() -> None:
     client = ADSClient(local_ams_net_id="192.168.88.100.1.1", timeout_s=0.1)
 
@@ -152,11 +173,32 @@ def test_read_socket_background() -> None:
     tcp_header_2 = bytes.fromhex("00 00 24 00 00 00")
 
     mock_socket = mock.Mock()
-    mock_socket.recv.side_effect = [tcp_header, ams_header, ams_body, tcp_header_2, b""]
+    mock_socket.recv_into.side_effect = mock_recv_into([tcp_header, ams_header, ams_body, tcp_header_2, b""])
+
+    packets: List[bytes] = []
+    with mock.patch.object(
+        client, "_handle_ams_raw_packet", side_effect=lambda packet: packets.append(bytes(packet))
+    ) as mock_handle_ams_raw_packet:
+        client._read_socket_background(socket=mock_socket)
+        mock_handle_ams_raw_packet.assert_called_once()
+    assert packets == [ams_header + ams_body]
+
+
+def test_read_socket_background_small_buffer() -> None:
+    # frames larger than the receive buffer, and frames split at the end of the buffer
+    client = ADSClient(local_ams_net_id="192.168.88.100.1.1", timeout_s=0.1, receive_buffer_size=16)
+
+    frames = [bytes(range(i, i + 10 * i)) for i in range(1, 6)]
+    stream = b"".join(b"\x00\x00" + len(frame).to_bytes(4, byteorder="little") + frame for frame in frames)
+    chunks = [stream[i : i + 7] for i in range(0, len(stream), 7)] + [b""]
+
+    mock_socket = mock.Mock()
+    mock_socket.recv_into.side_effect = mock_recv_into(chunks)
 
-    with mock.patch.object(client, "_handle_ams_raw_packet") as mock_handle_ams_raw_packet:
+    packets: List[bytes] = []
+    with mock.patch.object(client, "_handle_ams_raw_packet", side_effect=lambda packet: packets.append(bytes(packet))):
         client._read_socket_background(socket=mock_socket)
-        mock_handle_ams_raw_packet.assert_called_once_with(packet=ams_header + ams_body)
+    assert packets == frames
 
 
 def test_handle_ams_raw_packet() -> None:
@@ -185,15 +227,135 @@ def test_handle_ams_raw_packet() -> None:
         invoke_id=1,
     )
 
+    future: Future[ADSResponse] = Future()
+    client._pending_requests[1] = future
     client._handle_ams_raw_packet(packet=header.to_bytes() + payload_bytes)
-    assert client._responses[1] == header.error_code
+    exception = future.exception()
+    assert isinstance(exception, ADSError)
+    assert exception.error_code == header.error_code
 
-    client._responses.pop(1)
+    future = Future()
+    client._pending_requests[1] = future
     header.error_code = ADSErrorCode.ERR_NOERROR
     client._handle_ams_raw_packet(packet=header.to_bytes() + payload_bytes)
-    assert client._responses[1] == payload.result
+    exception = future.exception()
+    assert isinstance(exception, ADSError)
+    assert exception.error_code == payload.result
 
-    client._responses.pop(1)
+    future = Future()
+    client._pending_requests[1] = future
     payload.result = ADSErrorCode.ERR_NOERROR
     client._handle_ams_raw_packet(packet=header.to_bytes() + payload.to_bytes())
-    assert client._responses[1] == payload
+    assert future.result() == payload
+    assert len(client._pending_requests) == 0
+
+
+def test_read_symbols() -> None:
+    client = ADSClient(local_ams_net_id="192.168.88.100.1.1", timeout_s=0.1, max_sum_command_items=2)
+
+    int_symbol = ADSSymbol(name="GVL.intVar", plc_t=INT)
+    bool_symbol = ADSSymbol(name="GVL.boolVar", plc_t=BOOL)
+    unknown_symbol = ADSSymbol(name="GVL.unknownVar", plc_t=INT)
+    dint_symbol = ADSSymbol(name="GVL.dintVar", plc_t=DINT)
+    handles = {"GVL.intVar": 1, "GVL.boolVar": 2, "GVL.dintVar": 3}
+
+    def get_handles_by_name(names: List[str]) -> List[Union[int, ADSErrorCode]]:
+        return [handles.get(name, ADSErrorCode.ADSERR_DEVICE_SYMBOLNOTFOUND) for name in names]
+
+    sum_read_responses = [
+        ADSReadWriteResponse(result=ADSErrorCode.ERR_NOERROR, data=bytes.fromhex("00 00 00 00 00 00 00 00 7b 00 01")),
+        ADSReadWriteResponse(result=ADSErrorCode.ERR_NOERROR, data=bytes.fromhex("0c 07 00 00 00 00 00 00")),
+    ]
+
+    with mock.patch.object(client, "get_handles_by_name", side_effect=get_handles_by_name), mock.patch.object(
+        client, "_send_ams_packet", side_effect=sum_read_responses
+    ) as mock_send_ams_packet:
+        values = client.read_symbols([int_symbol, bool_symbol, unknown_symbol, dint_symbol])
+
+    assert values == [123, True, ADSErrorCode.ADSERR_DEVICE_SYMBOLNOTFOUND, ADSErrorCode.ADSERR_DEVICE_NOTFOUND]
+    assert mock_send_ams_packet.call_count == 2
+    first_request = mock_send_ams_packet.call_args_list[0].kwargs["payload"]
+    assert first_request[:8] == bytes.fromhex("80 f0 00 00 02 00 00 00")
+
+
+def test_write_symbols() -> None:
+    client = ADSClient(local_ams_net_id="192.168.88.100.1.1", timeout_s=0.1)
+
+    int_symbol = ADSSymbol(name="GVL.intVar", plc_t=INT)
+    bool_symbol = ADSSymbol(name="GVL.boolVar", plc_t=BOOL)
+    unknown_symbol = ADSSymbol(name="GVL.unknownVar", plc_t=INT)
+    handles = {"GVL.intVar": 1, "GVL.boolVar": 2}
+
+    def get_handles_by_name(names: List[str]) -> List[Union[int, ADSErrorCode]]:
+        return [handles.get(name, ADSErrorCode.ADSERR_DEVICE_SYMBOLNOTFOUND) for name in names]
+
+    sum_write_response = ADSReadWriteResponse(
+        result=ADSErrorCode.ERR_NOERROR, data=bytes.fromhex("00 00 00 00 0c 07 00 00")
+    )
+
+    with mock.patch.object(client, "get_handles_by_name", side_effect=get_handles_by_name), mock.patch.object(
+        client, "_send_ams_packet", return_value=sum_write_response
+    ) as mock_send_ams_packet:
+        results = client.write_symbols({int_symbol: 123, unknown_symbol: 1, bool_symbol: True})
+
+    assert results == {
+        int_symbol: ADSErrorCode.ERR_NOERROR,
+        unknown_symbol: ADSErrorCode.ADSERR_DEVICE_SYMBOLNOTFOUND,
+        bool_symbol: ADSErrorCode.ADSERR_DEVICE_NOTFOUND,
+    }
+    mock_send_ams_packet.assert_called_once()
+    request = mock_send_ams_packet.call_args.kwargs["payload"]
+    assert request[:8] == bytes.fromhex("81 f0 00 00 02 00 00 00")
+    assert request[-3:] == bytes.fromhex("7b 00 01")
+
+
+def test_get_and_release_handles() -> None:
+    client = ADSClient(local_ams_net_id="192.168.88.100.1.1", timeout_s=0.1)
+
+    get_handles_response = ADSReadWriteResponse(
+        result=ADSErrorCode.ERR_NOERROR,
+        data=bytes.fromhex("00 00 00 00 04 00 00 00 10 07 00 00 00 00 00 00 0e 00 80 4b"),
+    )
+    release_handles_response = ADSReadWriteResponse(result=ADSErrorCode.ERR_NOERROR, data=bytes.fromhex("00 00 00 00"))
+
+    with mock.patch.object(
+        client, "_send_ams_packet", side_effect=[get_handles_response, release_handles_response]
+    ) as mock_send_ams_packet:
+        handles = client._get_variable_handles(names=["GVL.intVar", "GVL.unknownVar", "GVL.intVar"])
+        assert handles == {"GVL.intVar": 0x4B80000E, "GVL.unknownVar": ADSErrorCode.ADSERR_DEVICE_SYMBOLNOTFOUND}
+
+        # cached handles are not requested again
+        assert client._get_variable_handles(names=["GVL.intVar"]) == {"GVL.intVar": 0x4B80000E}
+
+        client.close()
+
+    assert mock_send_ams_packet.call_count == 2
+    get_handles_request = mock_send_ams_packet.call_args_list[0].kwargs["payload"]
+    assert get_handles_request[:8] == bytes.fromhex("82 f0 00 00 02 00 00 00")
+    release_request = mock_send_ams_packet.call_args_list[1].kwargs["payload"]
+    assert release_request[:8] == bytes.fromhex("81 f0 00 00 01 00 00 00")
+    assert release_request[-4:] == bytes.fromhex("0e 00 80 4b")
+
+
+def test_send_async() -> None:
+    client = ADSClient(local_ams_net_id="192.168.88.100.1.1", timeout_s=0.1)
+
+    with mock.patch("socket.socket") as mock_socket_class:
+        mock_socket = mock.Mock()
+        mock_socket.recv_into.return_value = 0
+        mock_socket_class.side_effect = [mock_socket]
+
+        client.open(target_ip="192.168.88.20", target_ams_net_id="192.168.88.20.1.1")
+
+        futures = [client.send_async(command=ADSCommand.ADSSRVID_READ, payload=b"\x01\x02\x03\x04") for _ in range(3)]
+        assert mock_socket.sendall.call_count == 3
+        assert sorted(client._pending_requests) == [1, 2, 3]
+        assert not any(future.done() for future in futures)
+
+        responses = [ADSReadResponse(result=ADSErrorCode.ERR_NOERROR, data=bytes([i])) for i in range(3)]
+        # responses may arrive in any order, each one completes exactly its own request
+        for invoke_id in [3, 1, 2]:
+            client._set_response(invoke_id=invoke_id, response=responses[invoke_id - 1])
+
+        assert [future.result(timeout=0) for future in futures] == responses
+        assert len(client._pending_requests) == 0
@@ -0,0 +1,92 @@
+import struct
+
+import pytest
+
+from ..ads_client import ADSClient
+from ..ads_simulator import DATA_INDEX_GROUP, ADSSimulator
+from ..ads_symbol import ADSSymbol
+from ..ams.ads_read import ADSReadResponse
+from ..constants.ads_state import ADSState
+from ..constants.command_id import ADSCommand
+from ..constants.return_code import ADSErrorCode
+from ..exceptions import ADSError
+from ..types import ARRAY, DINT, INT, STRING, STRUCT
+
+INT_SYMBOL = ADSSymbol(name="GVL.intVar", plc_t=INT)
+DINT_SYMBOL = ADSSymbol(name="GVL.dintVar", plc_t=DINT)
+STRUCT_SYMBOL = ADSSymbol(name="GVL.structVar", plc_t=STRUCT([("name", STRING(10)), ("values", ARRAY(INT, 3))]))
+
+
+def open_client(simulator: ADSSimulator, timeout_s: float = 1) -> ADSClient:
+    client = ADSClient(local_ams_net_id="192.168.88.100.1.1", timeout_s=timeout_s)
+    client.open(target_ip="127.0.0.1", target_ams_net_id="192.168.88.20.1.1", target_tcp_port=simulator.port)
+    return client
+
+
+def test_simulator_read_write() -> None:
+    with ADSSimulator([INT_SYMBOL, DINT_SYMBOL, STRUCT_SYMBOL], fragment_size=7) as simulator:
+        simulator.set_value("GVL.intVar", -123)
+        client = open_client(simulator)
+
+        assert client.read_device_info().device_name == "Plc30 App"
+        assert client.read_state().ads_state == ADSState.ADSSTATE_RUN
+
+        assert client.read_symbol(INT_SYMBOL) == -123
+        client.write_symbol(DINT_SYMBOL, 456789)
+        assert simulator.get_value("GVL.dintVar") == 456789
+
+        value = {"name": "abc", "values": [1, 2, 3]}
+        client.write_symbol(STRUCT_SYMBOL, value)
+        assert client.read_symbol(STRUCT_SYMBOL) == value
+
+        unknown_symbol = ADSSymbol(name="GVL.unknownVar", plc_t=INT)
+        assert client.read_symbols([INT_SYMBOL, unknown_symbol, DINT_SYMBOL]) == [
+            -123,
+            ADSErrorCode.ADSERR_DEVICE_SYMBOLNOTFOUND,
+            456789,
+        ]
+        errors = client.write_symbols({INT_SYMBOL: 7, DINT_SYMBOL: 8})
+        assert set(errors.values()) == {ADSErrorCode.ERR_NOERROR}
+        assert simulator.get_value("GVL.intVar") == 7
+
+        payload = struct.pack("< I I I", DATA_INDEX_GROUP, simulator.index_offset("GVL.dintVar"), 4)
+        response = client._send_ams_packet(command=ADSCommand.ADSSRVID_READ, payload=payload)
+        assert isinstance(response, ADSReadResponse)
+        assert response.data == struct.pack("< i", 8)
+
+        client.close()
+
+
+def test_simulator_device_notification() -> None:
+    with ADSSimulator([INT_SYMBOL]) as simulator:
+        client = open_client(simulator)
+
+        client.add_device_notification(INT_SYMBOL)
+        symbol, _, value = client.device_notification_queue.get(timeout=1)
+        assert symbol is INT_SYMBOL
+        assert value == 0
+
+        simulator.set_value("GVL.intVar", 42)
+        _, _, value = client.device_notification_queue.get(timeout=1)
+        assert value == 42
+
+        client.del_device_notification(INT_SYMBOL)
+        assert simulator.notification_count == 0
+        client.close()
+
+
+def test_simulator_faults() -> None:
+    with ADSSimulator([INT_SYMBOL], latency_s=0.001, jitter_s=0.002, seed=1) as simulator:
+        client = open_client(simulator, timeout_s=0.2)
+
+        simulator.inject_error(ADSErrorCode.ADSERR_DEVICE_BUSY, command=ADSCommand.ADSSRVID_READSTATE)
+        with pytest.raises(ADSError) as exc_info:
+            client.read_state()
+        assert exc_info.value.error_code == ADSErrorCode.ADSERR_DEVICE_BUSY
+
+        simulator.drop_responses()
+        with pytest.raises(TimeoutError):
+            client.read_device_info()
+
+        assert client.read_state().ads_state == ADSState.ADSSTATE_RUN
+        client.close()
@@ -6,3 +6,10 @@ def test_ads_symbol() -> None:
     symbol = ADSSymbol("GVL.boolVar", BOOL)
     assert symbol.name == "GVL.boolVar"
     assert symbol.plc_t is BOOL
+
+
+def test_ads_symbol_address() -> None:
+    symbol = ADSSymbol("GVL.boolVar", BOOL, index_group=0x4040, index_offset=8)
+    assert symbol.index_group == 0x4040
+    assert symbol.index_offset == 8
+    assert ADSSymbol("GVL.boolVar", BOOL).index_group is None
@@ -0,0 +1,170 @@
+import asyncio
+import struct
+from typing import Dict, Tuple
+
+import pytest
+
+from ..ads_simulator import ADSSimulator
+from ..ads_symbol import ADSSymbol
+from ..ams.ads_read_device_info import ADSReadDeviceInfoResponse
+from ..ams.ams_header import AMSHeader
+from ..async_ads_client import AsyncADSClient
+from ..constants.command_id import ADSCommand
+from ..constants.return_code import ADSErrorCode
+from ..constants.state_flag import StateFlag
+from ..exceptions import ADSError
+from ..types import DINT, INT
+
+VARIABLES: Dict[str, Tuple[int, bytes]] = {  # key is variable name, value is handle and raw value
+    "GVL.intVar": (1, struct.pack("< h", -123)),
+    "GVL.dintVar": (2, struct.pack("< i", 456789)),
+}
+
+
+def handle_request(header: AMSHeader, body: bytes) -> Tuple[ADSErrorCode, bytes]:
+    values = {handle: value for handle, value in VARIABLES.values()}
+    if header.command_id == ADSCommand.ADSSRVID_READDEVICEINFO:
+        response = ADSReadDeviceInfoResponse(
+            result=ADSErrorCode.ERR_NOERROR, major_version=3, minor_version=1, build_version=4024, device_name="Plc30"
+        )
+        return ADSErrorCode.ERR_NOERROR, response.to_bytes()
+    if header.command_id == ADSCommand.ADSSRVID_READ:
+        _, handle, length = struct.unpack("< I I I", body)
+        return ADSErrorCode.ERR_NOERROR, struct.pack("< I I", 0, length) + values[handle]
+    if header.command_id == ADSCommand.ADSSRVID_READWRITE:
+        index_group, index_offset, _, write_length = struct.unpack_from("< I I I I", body)
+        write_data = body[16 : 16 + write_length]
+        if index_group == 0xF003:
+            name = write_data[:-1].decode()
+            if name not in VARIABLES:
+                return ADSErrorCode.ERR_NOERROR, struct.pack(
+                    "< I I", ADSErrorCode.ADSERR_DEVICE_SYMBOLNOTFOUND.value, 0
+                )
+            return ADSErrorCode.ERR_NOERROR, struct.pack("< I I I", 0, 4, VARIABLES[name][0])
+        if index_group == 0xF080:
+            error_codes = b""
+            data = b""
+            for i in range(index_offset):
+                _, handle, length = struct.unpack_from("< I I I", write_data, 12 * i)
+                error_codes += struct.pack("< I", 0)
+                data += values[handle]
+            return ADSErrorCode.ERR_NOERROR, struct.pack("< I I", 0, len(error_codes + data)) + error_codes + data
+        if index_group == 0xF081:
+            error_codes = bytes(4 * index_offset)
+            return ADSErrorCode.ERR_NOERROR, struct.pack("< I I", 0, len(error_codes)) + error_codes
+        if index_group == 0xF082:
+            headers = b""
+            data = b""
+            offset = 16 * index_offset
+            for i in range(index_offset):
+                _, _, _, name_length = struct.unpack_from("< I I I I", write_data, 16 * i)
+                name = write_data[offset : offset + name_length - 1].decode()
+                offset += name_length
+                if name in VARIABLES:
+                    headers += struct.pack("< I I", 0, 4)
+                    data += struct.pack("< I", VARIABLES[name][0])
+                else:
+                    headers += struct.pack("< I I", ADSErrorCode.ADSERR_DEVICE_SYMBOLNOTFOUND.value, 0)
+            return ADSErrorCode.ERR_NOERROR, struct.pack("< I I", 0, len(headers + data)) + headers + data
+    return ADSErrorCode.ERR_UNKNOWNCMDID, b""
+
+
+async def serve(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    while True:
+        try:
+            tcp_header = await reader.readexactly(6)
+        except asyncio.IncompleteReadError:
+            break
+        length = int.from_bytes(tcp_header[2:], byteorder="little")
+        packet = await reader.readexactly(length)
+        header = AMSHeader.from_bytes(packet[:32])
+        error_code, body = handle_request(header, packet[32:])
+        response_header = AMSHeader(
+            target_net_id=header.source_net_id,
+            target_port=header.source_port,
+            source_net_id=header.target_net_id,
+            source_port=header.target_port,
+            command_id=header.command_id,
+            state_flags=StateFlag.AMSCMDSF_ADSCMD | StateFlag.AMSCMDSF_RESPONSE,
+            length=len(body),
+            error_code=error_code,
+            invoke_id=header.invoke_id,
+        )
+        response = response_header.to_bytes() + body
+        writer.write(b"\x00\x00" + len(response).to_bytes(4, byteorder="little") + response)
+    writer.close()
+
+
+def test_async_client() -> None:
+    async def main() -> None:
+        server = await asyncio.start_server(serve, host="127.0.0.1", port=0)
+        port = server.sockets[0].getsockname()[1]
+        client = AsyncADSClient(local_ams_net_id="192.168.88.100.1.1", timeout_s=1)
+        await client.open(target_ip="127.0.0.1", target_ams_net_id="192.168.88.20.1.1", target_tcp_port=port)
+
+        device_info = await client.read_device_info()
+        assert device_info.device_name == "Plc30"
+
+        int_symbol = ADSSymbol(name="GVL.intVar", plc_t=INT)
+        dint_symbol = ADSSymbol(name="GVL.dintVar", plc_t=DINT)
+        unknown_symbol = ADSSymbol(name="GVL.unknownVar", plc_t=INT)
+
+        # many requests are in flight at the same time on one connection
+        values = await asyncio.gather(*(client.read_symbol(int_symbol) for _ in range(100)))
+        assert values == [-123] * 100
+
+        values = await client.read_symbols([int_symbol, unknown_symbol, dint_symbol])
+        assert values == [-123, ADSErrorCode.ADSERR_DEVICE_SYMBOLNOTFOUND, 456789]
+
+        with pytest.raises(ADSError) as exc_info:
+            await client.read_state()
+        assert exc_info.value.error_code == ADSErrorCode.ERR_UNKNOWNCMDID
+
+        await client.close()
+        server.close()
+        await server.wait_closed()
+
+    asyncio.run(main())
+
+
+def test_async_device_notification() -> None:
+    symbol = ADSSymbol(name="GVL.intVar", plc_t=INT)
+
+    async def main(simulator: ADSSimulator) -> None:
+        client = AsyncADSClient(local_ams_net_id="192.168.88.100.1.1", timeout_s=1)
+        await client.open(target_ip="127.0.0.1", target_ams_net_id="192.168.88.20.1.1", target_tcp_port=simulator.port)
+        notifications = client.notifications()
+        simulator.set_value(symbol.name, -5)
+
+        # the first sample is sent by the server before the response of the added notification
+        handle = await client.add_device_notification(symbol)
+        notification_symbol, sample, value = await asyncio.wait_for(notifications.__anext__(), timeout=1)
+        assert notification_symbol is symbol and sample.handle == handle and value == -5
+        simulator.set_value(symbol.name, 7)
+        assert (await asyncio.wait_for(notifications.__anext__(), timeout=1))[2] == 7
+
+        await client.del_device_notification_by_handle(handle)
+        assert simulator.notification_count == 0
+        await client.close()
+
+    with ADSSimulator([symbol]) as simulator:
+        asyncio.run(main(simulator))
+
+
+def test_async_concurrent_handles() -> None:
+    symbols = [ADSSymbol(name="GVL.intVar", plc_t=INT), ADSSymbol(name="GVL.dintVar", plc_t=DINT)]
+
+    async def main(simulator: ADSSimulator) -> None:
+        client = AsyncADSClient(local_ams_net_id="192.168.88.100.1.1", timeout_s=1)
+        await client.open(target_ip="127.0.0.1", target_ams_net_id="192.168.88.20.1.1", target_tcp_port=simulator.port)
+
+        # the coroutines miss the handle cache at the same time, the surplus handles are released
+        await asyncio.gather(
+            *(client.read_symbol(symbols[0]) for _ in range(10)), *(client.read_symbols(symbols) for _ in range(10))
+        )
+        assert simulator.handle_count == 2
+        await client.close()
+        assert simulator.handle_count == 0
+
+    with ADSSimulator(symbols) as simulator:
+        asyncio.run(main(simulator))
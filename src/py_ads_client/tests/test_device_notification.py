@@ -0,0 +1,144 @@
+import queue
+from typing import Any, Tuple
+
+import pytest
+
+from ..ads_client import ADSClient
+from ..ads_simulator import ADSSimulator
+from ..ads_symbol import ADSSymbol
+from ..ams.ads_device_notification import AdsNotificationSample
+from ..constants.return_code import ADSErrorCode
+from ..constants.transmission_mode import TransmissionMode
+from ..notification_buffer import LatestValueBuffer
+from ..types import INT, UINT, PLCData
+
+Notification = Tuple[ADSSymbol[PLCData], AdsNotificationSample, Any]
+
+
+def test_shared_device_notification() -> None:
+    symbol = ADSSymbol(name="GVL.intVar", plc_t=INT)
+    same_variable = ADSSymbol(name="gvl.INTVAR", plc_t=UINT)
+    received: "queue.Queue[Notification]" = queue.Queue()
+
+    with ADSSimulator([symbol]) as simulator:
+        client = ADSClient(local_ams_net_id="192.168.88.100.1.1")
+        client.open(target_ip="127.0.0.1", target_ams_net_id="192.168.88.20.1.1", target_tcp_port=simulator.port)
+        simulator.set_value(symbol.name, -1)
+
+        handle = client.add_device_notification(symbol)
+        assert client.device_notification_queue.get(timeout=1)[2] == -1
+        buffer = LatestValueBuffer()
+        assert client.add_device_notification(same_variable, buffer=buffer) == handle
+
+        def callback(*args: Any) -> None:
+            received.put(args)
+
+        assert client.add_device_notification(symbol, callback=callback) == handle
+        # with other settings, the notification is not shared
+        other_handle = client.add_device_notification(symbol, cycle_time_ms=100)
+        assert other_handle != handle
+        assert simulator.notification_count == 2
+
+        # a new subscriber gets the latest sample of the shared notification
+        notification_symbol, _, value = buffer.get(timeout=1)
+        assert notification_symbol is same_variable and value == 0xFFFF
+        assert received.get(timeout=1)[2] == -1
+        assert client.device_notification_queue.get(timeout=1)[2] == -1
+
+        simulator.set_value(symbol.name, 7)
+        assert client.device_notification_queue.get(timeout=1)[2] == 7
+        assert client.device_notification_queue.get(timeout=1)[2] == 7
+        assert buffer.get(timeout=1)[2] == 7
+        assert received.get(timeout=1)[2] == 7
+
+        client.del_device_notification_by_handle(handle, buffer=buffer)
+        client.del_device_notification_by_handle(other_handle)
+        assert simulator.notification_count == 1
+        client.del_device_notification_by_handle(handle)
+        assert simulator.notification_count == 1
+        # only the subscriber with the callback is left
+        with pytest.raises(ValueError):
+            client.del_device_notification_by_handle(handle)
+        client.del_device_notification_by_handle(handle, callback=callback)
+        assert simulator.notification_count == 0
+        # the notification has been deleted already, no request is sent
+        with pytest.raises(KeyError):
+            client.del_device_notification_by_handle(handle)
+        assert client.del_device_notifications([handle]) == [ADSErrorCode.ADSERR_DEVICE_NOTIFYHNDINVALID]
+
+        client.add_device_notification(symbol)
+        client.add_device_notification(symbol, cycle_time_ms=100)
+        assert simulator.notification_count == 2
+        client.del_device_notification(symbol)
+        assert simulator.notification_count == 0
+
+
+def test_del_device_notification_keeps_other_subscribers() -> None:
+    symbol_a = ADSSymbol(name="GVL.intVar", plc_t=INT)
+    symbol_b = ADSSymbol(name="GVL.intVar", plc_t=INT)
+
+    with ADSSimulator([symbol_a]) as simulator:
+        client = ADSClient(local_ams_net_id="192.168.88.100.1.1")
+        client.open(target_ip="127.0.0.1", target_ams_net_id="192.168.88.20.1.1", target_tcp_port=simulator.port)
+        buffer_a = LatestValueBuffer()
+        buffer_b = LatestValueBuffer()
+        handle = client.add_device_notification(symbol_a, buffer=buffer_a)
+        assert client.add_device_notification(symbol_b, buffer=buffer_b) == handle
+        assert buffer_b.get(timeout=1)[2] == 0
+
+        # the notification is shared, removing the subscriber of symbol_a keeps it for symbol_b
+        client.del_device_notification(symbol_a)
+        assert simulator.notification_count == 1
+        simulator.set_value(symbol_b.name, 3)
+        assert buffer_b.get(timeout=1)[2] == 3
+
+        client.del_device_notification(symbol_b)
+        assert simulator.notification_count == 0
+        client.close()
+        client.close()
+
+
+def test_cyclic_device_notification() -> None:
+    symbol = ADSSymbol(name="GVL.intVar", plc_t=INT)
+    with ADSSimulator([symbol]) as simulator:
+        client = ADSClient(local_ams_net_id="192.168.88.100.1.1")
+        client.open(target_ip="127.0.0.1", target_ams_net_id="192.168.88.20.1.1", target_tcp_port=simulator.port)
+
+        client.add_device_notification(
+            symbol, cycle_time_ms=10, transmission_mode=TransmissionMode.ADSTRANS_SERVERCYCLE
+        )
+        # the value does not change, but it is sent every cycle
+        samples = [client.device_notification_queue.get(timeout=1)[1] for _ in range(5)]
+        client.close()
+
+    assert len({sample.timestamp for sample in samples}) == 5
+
+
+def test_device_notification_group() -> None:
+    symbols = [ADSSymbol(name=f"GVL.intVar{i}", plc_t=INT) for i in range(10)]
+    with ADSSimulator(symbols) as simulator:
+        client = ADSClient(local_ams_net_id="192.168.88.100.1.1", max_sum_command_items=4)
+        client.open(target_ip="127.0.0.1", target_ams_net_id="192.168.88.20.1.1", target_tcp_port=simulator.port)
+        for i, symbol in enumerate(symbols):
+            simulator.set_value(symbol.name, i)
+        single_handle = client.add_device_notification(symbols[0])
+        assert client.device_notification_queue.get(timeout=1)[2] == 0
+
+        unknown = ADSSymbol(name="GVL.unknown", plc_t=INT)
+        handles = client.add_device_notifications([*symbols, unknown, symbols[1]])
+
+        assert handles[0] == single_handle
+        assert handles[-2] == ADSErrorCode.ADSERR_DEVICE_SYMBOLNOTFOUND
+        assert handles[-1] == handles[1]
+        assert simulator.notification_count == 10
+        values = sorted(client.device_notification_queue.get(timeout=1)[2] for _ in range(11))
+        assert values == [0, 1, 1, *range(2, 10)]
+        assert client.device_notification_queue.empty()
+
+        handles.pop(-2)
+        results = client.del_device_notifications(handles)  # type: ignore[arg-type]
+        assert results == [ADSErrorCode.ERR_NOERROR] * 11
+        assert simulator.notification_count == 1
+        client.del_device_notification_by_handle(single_handle)
+        assert simulator.notification_count == 0
+        client.close()
@@ -0,0 +1,46 @@
+from typing import List
+
+from ..ads_client import ADSClient
+from ..ads_simulator import ADSSimulator
+from ..ads_symbol import ADSSymbol
+from ..lazy_value import LazyValue
+from ..notification_buffer import LatestValueBuffer
+from ..types import INT, REAL, STRUCT
+
+
+def test_lazy_value() -> None:
+    plc_t = STRUCT([("a", INT), ("b", REAL)])
+    decode_times: List[int] = []
+    value = LazyValue(plc_t=plc_t, data=b"\x01\x00\x00\x00\x80\x3f", on_decoded=decode_times.append)
+
+    assert not value.decoded
+    assert repr(value) == "LazyValue(<6 bytes>)"
+    assert value.value == {"a": 1, "b": 1.0}
+    assert value.value is value.value
+    assert value.decoded
+    assert len(decode_times) == 1
+
+
+def test_lazy_device_notification() -> None:
+    symbol = ADSSymbol(name="GVL.intVar", plc_t=INT)
+    with ADSSimulator([symbol]) as simulator:
+        client = ADSClient(local_ams_net_id="192.168.88.100.1.1", lazy_decode=True)
+        client.open(target_ip="127.0.0.1", target_ams_net_id="192.168.88.20.1.1", target_tcp_port=simulator.port)
+
+        client.add_device_notification(symbol)
+        _, _, value = client.device_notification_queue.get(timeout=1)
+        assert isinstance(value, LazyValue)
+        assert not value.decoded
+        assert value.value == 0
+
+        buffer = LatestValueBuffer()
+        client.add_device_notification(symbol, buffer=buffer)
+        first = buffer.get(timeout=1)[2]
+        simulator.set_value(symbol.name, 1)
+        simulator.set_value(symbol.name, 2)
+        values = [client.device_notification_queue.get(timeout=1)[2] for _ in range(2)]
+        client.close()
+
+    assert [value.value for value in values] == [1, 2]
+    assert buffer.get(timeout=1)[2].value == 2
+    assert not first.decoded
@@ -0,0 +1,65 @@
+import os
+
+from ..ads_client import ADSClient
+from ..ads_simulator import ADSSimulator
+from ..ads_symbol import ADSSymbol
+from ..constants.command_id import ADSCommand
+from ..metadata_cache import SYMBOLS, MetadataCache
+from ..metrics import ClientMetrics
+from ..types import BOOL, INT, STRUCT
+
+
+def open_client(simulator: ADSSimulator, cache: MetadataCache) -> ADSClient:
+    client = ADSClient(local_ams_net_id="192.168.88.100.1.1", metadata_cache=cache, metrics=ClientMetrics())
+    client.open(target_ip="127.0.0.1", target_ams_net_id="192.168.88.20.1.1", target_tcp_port=simulator.port)
+    return client
+
+
+def read_count(client: ADSClient) -> int:
+    return client.stats().commands[ADSCommand.ADSSRVID_READ].requests
+
+
+def test_metadata_cache_get_put(tmp_path: str) -> None:
+    path = os.path.join(tmp_path, "metadata.sqlite")
+    with MetadataCache(path) as cache:
+        cache.put("1.2.3.4.1.1:851", SYMBOLS, 3, b"abc")
+        assert cache.get("1.2.3.4.1.1:851", SYMBOLS, 3, 3) == b"abc"
+        assert cache.get("1.2.3.4.1.1:851", SYMBOLS, 4, 3) is None
+        assert cache.get("1.2.3.4.1.1:851", SYMBOLS, 3, 4) is None
+        assert cache.get("1.2.3.4.1.1:852", SYMBOLS, 3, 3) is None
+
+    with MetadataCache(path) as cache:
+        assert cache.get("1.2.3.4.1.1:851", SYMBOLS, 3, 3) == b"abc"
+        cache.clear("1.2.3.4.1.1:851")
+        assert cache.get("1.2.3.4.1.1:851", SYMBOLS, 3, 3) is None
+
+
+def test_upload_with_metadata_cache(tmp_path: str) -> None:
+    path = os.path.join(tmp_path, "metadata.sqlite")
+    struct_t = STRUCT([("bFlag", BOOL), ("nValue", INT)], offsets=[0, 2], size=4)
+    with ADSSimulator([ADSSymbol(name="GVL.nValue", plc_t=INT)]) as simulator:
+        simulator.add_symbol(ADSSymbol(name="GVL.stValue", plc_t=struct_t), type_name="ST_Value")
+
+        with MetadataCache(path) as cache:
+            client = open_client(simulator, cache)
+            catalog = client.upload_symbols()
+            entries = client.upload_data_types()
+            # upload info, symbol version and upload of both
+            assert read_count(client) == 6
+            client.close()
+
+        # a restart against the unchanged PLC loads the uploads from the cache
+        with MetadataCache(path) as cache:
+            client = open_client(simulator, cache)
+            assert client.upload_symbols().names == catalog.names
+            assert client.upload_data_types() == entries
+            assert read_count(client) == 4
+            assert client.get_plc_type("ST_Value").bytes_length == 4
+            client.close()
+
+            # the symbol version changes with every new symbol
+            simulator.add_symbol(ADSSymbol(name="GVL.nOther", plc_t=INT))
+            client = open_client(simulator, cache)
+            assert client.upload_symbols().names == ["GVL.nValue", "GVL.stValue", "GVL.nOther"]
+            assert read_count(client) == 3
+            client.close()
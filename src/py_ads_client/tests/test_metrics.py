@@ -0,0 +1,102 @@
+import threading
+from typing import List
+
+import pytest
+
+from ..ads_client import ADSClient
+from ..ads_simulator import ADSSimulator
+from ..ads_symbol import ADSSymbol
+from ..constants.command_id import ADSCommand
+from ..constants.return_code import ADSErrorCode
+from ..exceptions import ADSError
+from ..metrics import ClientMetrics, LatencyHistogram, MetricsSnapshot
+from ..types import INT
+
+
+def test_latency_histogram() -> None:
+    histogram = LatencyHistogram()
+    for value_ns in range(1, 10001):
+        histogram.record_ns(value_ns * 1000)
+
+    snapshot = histogram.snapshot()
+
+    assert snapshot.count == 10000
+    assert snapshot.min_s == pytest.approx(1e-6)
+    assert snapshot.max_s == pytest.approx(10e-3)
+    assert snapshot.mean_s == pytest.approx(5.0005e-3)
+    assert snapshot.p50_s == pytest.approx(5e-3, rel=0.01)
+    assert snapshot.p99_s == pytest.approx(9.9e-3, rel=0.01)
+    assert sum(count for _, count in snapshot.buckets) == 10000
+    assert len(snapshot.buckets) < 1000
+
+
+def test_client_metrics() -> None:
+    symbol = ADSSymbol(name="GVL.intVar", plc_t=INT)
+    exported: List[MetricsSnapshot] = []
+    exported_event = threading.Event()
+
+    def exporter(snapshot: MetricsSnapshot) -> None:
+        exported.append(snapshot)
+        exported_event.set()
+
+    metrics = ClientMetrics(exporter=exporter, export_interval_s=0.01)
+    with ADSSimulator([symbol]) as simulator:
+        client = ADSClient(local_ams_net_id="192.168.88.100.1.1", timeout_s=0.2, metrics=metrics)
+        client.open(target_ip="127.0.0.1", target_ams_net_id="192.168.88.20.1.1", target_tcp_port=simulator.port)
+
+        for _ in range(10):
+            client.read_symbol(symbol)
+        simulator.inject_error(ADSErrorCode.ADSERR_DEVICE_BUSY, command=ADSCommand.ADSSRVID_READ)
+        with pytest.raises(ADSError):
+            client.read_symbol(symbol)
+        simulator.drop_responses(command=ADSCommand.ADSSRVID_READ)
+        with pytest.raises(TimeoutError):
+            client.read_symbol(symbol)
+        client.add_device_notification(symbol)
+        client.device_notification_queue.get(timeout=1)
+
+        stats = client.stats()
+        client.close()
+
+    read = stats.commands[ADSCommand.ADSSRVID_READ]
+    assert read.requests == 12
+    assert read.responses == 11
+    assert read.timeouts == 1
+    assert read.errors == {ADSErrorCode.ADSERR_DEVICE_BUSY: 1}
+    assert read.bytes_sent == 12 * (6 + 32 + 12)
+    assert read.latency.count == 11
+    assert read.decode.count == 10
+    assert 0 < read.latency.p50_s < 0.2
+    assert stats.commands[ADSCommand.ADSSRVID_READWRITE].requests == 1  # handle by name
+    assert stats.in_flight == 0
+    assert stats.max_in_flight == 1
+    assert stats.notifications.samples == 1
+    assert stats.notifications.decode.count == 1
+    assert stats.notifications.queue_depth == 0
+
+    assert exported_event.wait(timeout=1)
+    metrics.close()
+    assert isinstance(exported[0], MetricsSnapshot)
+
+
+def test_failing_exporter(caplog: pytest.LogCaptureFixture) -> None:
+    exported: List[MetricsSnapshot] = []
+    exported_event = threading.Event()
+
+    def exporter(snapshot: MetricsSnapshot) -> None:
+        exported.append(snapshot)
+        if len(exported) == 1:
+            raise ConnectionError("Metrics pipeline unreachable")
+        exported_event.set()
+
+    metrics = ClientMetrics(exporter=exporter, export_interval_s=0.01)
+    # the export thread keeps running after the exporter has raised
+    assert exported_event.wait(timeout=1)
+    metrics.close()
+    assert "Error in metrics exporter" in caplog.messages
+
+
+def test_stats_without_metrics() -> None:
+    client = ADSClient(local_ams_net_id="192.168.88.100.1.1")
+    with pytest.raises(AssertionError, match="Metrics are not enabled"):
+        client.stats()
@@ -0,0 +1,95 @@
+import queue
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from ..ads_client import ADSClient
+from ..ads_simulator import ADSSimulator
+from ..ads_symbol import ADSSymbol
+from ..ams.ads_device_notification import AdsNotificationSample
+from ..lazy_value import DecodeOnGet
+from ..notification_buffer import BoundedBuffer, DeviceNotification, LatestValueBuffer, OverflowPolicy
+from ..types import INT
+
+SYMBOL = ADSSymbol(name="GVL.intVar", plc_t=INT)
+
+
+def _notification(value: Any) -> DeviceNotification:
+    return SYMBOL, AdsNotificationSample(handle=1, timestamp=0, data=b""), value
+
+
+def test_latest_value_buffer() -> None:
+    buffer = LatestValueBuffer()
+    with pytest.raises(queue.Empty):
+        buffer.get(timeout=0.01)
+
+    for value in range(10):
+        buffer.put(_notification(value))
+
+    assert buffer.qsize() == 1
+    assert buffer.get()[2] == 9
+    assert buffer.empty()
+    assert buffer.dropped == 9
+    with pytest.raises(queue.Empty):
+        buffer.get_nowait()
+
+
+@pytest.mark.parametrize(
+    "overflow, expected",
+    [(OverflowPolicy.DROP_OLDEST, [7, 8, 9]), (OverflowPolicy.DROP_NEWEST, [0, 1, 2])],
+)
+def test_bounded_buffer_drops(overflow: OverflowPolicy, expected: Any) -> None:
+    buffer = BoundedBuffer(maxsize=3, overflow=overflow)
+    for value in range(10):
+        buffer.put(_notification(value))
+
+    assert buffer.qsize() == 3
+    assert [buffer.get_nowait()[2] for _ in range(3)] == expected
+    assert buffer.dropped == 7
+
+
+def test_bounded_buffer_blocks() -> None:
+    buffer = BoundedBuffer(maxsize=1, overflow=OverflowPolicy.BLOCK)
+    buffer.put(_notification(0))
+    producer = threading.Thread(target=buffer.put, args=(_notification(1),))
+    producer.start()
+    time.sleep(0.05)
+    assert producer.is_alive()
+
+    assert buffer.get(timeout=1)[2] == 0
+    producer.join(timeout=1)
+    assert buffer.get(timeout=1)[2] == 1
+    assert buffer.dropped == 0
+
+
+def test_buffer_decodes_on_get() -> None:
+    buffer = LatestValueBuffer()
+    values = [DecodeOnGet(plc_t=INT, data=value.to_bytes(2, "little")) for value in range(3)]
+    for value in values:
+        buffer.put(_notification(value))
+
+    assert buffer.get_nowait()[2] == 2
+    # the replaced notifications are never decoded
+    assert [value.decoded for value in values] == [False, False, True]
+
+
+def test_device_notification_buffer() -> None:
+    with ADSSimulator([SYMBOL]) as simulator:
+        client = ADSClient(local_ams_net_id="192.168.88.100.1.1")
+        client.open(target_ip="127.0.0.1", target_ams_net_id="192.168.88.20.1.1", target_tcp_port=simulator.port)
+
+        buffer = LatestValueBuffer()
+        client.add_device_notification(SYMBOL, buffer=buffer)
+        assert buffer.get(timeout=1)[2] == 0
+        for value in range(1, 100):
+            simulator.set_value(SYMBOL.name, value)
+        deadline = time.monotonic() + 1
+        while buffer.dropped + 1 < 99 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        client.close()
+
+    assert buffer.get_nowait()[2] == 99
+    assert buffer.dropped == 98
+    assert client.device_notification_queue.empty()
@@ -0,0 +1,78 @@
+import logging
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from ..ads_client import ADSClient
+from ..ads_simulator import ADSSimulator
+from ..ads_symbol import ADSSymbol
+from ..ams.ads_device_notification import AdsNotificationSample
+from ..notification_dispatcher import InlineDispatcher, ThreadDispatcher, ThreadPoolDispatcher
+from ..types import INT, PLCData
+
+
+def test_thread_pool_dispatcher_keeps_order_per_key() -> None:
+    dispatcher = ThreadPoolDispatcher(max_workers=4)
+    delivered: Dict[int, List[int]] = {key: [] for key in range(8)}
+
+    def deliver(key: int, value: int) -> None:
+        if value % 10 == 0:
+            time.sleep(0.001)
+        delivered[key].append(value)
+
+    for value in range(100):
+        for key in delivered:
+            dispatcher.dispatch(key, lambda key=key, value=value: deliver(key, value))  # type: ignore[misc]
+    dispatcher.close()
+
+    for values in delivered.values():
+        assert values == list(range(100))
+
+
+def test_thread_dispatcher_runs_on_other_thread() -> None:
+    dispatcher = ThreadDispatcher()
+    threads: "queue.Queue[threading.Thread]" = queue.Queue()
+
+    dispatcher.dispatch("key", lambda: threads.put(threading.current_thread()))
+
+    assert threads.get(timeout=1) is not threading.current_thread()
+    dispatcher.close()
+
+
+@pytest.mark.parametrize("dispatcher_class", [InlineDispatcher, ThreadDispatcher])
+def test_dispatcher_logs_exceptions(dispatcher_class: Any, caplog: pytest.LogCaptureFixture) -> None:
+    dispatcher = dispatcher_class(logger=logging.getLogger("dispatcher"))
+    delivered = threading.Event()
+
+    def fail() -> None:
+        raise ValueError("callback failed")
+
+    dispatcher.dispatch("key", fail)
+    dispatcher.dispatch("key", delivered.set)
+
+    assert delivered.wait(timeout=1)
+    dispatcher.close()
+    assert "Error in device notification callback" in caplog.text
+
+
+@pytest.mark.parametrize("dispatcher_class", [InlineDispatcher, ThreadDispatcher, ThreadPoolDispatcher])
+def test_device_notification_callback(dispatcher_class: Any) -> None:
+    symbol = ADSSymbol(name="GVL.intVar", plc_t=INT)
+    received: "queue.Queue[Tuple[ADSSymbol[PLCData], AdsNotificationSample, Any]]" = queue.Queue()
+
+    with ADSSimulator([symbol]) as simulator:
+        client = ADSClient(local_ams_net_id="192.168.88.100.1.1", notification_dispatcher=dispatcher_class())
+        client.open(target_ip="127.0.0.1", target_ams_net_id="192.168.88.20.1.1", target_tcp_port=simulator.port)
+
+        client.add_device_notification(symbol, callback=lambda *args: received.put(args))
+        assert received.get(timeout=1)[2] == 0
+        for value in range(1, 20):
+            simulator.set_value(symbol.name, value)
+        values = [received.get(timeout=1)[2] for _ in range(1, 20)]
+        client.close()
+
+    assert values == list(range(1, 20))
+    assert client.device_notification_queue.empty()
@@ -0,0 +1,121 @@
+import os
+import struct
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from ..ads_client import ADSClient
+from ..ads_simulator import ADSSimulator
+from ..ads_symbol import ADSSymbol
+from ..ams.ads_device_notification import EPOCH_AS_FILETIME, AdsNotificationSample, datetime_to_filetime
+from ..notification_recorder import NotificationRecorder, NotificationRecording, _FileTimes
+from ..types import INT, REAL, STRING, STRUCT
+
+INT_SYMBOL = ADSSymbol(name="GVL.intVar", plc_t=INT)
+STRUCT_SYMBOL = ADSSymbol(name="GVL.structVar", plc_t=STRUCT([("a", INT), ("b", REAL), ("c", STRING(5))]))
+START = datetime(2024, 3, 21, 1, 59, 50, tzinfo=timezone.utc)
+
+
+def _filetime(seconds: float) -> int:
+    return datetime_to_filetime(START + timedelta(seconds=seconds))
+
+
+def test_notification_recorder(tmp_path: Path) -> None:
+    directory = tmp_path / "recording"
+    with NotificationRecorder(directory, capacity=16) as recorder:
+        for i in range(1000):
+            recorder.record(
+                INT_SYMBOL, AdsNotificationSample(handle=1, timestamp=_filetime(i), data=i.to_bytes(2, "little"))
+            )
+            if i % 10 == 0:
+                data = i.to_bytes(2, "little") + bytes(4) + b"ab\x00\x00\x00\x00"
+                recorder(STRUCT_SYMBOL, AdsNotificationSample(handle=2, timestamp=_filetime(i), data=data), None)
+
+        # readable while it is recorded
+        with NotificationRecording(directory) as recording:
+            assert len(recording.samples(INT_SYMBOL)) == 1000
+
+    with NotificationRecording(directory) as recording:
+        assert recording.symbol_names == ["GVL.intVar", "GVL.structVar"]
+        assert recording.handle("GVL.structVar") == 2
+
+        samples = recording.samples(INT_SYMBOL)
+        assert len(samples) == 1000
+        assert samples[0] == (_filetime(0), 0)
+        assert samples[-1] == (_filetime(999), 999)
+        assert list(samples[10:13].values()) == [10, 11, 12]
+
+        samples = recording.samples(
+            INT_SYMBOL, start=START + timedelta(seconds=100), end=START + timedelta(seconds=200)
+        )
+        assert len(samples) == 100
+        assert samples[0][1] == 100
+        assert samples.timestamps_ns()[0] == (_filetime(100) - EPOCH_AS_FILETIME) * 100
+
+        samples = recording.samples(STRUCT_SYMBOL, start=START + timedelta(seconds=995))
+        assert len(samples) == 0
+        samples = recording.samples(STRUCT_SYMBOL)
+        assert len(samples) == 100
+        assert samples[5][1] == {"a": 50, "b": 0.0, "c": "ab"}
+        assert samples.raw(5)[:2] == bytes.fromhex("32 00")
+
+    assert os.path.getsize(directory / "000000.data") == 2000
+
+
+def test_notification_recorder_unordered(tmp_path: Path) -> None:
+    directory = tmp_path / "recording"
+    with NotificationRecorder(directory) as recorder:
+        # two subscriptions of the symbol, the samples of the second one lag behind
+        for i in range(10):
+            recorder.record(INT_SYMBOL, AdsNotificationSample(handle=1, timestamp=_filetime(i), data=bytes([i, 0])))
+            recorder.record(
+                INT_SYMBOL, AdsNotificationSample(handle=2, timestamp=_filetime(i - 5), data=bytes([100 + i, 0]))
+            )
+
+    with NotificationRecording(directory) as recording:
+        assert len(recording.samples(INT_SYMBOL)) == 20
+        samples = recording.samples(INT_SYMBOL, start=START + timedelta(seconds=3), end=START + timedelta(seconds=5))
+        assert list(samples.values()) == [3, 4, 108, 109]
+        assert list(samples.filetimes()) == [_filetime(3), _filetime(4), _filetime(3), _filetime(4)]
+        assert list(recording.samples(INT_SYMBOL, end=START - timedelta(seconds=4)).values()) == [100]
+
+
+def test_file_times() -> None:
+    # the time column is little-endian on every host
+    filetimes = _FileTimes(memoryview(struct.pack("< 3Q", 1, 2 << 40, 3)))
+
+    assert len(filetimes) == 3
+    assert list(filetimes) == [1, 2 << 40, 3]
+    assert filetimes[-2] == 2 << 40
+    assert list(filetimes[1:]) == [2 << 40, 3]
+    with pytest.raises(IndexError):
+        filetimes[3]
+
+
+def test_notification_recorder_datetime64(tmp_path: Path) -> None:
+    np = pytest.importorskip("numpy")
+    with NotificationRecorder(tmp_path / "recording") as recorder:
+        for i in range(3):
+            recorder.record(INT_SYMBOL, AdsNotificationSample(handle=1, timestamp=_filetime(i), data=bytes(2)))
+
+    with NotificationRecording(tmp_path / "recording") as recording:
+        timestamps = recording.samples(INT_SYMBOL).timestamps_datetime64()
+        assert timestamps[2] == np.datetime64("2024-03-21T01:59:52", "ns")
+
+
+def test_notification_recorder_callback(tmp_path: Path) -> None:
+    with ADSSimulator([INT_SYMBOL]) as simulator:
+        client = ADSClient(local_ams_net_id="192.168.88.100.1.1", lazy_decode=True)
+        client.open(target_ip="127.0.0.1", target_ams_net_id="192.168.88.20.1.1", target_tcp_port=simulator.port)
+
+        with NotificationRecorder(tmp_path / "recording") as recorder:
+            client.add_device_notification(INT_SYMBOL, callback=recorder)
+            for value in range(1, 10):
+                simulator.set_value(INT_SYMBOL.name, value)
+            # the notifications are sent before the response
+            client.read_symbol(INT_SYMBOL)
+            client.close()
+
+    with NotificationRecording(tmp_path / "recording") as recording:
+        assert list(recording.samples(INT_SYMBOL).values()) == list(range(10))
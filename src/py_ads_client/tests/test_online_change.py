@@ -0,0 +1,147 @@
+import asyncio
+import time
+from typing import Any, Callable, Hashable, List
+
+from ..ads_client import ADSClient
+from ..ads_simulator import ADSSimulator
+from ..ads_symbol import ADSSymbol
+from ..async_ads_client import AsyncADSClient
+from ..constants.ads_state import ADSState
+from ..constants.return_code import ADSErrorCode
+from ..notification_dispatcher import NotificationDispatcher
+from ..types import INT, REAL
+
+
+def _wait_for(condition: Callable[[], bool], timeout_s: float = 2) -> None:
+    deadline = time.monotonic() + timeout_s
+    while not condition():
+        assert time.monotonic() < deadline, "Timeout"
+        time.sleep(0.01)
+
+
+def test_retry_after_online_change() -> None:
+    int_symbol = ADSSymbol(name="GVL.intVar", plc_t=INT)
+    real_symbol = ADSSymbol(name="GVL.realVar", plc_t=REAL)
+    unknown_symbol = ADSSymbol(name="GVL.unknown", plc_t=INT)
+
+    with ADSSimulator([int_symbol, real_symbol]) as simulator:
+        client = ADSClient(local_ams_net_id="192.168.88.100.1.1")
+        client.open(target_ip="127.0.0.1", target_ams_net_id="192.168.88.20.1.1", target_tcp_port=simulator.port)
+        client.write_symbol(int_symbol, 7)
+        assert client.read_symbols([int_symbol, real_symbol]) == [7, 0.0]
+
+        # the cached handles are invalid, they are renewed and the requests are sent again
+        simulator.online_change()
+        assert client.read_symbol(int_symbol) == 7
+        simulator.online_change()
+        client.write_symbol(int_symbol, 8)
+        assert simulator.get_value(int_symbol.name) == 8
+
+        simulator.online_change()
+        assert client.write_symbols({int_symbol: 9, real_symbol: 1.5, unknown_symbol: 1}) == {
+            int_symbol: ADSErrorCode.ERR_NOERROR,
+            real_symbol: ADSErrorCode.ERR_NOERROR,
+            unknown_symbol: ADSErrorCode.ADSERR_DEVICE_SYMBOLNOTFOUND,
+        }
+        simulator.online_change()
+        assert client.read_symbols([int_symbol, unknown_symbol, real_symbol]) == [
+            9,
+            ADSErrorCode.ADSERR_DEVICE_SYMBOLNOTFOUND,
+            1.5,
+        ]
+        client.close()
+
+
+def test_async_retry_after_online_change() -> None:
+    symbol = ADSSymbol(name="GVL.intVar", plc_t=INT)
+    unknown_symbol = ADSSymbol(name="GVL.unknown", plc_t=INT)
+
+    async def main(simulator: ADSSimulator) -> None:
+        client = AsyncADSClient(local_ams_net_id="192.168.88.100.1.1")
+        await client.open(target_ip="127.0.0.1", target_ams_net_id="192.168.88.20.1.1", target_tcp_port=simulator.port)
+        await client.write_symbol(symbol, 7)
+        simulator.online_change()
+        assert await client.read_symbol(symbol) == 7
+        simulator.online_change()
+        await client.write_symbol(symbol, 8)
+        assert simulator.get_value(symbol.name) == 8
+
+        simulator.online_change()
+        assert await client.write_symbols({symbol: 9, unknown_symbol: 1}) == {
+            symbol: ADSErrorCode.ERR_NOERROR,
+            unknown_symbol: ADSErrorCode.ADSERR_DEVICE_SYMBOLNOTFOUND,
+        }
+        simulator.online_change()
+        assert await client.read_symbols([symbol, unknown_symbol]) == [9, ADSErrorCode.ADSERR_DEVICE_SYMBOLNOTFOUND]
+        await client.close()
+        assert simulator.handle_count == 0
+
+    with ADSSimulator([symbol]) as simulator:
+        asyncio.run(main(simulator))
+
+
+def test_track_online_changes() -> None:
+    symbol = ADSSymbol(name="GVL.intVar", plc_t=INT)
+
+    with ADSSimulator([symbol]) as simulator:
+        client = ADSClient(local_ams_net_id="192.168.88.100.1.1", track_online_changes=True)
+        client.open(target_ip="127.0.0.1", target_ams_net_id="192.168.88.20.1.1", target_tcp_port=simulator.port)
+        # the notifications of the symbol version and the ADS state
+        assert simulator.notification_count == 2
+
+        handle = client.add_device_notification(symbol)
+        assert client.device_notification_queue.get(timeout=1)[2] == 0
+        assert simulator.notification_count == 3
+
+        # the notification by handle is dropped by the online change and added again by the client
+        simulator.online_change()
+        _wait_for(lambda: simulator.notification_count == 3)
+        assert client.device_notification_queue.get(timeout=1)[2] == 0
+        simulator.set_value(symbol.name, 5)
+        assert client.device_notification_queue.get(timeout=1)[2] == 5
+
+        # a restart of the PLC renews the handles, too
+        client.write_control(ads_state=ADSState.ADSSTATE_STOP, device_state=0)
+        simulator.online_change()
+        client.write_control(ads_state=ADSState.ADSSTATE_RUN, device_state=0)
+        _wait_for(lambda: simulator.notification_count == 3)
+        assert client.device_notification_queue.get(timeout=1)[2] == 5
+        assert client.read_symbol(symbol) == 5
+
+        # the handle returned before the online changes still removes the subscriber
+        client.del_device_notification_by_handle(handle)
+        assert simulator.notification_count == 2
+        client.close()
+        assert simulator.notification_count == 0
+
+
+class _KeyRecordingDispatcher(NotificationDispatcher):
+    def __init__(self) -> None:
+        self.keys: List[Hashable] = []
+
+    def dispatch(self, key: Hashable, delivery: Callable[[], None]) -> None:
+        self.keys.append(key)
+        delivery()
+
+
+def test_dispatch_key_after_online_change() -> None:
+    symbol = ADSSymbol(name="GVL.intVar", plc_t=INT)
+    dispatcher = _KeyRecordingDispatcher()
+    values: List[Any] = []
+
+    with ADSSimulator([symbol]) as simulator:
+        client = ADSClient(
+            local_ams_net_id="192.168.88.100.1.1", track_online_changes=True, notification_dispatcher=dispatcher
+        )
+        client.open(target_ip="127.0.0.1", target_ams_net_id="192.168.88.20.1.1", target_tcp_port=simulator.port)
+        client.add_device_notification(symbol, callback=lambda symbol, sample, value: values.append(value))
+        _wait_for(lambda: values == [0])
+
+        # the samples of the renewed notification are dispatched with the same key, i.e. to the same worker
+        simulator.online_change()
+        _wait_for(lambda: values == [0, 0])
+        simulator.set_value(symbol.name, 5)
+        _wait_for(lambda: values == [0, 0, 5])
+        client.close()
+
+    assert len(set(dispatcher.keys)) == 1
@@ -0,0 +1,142 @@
+from typing import List
+
+import pytest
+
+from ..ads_simulator import ADSSimulator
+from ..ads_symbol import ADSSymbol
+from ..ams.ads_data_type_upload import ADSDataTypeEntry
+from ..constants.ads_data_type import ADSDataType
+from ..plc_type_resolver import PLCTypeResolver
+from ..types import ARRAY, BOOL, INT, LREAL, REAL, STRING, STRUCT, UDINT, ULINT, WSTRING
+from .test_ads_simulator import open_client
+
+BIGTYPE = ADSDataType.ADST_BIGTYPE.value
+
+MOTOR_ENTRY = ADSDataTypeEntry(
+    name="ST_Motor",
+    type_name="",
+    size=24,
+    data_type=BIGTYPE,
+    sub_items=[
+        ADSDataTypeEntry(name="bEnable", type_name="BOOL", size=1, offset=0),
+        ADSDataTypeEntry(name="fSpeed", type_name="LREAL", size=8, offset=8),
+        ADSDataTypeEntry(name="eState", type_name="E_State", size=2, offset=16),
+        ADSDataTypeEntry(name="pNext", type_name="POINTER TO ST_Motor", size=4, offset=20),
+    ],
+)
+STATE_ENTRY = ADSDataTypeEntry(name="E_State", type_name="INT", size=2, data_type=ADSDataType.ADST_INT16.value)
+MATRIX_ENTRY = ADSDataTypeEntry(
+    name="T_Matrix", type_name="REAL", size=24, data_type=BIGTYPE, array_info=[(1, 2), (0, 3)]
+)
+LABEL_ENTRY = ADSDataTypeEntry(
+    name="ST_Label",
+    type_name="",
+    size=286,
+    data_type=BIGTYPE,
+    sub_items=[
+        ADSDataTypeEntry(name="sText", type_name="STRING", size=81, offset=0),
+        ADSDataTypeEntry(name="wsText", type_name="WSTRING", size=162, offset=82),
+        ADSDataTypeEntry(name="wsName", type_name="T_Name", size=42, offset=244),
+    ],
+)
+# a string type which is only described by its ADS data type and size
+NAME_ENTRY = ADSDataTypeEntry(name="T_Name", type_name="", size=42, data_type=ADSDataType.ADST_WSTRING.value)
+
+
+def test_resolve_struct_with_padding() -> None:
+    fetched: List[str] = []
+
+    def fetch(type_name: str) -> ADSDataTypeEntry:
+        fetched.append(type_name)
+        return {"st_motor": MOTOR_ENTRY, "e_state": STATE_ENTRY}[type_name.lower()]
+
+    resolver = PLCTypeResolver(fetch=fetch)
+
+    plc_t = resolver.resolve("ST_Motor")
+
+    assert isinstance(plc_t, STRUCT)
+    assert plc_t.bytes_length == 24
+    assert plc_t.offsets == [0, 8, 16, 20]
+    assert [(name, field) for name, field in plc_t.fields] == [
+        ("bEnable", BOOL),
+        ("fSpeed", LREAL),
+        ("eState", INT),
+        ("pNext", UDINT),
+    ]
+    # every type is built once
+    assert resolver.resolve("st_motor") is plc_t
+    assert fetched == ["ST_Motor", "E_State"]
+    assert {entry.name for entry in resolver.entries} == {"ST_Motor", "E_State"}
+
+
+def test_resolve_struct_with_strings() -> None:
+    fetched: List[str] = []
+
+    def fetch(type_name: str) -> ADSDataTypeEntry:
+        fetched.append(type_name)
+        return {"st_label": LABEL_ENTRY, "t_name": NAME_ENTRY}[type_name.lower()]
+
+    plc_t = PLCTypeResolver(fetch=fetch).resolve("ST_Label")
+
+    assert isinstance(plc_t, STRUCT)
+    text_t, wtext_t, name_t = (field for _, field in plc_t.fields)
+    assert isinstance(text_t, STRING) and text_t.length == 80
+    assert isinstance(wtext_t, WSTRING) and wtext_t.length == 80
+    assert isinstance(name_t, WSTRING) and name_t.length == 20
+    # the default-length strings are built-in types
+    assert fetched == ["ST_Label", "T_Name"]
+
+
+def test_resolve_arrays() -> None:
+    resolver = PLCTypeResolver()
+    resolver.add_entries([MATRIX_ENTRY])
+
+    matrix = resolver.resolve("T_Matrix")
+    assert isinstance(matrix, ARRAY) and isinstance(matrix.item_type, ARRAY)
+    assert (matrix.lower_bound, matrix.length) == (1, 2)
+    assert (matrix.item_type.lower_bound, matrix.item_type.length, matrix.item_type.item_type) == (0, 3, REAL)
+
+    # arrays with literal bounds and built-in types are built without an entry
+    array = resolver.resolve("ARRAY [-1..1] OF STRING(10)")
+    assert isinstance(array, ARRAY) and isinstance(array.item_type, STRING)
+    assert (array.lower_bound, array.length, array.bytes_length) == (-1, 3, 33)
+    assert resolver.resolve("ulint") is ULINT
+    with pytest.raises(KeyError):
+        resolver.resolve("ST_Unknown")
+
+
+def test_resolve_size_mismatch() -> None:
+    resolver = PLCTypeResolver()
+    resolver.add_entries([ADSDataTypeEntry(name="T_Wrong", type_name="INT", size=4)])
+
+    with pytest.raises(TypeError):
+        resolver.resolve("T_Wrong")
+
+
+def test_get_plc_type() -> None:
+    item_t = STRUCT([("bFlag", BOOL), ("nId", INT)], offsets=[0, 2], size=4)
+    data_t = STRUCT(
+        [("nCount", UDINT), ("aItems", ARRAY(item_t, 2, lower_bound=1)), ("stInner", STRUCT([("fValue", REAL)]))]
+    )
+    value = {"nCount": 3, "aItems": [{"bFlag": True, "nId": 1}, {"bFlag": False, "nId": 2}], "stInner": {"fValue": 0.5}}
+    with ADSSimulator() as simulator:
+        simulator.add_data_type("ST_Item", item_t)
+        simulator.add_symbol(ADSSymbol(name="MAIN.stData", plc_t=data_t), value, type_name="ST_Data")
+        client = open_client(simulator)
+
+        catalog = client.upload_symbols()
+        plc_t = client.get_plc_type(catalog["MAIN.stData"].type_name)
+        read_value = client.read_symbol(ADSSymbol(name="MAIN.stData", plc_t=plc_t))
+        assert client.get_plc_type("st_data") is plc_t
+
+        entries = client.upload_data_types()
+        client.close()
+
+    assert isinstance(plc_t, STRUCT)
+    assert plc_t.bytes_length == data_t.bytes_length
+    assert plc_t.offsets == [0, 4, 12]
+    items_t = plc_t.fields[1][1]
+    assert isinstance(items_t, ARRAY) and items_t.lower_bound == 1
+    assert isinstance(items_t.item_type, STRUCT) and items_t.item_type.offsets == [0, 2]
+    assert read_value == value
+    assert {entry.name for entry in entries} == {"ST_Item", "ST_Data"}
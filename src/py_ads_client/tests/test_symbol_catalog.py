@@ -0,0 +1,130 @@
+import pytest
+
+from ..ads_client import ADSClient
+from ..ads_simulator import DATA_INDEX_GROUP, ADSSimulator
+from ..ads_symbol import ADSSymbol
+from ..ams.ads_symbol_upload import ADSSymbolEntry
+from ..constants.ads_data_type import ADSDataType
+from ..constants.command_id import ADSCommand
+from ..constants.return_code import ADSErrorCode
+from ..constants.symbol_flag import SymbolFlag
+from ..metrics import ClientMetrics
+from ..symbol_catalog import SymbolCatalog
+from ..types import ARRAY, INT, REAL, STRING, STRUCT
+from .test_ads_simulator import open_client
+
+
+def make_entry(name: str, index_offset: int, type_name: str = "INT", comment: str = "") -> ADSSymbolEntry:
+    return ADSSymbolEntry(
+        index_group=0x4040,
+        index_offset=index_offset,
+        size=2,
+        data_type=ADSDataType.ADST_INT16.value,
+        flags=SymbolFlag.ADSSYMBOLFLAG_READONLY.value if comment else 0,
+        name=name,
+        type_name=type_name,
+        comment=comment,
+    )
+
+
+def test_symbol_catalog_lookup() -> None:
+    entries = [
+        make_entry("MAIN.fbMotor1.nSpeed", 0),
+        make_entry("MAIN.fbMotor1.bEnable", 2, type_name="BOOL"),
+        make_entry("MAIN.fbMotor2.nSpeed", 4, comment="rpm"),
+        make_entry("GVL.nCounter", 6),
+        make_entry("MAIN.nCount", 8),
+    ]
+    catalog = SymbolCatalog.from_bytes(b"".join(entry.to_bytes() for entry in entries))
+
+    assert len(catalog) == 5
+    assert catalog.names == [entry.name for entry in entries]
+    assert catalog.type_names == ["INT", "BOOL"]
+    assert "main.FBMOTOR2.nspeed" in catalog
+    assert "MAIN.fbMotor3.nSpeed" not in catalog
+    info = catalog["main.fbmotor2.nspeed"]
+    assert info.name == "MAIN.fbMotor2.nSpeed"
+    assert (info.index_group, info.index_offset, info.size) == (0x4040, 4, 2)
+    assert info.comment == "rpm"
+    assert info.read_only
+    assert catalog.get("MAIN.unknown") is None
+    assert [info.name for info in catalog] == catalog.names
+
+    assert [info.name for info in catalog.with_prefix("main.fbMotor1.")] == [
+        "MAIN.fbMotor1.bEnable",
+        "MAIN.fbMotor1.nSpeed",
+    ]
+    assert [info.name for info in catalog.glob("MAIN.fb*.nSpeed")] == ["MAIN.fbMotor1.nSpeed", "MAIN.fbMotor2.nSpeed"]
+    assert [info.name for info in catalog.glob("*.nCount*")] == ["GVL.nCounter", "MAIN.nCount"]
+    assert [info.name for info in catalog.glob("MAIN.nCount")] == ["MAIN.nCount"]
+    assert catalog.glob("MAIN.fbMotor[3-9].*") == []
+
+
+def test_symbol_catalog_many_symbols() -> None:
+    count = 100_000
+    data = b"".join(make_entry(f"MAIN.aStation{i // 100}.nValue{i % 100}", 2 * i).to_bytes() for i in range(count))
+
+    catalog = SymbolCatalog.from_bytes(data)
+
+    assert len(catalog) == count
+    assert catalog["MAIN.aStation999.nValue99"].index_offset == 2 * (count - 1)
+    assert len(catalog.with_prefix("MAIN.aStation42.")) == 100
+    assert len(catalog.glob("MAIN.aStation42?.nValue1")) == 10
+    assert catalog.type_names == ["INT"]
+
+
+def test_upload_symbols() -> None:
+    struct_symbol = ADSSymbol(name="MAIN.stData", plc_t=STRUCT([("name", STRING(10)), ("values", ARRAY(INT, 3))]))
+    with ADSSimulator([ADSSymbol(name="GVL.nValue", plc_t=INT)]) as simulator:
+        simulator.add_symbol(ADSSymbol(name="GVL.aValues", plc_t=ARRAY(REAL, 4)))
+        simulator.add_symbol(struct_symbol, type_name="ST_Data")
+        client = open_client(simulator)
+
+        info = client.read_symbol_upload_info()
+        catalog = client.upload_symbols()
+        client.close()
+
+    assert info.symbol_count == 3
+    assert catalog.names == ["GVL.nValue", "GVL.aValues", "MAIN.stData"]
+    assert catalog["gvl.nvalue"].type_name == "INT"
+    assert catalog["gvl.nvalue"].data_type == ADSDataType.ADST_INT16.value
+    assert catalog["GVL.aValues"].type_name == "ARRAY [0..3] OF REAL"
+    assert catalog["GVL.aValues"].data_type == ADSDataType.ADST_BIGTYPE.value
+    struct_info = catalog["MAIN.stData"]
+    assert struct_info.type_name == "ST_Data"
+    assert struct_info.index_group == DATA_INDEX_GROUP
+    assert struct_info.index_offset == 2 + 16
+    assert struct_info.size == struct_symbol.plc_t.bytes_length
+
+
+def test_access_without_handles() -> None:
+    with ADSSimulator([ADSSymbol(name="GVL.nValue", plc_t=INT), ADSSymbol(name="GVL.fValue", plc_t=REAL)]) as simulator:
+        client = ADSClient(local_ams_net_id="192.168.88.100.1.1", timeout_s=1, metrics=ClientMetrics())
+        client.open(target_ip="127.0.0.1", target_ams_net_id="192.168.88.20.1.1", target_tcp_port=simulator.port)
+        catalog = client.upload_symbols()
+        int_symbol = catalog.symbol("gvl.nvalue", INT)
+        real_symbol = catalog.symbol("GVL.fValue", client.get_plc_type(catalog["GVL.fValue"].type_name))
+        assert int_symbol.name == "GVL.nValue"
+        assert (int_symbol.index_group, int_symbol.index_offset) == (DATA_INDEX_GROUP, 0)
+        with pytest.raises(TypeError):
+            catalog.symbol("GVL.nValue", REAL)
+
+        client.write_symbol(int_symbol, 7)
+        assert client.read_symbol(int_symbol) == 7
+        assert client.write_symbols({int_symbol: 8, real_symbol: 1.5}) == {
+            int_symbol: ADSErrorCode.ERR_NOERROR,
+            real_symbol: ADSErrorCode.ERR_NOERROR,
+        }
+        assert client.read_symbols([int_symbol, real_symbol]) == [8, 1.5]
+        assert simulator.get_value("GVL.fValue") == 1.5
+        # symbols declared with their address and symbols by handle can be mixed
+        by_handle = ADSSymbol(name="GVL.nValue", plc_t=INT)
+        declared = ADSSymbol(name="GVL.fValue", plc_t=REAL, index_group=DATA_INDEX_GROUP, index_offset=2)
+        assert client.read_symbols([declared, by_handle]) == [1.5, 8]
+
+        # the upload info, the upload, two sum writes and reads and the handle of `by_handle`
+        stats = client.stats()
+        assert stats.commands[ADSCommand.ADSSRVID_READ].requests == 3
+        assert stats.commands[ADSCommand.ADSSRVID_WRITE].requests == 1
+        assert stats.commands[ADSCommand.ADSSRVID_READWRITE].requests == 4
+        client.close()
@@ -0,0 +1,57 @@
+import io
+import logging
+
+import pytest
+
+from ..wire_trace import WireDirection, WireTrace, read_wire_trace
+
+
+def test_wire_trace_log(caplog: pytest.LogCaptureFixture) -> None:
+    logger = logging.getLogger("test_wire_trace_log")
+    trace = WireTrace(logger, max_bytes=4)
+
+    logger.setLevel(logging.WARNING)
+    assert not trace.enabled
+    with caplog.at_level(logging.WARNING, logger=logger.name):
+        trace.trace(WireDirection.SENT, b"\x01\x02", b"\x03")
+    assert caplog.records == []
+
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        assert trace.enabled
+        trace.trace(WireDirection.SENT, b"\x01\x02", b"\x03")
+        trace.trace(WireDirection.RECEIVED, b"\x01\x02", bytes(range(10)))
+    assert [record.getMessage() for record in caplog.records] == [
+        "Sending AMS packet: 01 02, 03",
+        "Received AMS packet: 01 02, 00 01 02 03 ... (10 bytes)",
+    ]
+
+
+def test_wire_trace_log_copies_views(caplog: pytest.LogCaptureFixture) -> None:
+    logger = logging.getLogger("test_wire_trace_log_copies_views")
+    trace = WireTrace(logger)
+    receive_buffer = bytearray(b"\x01\x02")
+
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        trace.trace(WireDirection.RECEIVED, memoryview(receive_buffer)[:1], b"")
+    # the next packet is received into the buffer before the record is formatted
+    receive_buffer[0] = 0xFF
+    assert [record.getMessage() for record in caplog.records] == ["Received AMS packet: 01, "]
+
+
+def test_wire_trace_file() -> None:
+    logger = logging.getLogger("test_wire_trace_file")
+    logger.setLevel(logging.WARNING)
+    trace_file = io.BytesIO()
+    trace = WireTrace(logger, trace_file=trace_file)
+    assert trace.enabled
+
+    trace.trace(WireDirection.SENT, b"\x01\x02", b"\x03")
+    trace.trace(WireDirection.RECEIVED, memoryview(b"\x04"), b"")
+
+    trace_file.seek(0)
+    records = list(read_wire_trace(trace_file))
+    assert [(record.direction, record.packet) for record in records] == [
+        (WireDirection.SENT, b"\x01\x02\x03"),
+        (WireDirection.RECEIVED, b"\x04"),
+    ]
+    assert records[0].timestamp_ns <= records[1].timestamp_ns
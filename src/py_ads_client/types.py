@@ -1,13 +1,16 @@
 import struct
 from abc import ABC, abstractmethod
 from datetime import date, datetime, time, timedelta, timezone
-from typing import List, Tuple
+from typing import Any, List, Optional, Tuple
 
 from .constants.encoding import TWINCAT_STRING_ENCODING, TWINCAT_WSTRING_ENCODING
 
 
 class PLCData(ABC):
 
+    _codec_plan: Any = None
+    """Compiled codec plan of the type, set by `get_codec_plan` on first use."""
+
     @property
     @abstractmethod
     def bytes_length(self) -> int: ...
@@ -23,6 +26,11 @@ class _PLCBoolType(PLCData):
     def bytes_length(self) -> int:
         return self.__bytes_length
 
+    @property
+    def struct_format(self) -> str:
+        """Format character of the type in `struct` format strings."""
+        return self.__format
+
 
 class _PLCIntType(PLCData):
     def __init__(self, *, format: str) -> None:
@@ -33,6 +41,11 @@ class _PLCIntType(PLCData):
     def bytes_length(self) -> int:
         return self.__bytes_length
 
+    @property
+    def struct_format(self) -> str:
+        """Format character of the type in `struct` format strings."""
+        return self.__format
+
     @property
     def is_signed(self) -> bool:
         return self.__format.lower() == self.__format
@@ -170,6 +183,11 @@ class _PLCFloatType(PLCData):
     def bytes_length(self) -> int:
         return self.__bytes_length
 
+    @property
+    def struct_format(self) -> str:
+        """Format character of the type in `struct` format strings."""
+        return self.__format
+
     def decode(self, raw_data: bytes) -> float:
         return struct.unpack(self.__format, raw_data)[0]  # type: ignore
 
@@ -195,6 +213,11 @@ class STRING(PLCData):
     def bytes_length(self) -> int:
         return self.__length + 1
 
+    @property
+    def length(self) -> int:
+        """Maximum number of characters."""
+        return self.__length
+
     def decode(self, raw_data: bytes) -> str:
         null_index = raw_data.find(0)
         if null_index != -1:
@@ -210,19 +233,26 @@ class WSTRING(PLCData):
 
     With WSTRING, a length of 10 means that the length of the WSTRING can occupy a maximum of 10 WORDs.
 
+    If no size is specified, TwinCAT assumes 80 characters by default.
+
     The data type requires 1 WORD per character and 1 WORD extra memory space.
     The data type WSTRING is terminated with 0.
 
     https://infosys.beckhoff.com/content/1033/tc3_plc_intro/2529437323.html
     """
 
-    def __init__(self, length: int) -> None:
+    def __init__(self, length: int = 80) -> None:
         self.__length = length
 
     @property
     def bytes_length(self) -> int:
         return (self.__length + 1) * 2
 
+    @property
+    def length(self) -> int:
+        """Maximum number of characters."""
+        return self.__length
+
     def decode(self, raw_data: bytes) -> str:
         null_index = -1
         for i in range(0, len(raw_data), 2):
@@ -238,9 +268,23 @@ class WSTRING(PLCData):
 
 
 class ARRAY(PLCData):
-    def __init__(self, item_type: PLCData, count: int) -> None:
+    """TWINCAT ARRAY data type.
+
+    Decoded to a `list` by default.
+
+    With `numpy=True` it is decoded to a `numpy.ndarray` over the received data without copying,
+    an `ARRAY` of `ARRAY` becomes an N-d array. The innermost item type must be a primitive, `STRING`
+    or a `STRUCT` of those, which becomes a structured dtype. NumPy must be installed.
+
+    `lower_bound` is the index of the first item in TwinCAT, e.g. 1 for `ARRAY [1..10] OF INT`,
+    the decoded list starts at 0 regardless.
+    """
+
+    def __init__(self, item_type: PLCData, count: int, *, numpy: bool = False, lower_bound: int = 0) -> None:
         self.__item_type = item_type
         self.__count = count
+        self.__numpy = numpy
+        self.__lower_bound = lower_bound
 
     @property
     def bytes_length(self) -> int:
@@ -254,14 +298,54 @@ class ARRAY(PLCData):
     def length(self) -> int:
         return self.__count
 
+    @property
+    def numpy(self) -> bool:
+        return self.__numpy
+
+    @property
+    def lower_bound(self) -> int:
+        return self.__lower_bound
+
 
 class STRUCT(PLCData):
-    def __init__(self, fields: List[Tuple[str, PLCData]]) -> None:
+    """TWINCAT STRUCT data type, decoded to a `dict`.
+
+    The fields are packed without padding, like `{attribute 'pack_mode' := '1'}`, unless `offsets` is given.
+    `offsets` holds the offset of every field in bytes and `size` the size of the struct including
+    the padding at the end, as they are reported by the data type upload.
+    """
+
+    def __init__(
+        self, fields: List[Tuple[str, PLCData]], *, offsets: Optional[List[int]] = None, size: Optional[int] = None
+    ) -> None:
         self.__fields = fields
+        self.__offsets = offsets
+        if offsets is not None:
+            assert len(offsets) == len(fields)
+            end = 0
+            for offset, (name, field) in zip(offsets, fields):
+                assert offset >= end, f"Field {name} overlaps the previous field"
+                end = offset + field.bytes_length
+        else:
+            end = sum(field.bytes_length for _, field in fields)
+        assert size is None or size >= end, "Size is smaller than the fields"
+        self.__bytes_length = end if size is None else size
 
     @property
     def bytes_length(self) -> int:
-        return sum(field.bytes_length for _, field in self.__fields)
+        return self.__bytes_length
+
+    @property
+    def offsets(self) -> List[int]:
+        """Offset of every field in bytes."""
+        if self.__offsets is not None:
+            return self.__offsets
+        offsets = []
+        offset = 0
+        for _, field in self.__fields:
+            offsets.append(offset)
+            offset += field.bytes_length
+        return offsets
 
     @property
     def fields(self) -> List[Tuple[str, PLCData]]:
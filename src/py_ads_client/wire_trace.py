@@ -0,0 +1,104 @@
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from logging import INFO, Logger
+from typing import BinaryIO, Iterator, Optional, Union
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+class WireDirection(Enum):
+    SENT = 0
+    RECEIVED = 1
+
+
+class _HexDump:
+    """Formats the hex dump of a buffer only when the log record is emitted."""
+
+    __slots__ = ("data", "max_bytes")
+
+    def __init__(self, data: Buffer, max_bytes: Optional[int]) -> None:
+        self.data = data
+        self.max_bytes = max_bytes
+
+    def __str__(self) -> str:
+        if self.max_bytes is None or len(self.data) <= self.max_bytes:
+            return self.data.hex(" ")
+        return f"{self.data[: self.max_bytes].hex(' ')} ... ({len(self.data)} bytes)"
+
+
+@dataclass()
+class WireTraceRecord:
+    timestamp_ns: int
+    """`time.time_ns()` when the packet was sent or received."""
+    direction: WireDirection
+    packet: bytes
+    """AMS header and ADS body."""
+
+
+_RECORD_HEADER = struct.Struct("< Q B I")
+
+
+class WireTrace:
+    """Trace of the AMS packets which are sent and received by a client.
+
+    Packets are formatted only if tracing is enabled, i.e. if the logger is enabled for `level`,
+    so a disabled trace costs one `isEnabledFor` check per packet.
+
+    Hex dumps are truncated to `max_bytes` bytes per header and body, `None` disables truncation.
+
+    If `trace_file` is given, every packet is appended to it as binary record instead of being logged,
+    use `read_wire_trace` to read the records back.
+    """
+
+    def __init__(
+        self,
+        logger: Logger,
+        *,
+        level: int = INFO,
+        max_bytes: Optional[int] = 64,
+        trace_file: Optional[BinaryIO] = None,
+    ) -> None:
+        self.__logger = logger
+        self.__level = level
+        self.__max_bytes = max_bytes
+        self.__trace_file = trace_file
+        self.__trace_file_lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.__trace_file is not None or self.__logger.isEnabledFor(self.__level)
+
+    def trace(self, direction: WireDirection, header: Buffer, body: Buffer) -> None:
+        if self.__trace_file is not None:
+            record_header = _RECORD_HEADER.pack(time.time_ns(), direction.value, len(header) + len(body))
+            with self.__trace_file_lock:
+                self.__trace_file.write(record_header)
+                self.__trace_file.write(header)
+                self.__trace_file.write(body)
+            return
+
+        if not self.__logger.isEnabledFor(self.__level):
+            return
+        # the buffers may be views of the reused receive buffer, and a handler may format the record later
+        self.__logger.log(
+            self.__level,
+            "%s AMS packet: %s, %s",
+            "Sending" if direction == WireDirection.SENT else "Received",
+            _HexDump(bytes(header), self.__max_bytes),
+            _HexDump(bytes(body), self.__max_bytes),
+        )
+
+
+def read_wire_trace(trace_file: BinaryIO) -> Iterator[WireTraceRecord]:
+    """Read the records written by `WireTrace`."""
+    while True:
+        record_header = trace_file.read(_RECORD_HEADER.size)
+        if len(record_header) < _RECORD_HEADER.size:
+            return
+        timestamp_ns, direction, length = _RECORD_HEADER.unpack(record_header)
+        yield WireTraceRecord(
+            timestamp_ns=timestamp_ns, direction=WireDirection(direction), packet=trace_file.read(length)
+        )